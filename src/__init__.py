@@ -7,25 +7,35 @@ Este paquete contiene todos los módulos principales de la aplicación:
 - visualization: Sistema de visualización 2D y 3D
 """
 
-# Facilitar imports desde el paquete src
-from .gui import VentanaPrincipal
-from .models import (
-    RobotMovilBase,
-    DiferencialCentrado,
-    DiferencialDescentrado,
-    CuatroRuedasCentrado,
-    CuatroRuedasDescentrado
-)
-from .visualization import Visualizador2D, Visualizador3D
-
-__all__ = [
-    'VentanaPrincipal',
-    'RobotMovilBase',
-    'DiferencialCentrado',
-    'DiferencialDescentrado',
-    'CuatroRuedasCentrado',
-    'CuatroRuedasDescentrado',
-    'Visualizador2D',
-    'Visualizador3D'
-]
+import importlib
 
+# Facilitar imports desde el paquete src. Los submódulos se importan al
+# acceder al atributo por primera vez (PEP 562), de modo que importar, por
+# ejemplo, src.models no arrastra Tkinter ni matplotlib.
+_IMPORTS_DIFERIDOS = {
+    'VentanaPrincipal': '.gui',
+    'RobotMovilBase': '.models',
+    'DiferencialCentrado': '.models',
+    'DiferencialDescentrado': '.models',
+    'CuatroRuedasCentrado': '.models',
+    'CuatroRuedasDescentrado': '.models',
+    'Visualizador2D': '.visualization',
+    'Visualizador3D': '.visualization'
+}
+
+__all__ = list(_IMPORTS_DIFERIDOS)
+
+
+def __getattr__(nombre):
+    """Importa bajo demanda los símbolos públicos del paquete."""
+    if nombre in _IMPORTS_DIFERIDOS:
+        modulo = importlib.import_module(_IMPORTS_DIFERIDOS[nombre], __name__)
+        valor = getattr(modulo, nombre)
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def __dir__():
+    """Incluye los símbolos diferidos en dir(src)."""
+    return sorted(list(globals()) + __all__)
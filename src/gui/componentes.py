@@ -3,11 +3,20 @@ Componentes personalizados para la GUI.
 Incluye controles con slider + campo numérico + selector de unidades.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk
+from datetime import datetime
 from typing import Callable, List, Tuple, Optional
 
 
+# Directorio desde el que se ejecuta el programa (getcwd ya es absoluto)
+RUTA_PROGRAMA = os.getcwd()
+
+# Formato del valor mostrado en el campo numérico de ParametroControl
+FORMATO_VALOR = "%.3f"
+
+
 class ParametroControl(ttk.Frame):
     """
     Widget compuesto que incluye:
@@ -51,7 +60,11 @@ class ParametroControl(ttk.Frame):
         # Variables
         self.valor_si = tk.DoubleVar(value=valor_inicial)
         self.unidad_actual = tk.StringVar(value=unidad_si)
-        self.actualizando = False
+        
+        # Caché del valor SI y del factor de la unidad actual (evita
+        # consultas a Tcl en cada movimiento del slider)
+        self._valor_si_actual = float(valor_inicial)
+        self._factor_actual = factores_conversion.get(unidad_si, 1.0)
         
         self._crear_widgets()
         self._configurar_eventos()
@@ -62,15 +75,17 @@ class ParametroControl(ttk.Frame):
         self.label = ttk.Label(self, text=self.etiqueta_texto, width=18, anchor='w')
         self.label.grid(row=0, column=0, padx=2, pady=2, sticky='w')
         
-        # Slider (sin command todavía, se configura después)
+        # Slider (ligado directamente a la variable del valor SI)
         self.slider = ttk.Scale(self, from_=self.rango[0], to=self.rango[1],
-                               orient='horizontal', length=120)
-        self.slider.set(self.valor_si.get())
+                               orient='horizontal', length=120,
+                               variable=self.valor_si)
         self.slider.grid(row=0, column=1, padx=2, pady=2, sticky='ew')
         
         # Campo numérico (más pequeño)
-        self.entry = ttk.Entry(self, width=10, justify='right')
-        self.entry.insert(0, f"{self.valor_si.get():.3f}")
+        self._ultimo_texto_entry = FORMATO_VALOR % self.valor_si.get()
+        self.texto_entry = tk.StringVar(value=self._ultimo_texto_entry)
+        self.entry = ttk.Entry(self, textvariable=self.texto_entry,
+                               width=10, justify='right')
         self.entry.grid(row=0, column=2, padx=2, pady=2)
         
         # Selector de unidades (más compacto)
@@ -84,114 +99,102 @@ class ParametroControl(ttk.Frame):
     
     def _configurar_eventos(self):
         """Configura los eventos de los widgets."""
-        # Configurar comando del slider DESPUÉS de crear todos los widgets
-        self.slider.config(command=self._on_slider_change)
+        # Toda escritura del valor SI (slider, entry o código) pasa por la traza
+        self.valor_si.trace_add('write', self._on_valor_si_change)
+        
+        # El callback solo se notifica al soltar el slider, no en cada movimiento
+        self.slider.bind('<ButtonRelease-1>', self._on_slider_release)
         
         # Eventos del entry y combobox
         self.entry.bind('<Return>', self._on_entry_change)
         self.entry.bind('<FocusOut>', self._on_entry_change)
         self.combo_unidades.bind('<<ComboboxSelected>>', self._on_unidad_change)
     
-    def _on_slider_change(self, valor):
-        """Maneja cambios en el slider."""
-        if self.actualizando:
-            return
-        
-        self.actualizando = True
-        valor_float = float(valor)
-        self.valor_si.set(valor_float)
-        
-        # Actualizar entry con valor convertido a unidad actual
-        valor_mostrar = self._convertir_de_si(valor_float)
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{valor_mostrar:.3f}")
+    def _on_valor_si_change(self, *args):
+        """
+        Sincroniza la caché y el campo numérico cuando cambia el valor SI.
         
-        self.actualizando = False
+        El slider está ligado a la misma variable, por lo que no requiere
+        actualización explícita. Las escrituras repetidas del mismo valor
+        (frecuentes al arrastrar el slider) se ignoran.
+        """
+        valor_si = self.valor_si.get()
+        if valor_si == self._valor_si_actual:
+            return
         
+        self._valor_si_actual = valor_si
+        self._mostrar_valor(valor_si)
+    
+    def _on_slider_release(self, event=None):
+        """Notifica el valor final del slider al soltar el botón del mouse."""
         if self.callback:
-            self.callback(valor_float)
+            self.callback(self._valor_si_actual)
     
     def _on_entry_change(self, event=None):
         """Maneja cambios en el campo numérico."""
-        if self.actualizando:
-            return
+        # El usuario editó el texto: la próxima escritura no debe omitirse
+        self._ultimo_texto_entry = None
         
         try:
-            self.actualizando = True
-            valor_texto = self.entry.get()
-            valor_unidad_actual = float(valor_texto)
-            
-            # Convertir a SI
-            valor_si = self._convertir_a_si(valor_unidad_actual)
-            
-            # Limitar al rango
-            valor_si = max(self.rango[0], min(self.rango[1], valor_si))
-            
-            self.valor_si.set(valor_si)
-            
-            # Actualizar slider
-            self.slider.set(valor_si)
-            
-            # Actualizar entry con valor limitado
-            valor_mostrar = self._convertir_de_si(valor_si)
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, f"{valor_mostrar:.3f}")
-            
-            self.actualizando = False
-            
-            if self.callback:
-                self.callback(valor_si)
-        
+            valor_unidad_actual = float(self.texto_entry.get())
         except ValueError:
-            self.actualizando = False
             # Restaurar valor anterior si hay error
-            valor_mostrar = self._convertir_de_si(self.valor_si.get())
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, f"{valor_mostrar:.3f}")
+            self._mostrar_valor(self._valor_si_actual)
+            return
+        
+        # Convertir a SI y limitar al rango
+        valor_si = self._convertir_a_si(valor_unidad_actual)
+        valor_si = max(self.rango[0], min(self.rango[1], valor_si))
+        
+        # La traza actualiza slider y caché con el valor limitado; el entry se
+        # reescribe aparte por si el valor no cambió pero el texto sí
+        self.valor_si.set(valor_si)
+        self._mostrar_valor(valor_si)
+        
+        if self.callback:
+            self.callback(valor_si)
     
     def _on_unidad_change(self, event=None):
         """Maneja cambios en la unidad seleccionada."""
-        if self.actualizando:
-            return
+        # Refrescar factor de conversión de la nueva unidad
+        self._factor_actual = self.factores_conversion.get(self.unidad_actual.get(), 1.0)
         
-        self.actualizando = True
+        # Mostrar valor actual en la nueva unidad
+        self._mostrar_valor(self._valor_si_actual)
+    
+    def _mostrar_valor(self, valor_si: float):
+        """
+        Escribe en el campo numérico un valor SI convertido a la unidad actual.
         
-        # Convertir valor actual a nueva unidad
-        valor_si = self.valor_si.get()
-        valor_nueva_unidad = self._convertir_de_si(valor_si)
+        Omite la escritura si el texto formateado coincide con el último escrito.
         
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{valor_nueva_unidad:.3f}")
+        Args:
+            valor_si: Valor en unidades SI
+        """
+        texto = FORMATO_VALOR % self._convertir_de_si(valor_si)
+        if texto == self._ultimo_texto_entry:
+            return
         
-        self.actualizando = False
+        self.texto_entry.set(texto)
+        self._ultimo_texto_entry = texto
     
     def _convertir_a_si(self, valor: float) -> float:
         """Convierte un valor de la unidad actual a SI."""
-        unidad = self.unidad_actual.get()
-        factor = self.factores_conversion.get(unidad, 1.0)
-        return valor * factor
+        return valor * self._factor_actual
     
     def _convertir_de_si(self, valor_si: float) -> float:
         """Convierte un valor de SI a la unidad actual."""
-        unidad = self.unidad_actual.get()
-        factor = self.factores_conversion.get(unidad, 1.0)
+        factor = self._factor_actual
         return valor_si / factor if factor != 0 else valor_si
     
     def get_valor_si(self) -> float:
         """Retorna el valor en unidades SI."""
-        return self.valor_si.get()
+        return self._valor_si_actual
     
     def set_valor_si(self, valor: float):
         """Establece el valor en unidades SI."""
-        self.actualizando = True
         valor = max(self.rango[0], min(self.rango[1], valor))
         self.valor_si.set(valor)
-        self.slider.set(valor)
-        
-        valor_mostrar = self._convertir_de_si(valor)
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{valor_mostrar:.3f}")
-        self.actualizando = False
     
     def habilitar(self, habilitado: bool = True):
         """Habilita o deshabilita el control."""
@@ -215,6 +218,17 @@ class PanelMonitoreo(ttk.Frame):
     Útil para debugging y seguimiento de la aplicación.
     """
     
+    # Mapeo de tipos de log a símbolos
+    SIMBOLOS = {
+        'info': 'ℹ',
+        'success': '✓',
+        'warning': '⚠',
+        'error': '✗'
+    }
+    
+    # Máximo de líneas conservadas en el log (las más antiguas se descartan)
+    MAX_LINEAS_LOG = 500
+    
     def __init__(self, parent, callback_iniciar: Callable, 
                  callback_detener: Callable, callback_reiniciar: Callable, **kwargs):
         """
@@ -235,12 +249,17 @@ class PanelMonitoreo(ttk.Frame):
         # Configurar el frame con borde (padding reducido)
         self.config(relief='solid', borderwidth=1, padding=3)
         
+        # Número de líneas actualmente en el log
+        self.lineas_log = 0
+        
+        # Fragmentos (texto, tag) pendientes de escribir en el próximo ciclo inactivo
+        self._fragmentos_pendientes = []
+        self._id_volcado = None
+        
         self._crear_widgets()
         
         # Log inicial
-        import os
-        ruta_programa = os.path.abspath(os.getcwd())
-        self.agregar_log(f"Programa iniciado desde: {ruta_programa}", "info")
+        self.agregar_log(f"Programa iniciado desde: {RUTA_PROGRAMA}", "info")
         self.agregar_log("Panel de monitoreo activo - Listo para simulación", "info")
     
     def _crear_widgets(self):
@@ -316,41 +335,70 @@ class PanelMonitoreo(ttk.Frame):
             mensaje: Texto del mensaje a registrar
             tipo: Tipo de log - 'info', 'success', 'warning', 'error'
         """
-        from datetime import datetime
+        self.agregar_logs([(mensaje, tipo)])
+    
+    def agregar_logs(self, entradas: List[Tuple[str, str]]):
+        """
+        Agrega varios mensajes al log.
+        
+        Los mensajes se acumulan y se escriben en el widget de texto con un
+        único acceso en el próximo ciclo inactivo, de modo que las llamadas
+        consecutivas (p. ej. durante el inicio de la simulación) se agrupan.
+        
+        Args:
+            entradas: Lista de tuplas (mensaje, tipo)
+        """
+        if not entradas:
+            return
         
         # Obtener timestamp
         timestamp = datetime.now().strftime('%H:%M:%S')
         
-        # Mapeo de tipos a símbolos
-        simbolos = {
-            'info': 'ℹ',
-            'success': '✓',
-            'warning': '⚠',
-            'error': '✗'
-        }
+        # Pares (texto, tag) de todas las líneas para una sola inserción
+        for mensaje, tipo in entradas:
+            simbolo = self.SIMBOLOS.get(tipo, 'ℹ')
+            self._fragmentos_pendientes.extend((f"[{timestamp}] ", 'timestamp',
+                                                f"{simbolo} {mensaje}\n", tipo))
+            self.lineas_log += mensaje.count('\n') + 1
+        
+        if self._id_volcado is None:
+            self._id_volcado = self.after_idle(self._volcar_logs)
+    
+    def _volcar_logs(self):
+        """Escribe en el widget de texto los mensajes pendientes."""
+        self._id_volcado = None
+        fragmentos = self._fragmentos_pendientes
+        self._fragmentos_pendientes = []
         
-        simbolo = simbolos.get(tipo, 'ℹ')
+        # Solo seguir el final si el usuario no se ha desplazado hacia arriba
+        al_final = self.text_logs.yview()[1] >= 1.0
         
         # Habilitar edición temporalmente
         self.text_logs.config(state='normal')
         
-        # Insertar timestamp
-        self.text_logs.insert('end', f"[{timestamp}] ", 'timestamp')
+        # Insertar timestamps y mensajes (con su color) en una sola llamada
+        self.text_logs.insert('end', *fragmentos)
         
-        # Insertar símbolo y mensaje con el color apropiado
-        self.text_logs.insert('end', f"{simbolo} {mensaje}\n", tipo)
+        # Descartar las líneas más antiguas si se supera el máximo
+        if self.lineas_log > self.MAX_LINEAS_LOG:
+            exceso = self.lineas_log - self.MAX_LINEAS_LOG
+            self.text_logs.delete('1.0', f'{exceso + 1}.0')
+            self.lineas_log -= exceso
         
         # Auto-scroll al final
-        self.text_logs.see('end')
+        if al_final:
+            self.text_logs.see('end')
         
         # Deshabilitar edición
         self.text_logs.config(state='disabled')
     
     def _limpiar_logs(self):
         """Limpia todos los logs del panel."""
+        self._fragmentos_pendientes = []
         self.text_logs.config(state='normal')
         self.text_logs.delete('1.0', 'end')
         self.text_logs.config(state='disabled')
+        self.lineas_log = 0
         self.agregar_log("Logs limpiados", "info")
     
     def set_estado(self, estado: str, tipo: str = 'info'):
@@ -6,12 +6,243 @@ dinámica y relaciones geométricas con formato LaTeX, leyendas, unidades
 y contexto explicativo.
 """
 
+import base64
+import hashlib
+import io
+import os
 import tkinter as tk
+import weakref
+from collections import OrderedDict, deque
+from functools import lru_cache
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.patches as mpatches
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+# Imágenes de las ecuaciones generadas de antemano (utils/generar_ecuaciones.py)
+DIRECTORIO_ECUACIONES_PRECALCULADAS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'assets', 'ecuaciones')
+
+# Caché en disco de las ecuaciones renderizadas (persiste entre ejecuciones)
+DIRECTORIO_CACHE_ECUACIONES = os.path.join(
+    os.path.expanduser('~'), '.cache', 'mobile_robot_design', 'eqn_png')
+
+
+def _dpi_ecuaciones(escala_tk: float) -> int:
+    """
+    Resolución de renderizado de las ecuaciones según el escalado de Tk.
+    
+    Se usan 100 dpi en pantallas estándar (escalado de 96/72 píxeles por punto),
+    que coinciden con las imágenes precalculadas; en pantallas HiDPI se aumenta
+    en pasos de 25 dpi para que las ecuaciones se vean nítidas.
+    """
+    factor = escala_tk / (96 / 72)
+    return max(100, int(round(4 * factor)) * 25)
+
+
+def _nombre_archivo_ecuacion(ecuacion_latex: str, dpi: int = 100) -> str:
+    """Nombre del PNG de una ecuación, según el hash SHA-1 de su contenido."""
+    clave = hashlib.sha1(f"{dpi}:{ecuacion_latex}".encode('utf-8')).hexdigest()
+    return f"{clave}.png"
+
+
+@lru_cache(maxsize=1)
+def _figura_ecuaciones():
+    """
+    Crea una única vez la figura de matplotlib que se reutiliza para
+    rasterizar todas las ecuaciones.
+    
+    Returns:
+        Tupla (parser, propiedades, figura, texto)
+    """
+    # Importación diferida: matplotlib solo se carga si falta alguna imagen
+    from matplotlib.figure import Figure
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.mathtext import MathTextParser
+    
+    propiedades = FontProperties(size=14)
+    figura = Figure()
+    texto = figura.text(0, 0, '', fontproperties=propiedades)
+    
+    return MathTextParser('path'), propiedades, figura, texto
+
+
+def _rasterizar_latex(ecuacion_latex: str, dpi: int = 100) -> bytes:
+    """
+    Renderiza una ecuación LaTeX a PNG con mathtext y devuelve sus bytes.
+    
+    Equivale a mathtext.math_to_image (imagen ajustada a la ecuación), pero
+    reutilizando la figura compartida en lugar de crear una por ecuación.
+    """
+    parser, propiedades, figura, texto = _figura_ecuaciones()
+    ecuacion = f'${ecuacion_latex}$'
+    
+    ancho, alto, profundidad, _, _ = parser.parse(ecuacion, dpi=72, prop=propiedades)
+    figura.set_size_inches(ancho / 72.0, alto / 72.0)
+    texto.set_text(ecuacion)
+    texto.set_y(profundidad / alto)
+    
+    buffer = io.BytesIO()
+    figura.savefig(buffer, dpi=dpi, format='png')
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _renderizar_latex_png(ecuacion_latex: str, dpi: int = 100) -> bytes:
+    """
+    Devuelve los bytes PNG de una ecuación LaTeX.
+    
+    Memoizada por contenido, de modo que las ecuaciones repetidas se obtienen
+    una sola vez por proceso. Se usa la imagen precalculada si existe; si no,
+    la de la caché en disco y, en último caso, se renderiza con mathtext y se
+    guarda en la caché. Los errores de la caché en disco se ignoran.
+    """
+    nombre = _nombre_archivo_ecuacion(ecuacion_latex, dpi)
+    
+    for directorio in (DIRECTORIO_ECUACIONES_PRECALCULADAS, DIRECTORIO_CACHE_ECUACIONES):
+        try:
+            with open(os.path.join(directorio, nombre), 'rb') as archivo:
+                return archivo.read()
+        except OSError:
+            pass
+    
+    datos = _rasterizar_latex(ecuacion_latex, dpi)
+    
+    try:
+        os.makedirs(DIRECTORIO_CACHE_ECUACIONES, exist_ok=True)
+        with open(os.path.join(DIRECTORIO_CACHE_ECUACIONES, nombre), 'wb') as archivo:
+            archivo.write(datos)
+    except OSError:
+        pass
+    
+    return datos
+
+
+# Ecuaciones de la pestaña de geometría: (título, LaTeX, leyenda, contexto, unidades).
+# Se definen una única vez al importar el módulo y se comparten entre instancias.
+_ECUACIONES_GEOMETRICAS: Tuple[Tuple[str, str, Mapping[str, str], str, str], ...] = (
+    # Ecuación 1: Centro de Masa Descentrado
+    (
+        "1. Posición del Centro de Masa Descentrado",
+        r"\vec{r}_{CM} = (A, B, C)",
+        MappingProxyType({
+            "r⃗_CM": "Vector posición del centro de masa [m]",
+            "A": "Desplazamiento longitudinal (eje X) [m]",
+            "B": "Desplazamiento lateral (eje Y) [m]",
+            "C": "Desplazamiento vertical (eje Z) [m]"
+        }),
+        "Define la posición del centro de masa respecto al sistema de coordenadas del robot. "
+        "Para robot centrado: A=B=C=0. Para descentrado, estos valores afectan la "
+        "distribución de fuerzas normales entre ruedas, especialmente en terrenos inclinados. "
+        "Se usa en el cálculo de momentos y equilibrio de fuerzas.",
+        "SI: todas las distancias en metros (m)"
+    ),
+    
+    # Ecuación 2: Distancia al Centro Instantáneo de Rotación
+    (
+        "2. Radio de Giro (Robot Diferencial)",
+        r"R = \frac{v}{\omega} = \frac{L}{2} \cdot \frac{v_L + v_R}{v_R - v_L}",
+        MappingProxyType({
+            "R": "Radio de curvatura de la trayectoria [m]",
+            "v": "Velocidad lineal del robot [m/s]",
+            "ω": "Velocidad angular [rad/s]",
+            "L": "Distancia entre ruedas [m]",
+            "v_L, v_R": "Velocidades de ruedas izq./der. [m/s]"
+        }),
+        "Radio del círculo que describe el centro del robot durante un giro. Si ω=0 (v_L=v_R), "
+        "R→∞ (línea recta). Si v=0 (v_L=-v_R), R=0 (giro sobre sí mismo). Define el centro "
+        "instantáneo de rotación (CIR) del robot. Se usa para análisis de trayectorias.",
+        "SI: radio en m, velocidades en m/s o rad/s"
+    ),
+    
+    # Ecuación 3: Posición de Ruedas en Robot Diferencial
+    (
+        "3. Posición de Ruedas: Robot Diferencial",
+        r"\vec{r}_L = \left(0, -\frac{L}{2}, 0\right), \quad "
+        r"\vec{r}_R = \left(0, +\frac{L}{2}, 0\right), \quad "
+        r"\vec{r}_{caster} = (d_{caster}, 0, 0)",
+        MappingProxyType({
+            "r⃗_L": "Posición de rueda izquierda en coord. del robot [m]",
+            "r⃗_R": "Posición de rueda derecha en coord. del robot [m]",
+            "r⃗_caster": "Posición de rueda loca [m]",
+            "L": "Distancia entre ruedas motrices [m]",
+            "d_caster": "Distancia de rueda loca al eje motriz [m]"
+        }),
+        "Posiciones de las ruedas en el sistema de coordenadas solidario al robot (origen "
+        "en el centro del eje de ruedas motrices). Define la geometría del robot diferencial. "
+        "Se usa para calcular distribución de fuerzas y momentos.",
+        "SI: todas las posiciones y distancias en metros (m)"
+    ),
+    
+    # Ecuación 4: Posición de Ruedas en Robot 4 Ruedas
+    (
+        "4. Posición de Ruedas: Robot 4 Ruedas",
+        r"\vec{r}_{FL} = \left(+\frac{D_l}{2}, -\frac{D_w}{2}, 0\right), \quad "
+        r"\vec{r}_{FR} = \left(+\frac{D_l}{2}, +\frac{D_w}{2}, 0\right), \quad "
+        r"\vec{r}_{BL} = \left(-\frac{D_l}{2}, -\frac{D_w}{2}, 0\right), \quad "
+        r"\vec{r}_{BR} = \left(-\frac{D_l}{2}, +\frac{D_w}{2}, 0\right)",
+        MappingProxyType({
+            "r⃗_FL, r⃗_FR, r⃗_BL, r⃗_BR": "Posiciones de ruedas Front-Left, Front-Right, Back-Left, Back-Right [m]",
+            "D_l": "Distancia entre ejes delantero y trasero (largo) [m]",
+            "D_w": "Distancia entre ruedas izq. y der. (ancho) [m]"
+        }),
+        "Posiciones de las 4 ruedas en el sistema de coordenadas del robot (origen en el "
+        "centro geométrico). Define la geometría del robot de 4 ruedas. Se usa para calcular "
+        "distribución de cargas, momentos y cinemática.",
+        "SI: todas las posiciones y distancias en metros (m)"
+    ),
+    
+    # Ecuación 5: Transformación de Coordenadas
+    (
+        "5. Transformación Robot → Global",
+        r"x_{global} = x_{robot} \cos\theta - y_{robot} \sin\theta + x_0, \quad "
+        r"y_{global} = x_{robot} \sin\theta + y_{robot} \cos\theta + y_0",
+        MappingProxyType({
+            "x_global, y_global": "Coordenadas en sistema global (inercial) [m]",
+            "x_robot, y_robot": "Coordenadas en sistema del robot [m]",
+            "θ": "Orientación del robot [rad]",
+            "x_0, y_0": "Posición del origen del robot en sistema global [m]"
+        }),
+        "Transformación de coordenadas del sistema solidario al robot al sistema global fijo. "
+        "Aplica rotación por ángulo θ seguida de traslación. Equivale a multiplicar por matriz "
+        "de rotación 2D y sumar vector de posición. Se usa para ubicar ruedas en espacio global.",
+        "SI: coordenadas en m, ángulo en rad. La rotación preserva distancias (transformación ortogonal)"
+    ),
+    
+    # Ecuación 6: Componentes de Gravedad en Terreno Inclinado
+    (
+        "6. Componentes de Gravedad en Plano Inclinado",
+        r"g_{\perp} = g \cos(\theta_{pitch}), \quad g_{\parallel} = g \sin(\theta_{pitch})",
+        MappingProxyType({
+            "g_⊥": "Componente de gravedad perpendicular al plano [m/s²]",
+            "g_∥": "Componente de gravedad paralela al plano [m/s²]",
+            "g": "Aceleración gravitacional (9.81 m/s²)",
+            "θ_pitch": "Ángulo de inclinación del terreno [rad]"
+        }),
+        "Descomposición del vector gravedad en componentes normal y tangencial respecto "
+        "al plano inclinado. La componente perpendicular afecta las fuerzas normales, "
+        "mientras que la paralela genera una fuerza tangencial que el robot debe vencer. "
+        "Proviene de la geometría vectorial.",
+        "SI: aceleraciones en m/s², ángulo en rad"
+    ),
+    
+    # Ecuación 7: Momento de Inercia Simplificado
+    (
+        "7. Momento de Inercia (Aproximación)",
+        r"I_z \approx \frac{m}{12}(L^2 + W^2)",
+        MappingProxyType({
+            "I_z": "Momento de inercia respecto al eje Z [kg·m²]",
+            "m": "Masa del robot [kg]",
+            "L": "Largo del robot [m]",
+            "W": "Ancho del robot [m]"
+        }),
+        "Aproximación del momento de inercia del robot como una placa rectangular homogénea. "
+        "Se usa para relacionar torque angular con aceleración angular (τ = I·α). En este "
+        "proyecto se asume distribución de masa simplificada. Útil para análisis dinámico "
+        "más detallado.",
+        "SI: momento de inercia en kg·m², masa en kg, dimensiones en m"
+    ),
+)
 
 
 class VisualizadorEcuaciones:
@@ -25,6 +256,9 @@ class VisualizadorEcuaciones:
     - Organización por categorías
     """
     
+    # Máximo de imágenes de ecuaciones referenciadas en la caché
+    TAMANO_CACHE_IMAGENES = 64
+    
     def __init__(self, parent_frame):
         """
         Inicializa el visualizador de ecuaciones.
@@ -33,6 +267,17 @@ class VisualizadorEcuaciones:
             parent_frame: Frame de tkinter donde se mostrará el contenido
         """
         self.parent = parent_frame
+        
+        # Imágenes ya renderizadas, en orden LRU: {ecuacion_latex: weakref(tk.PhotoImage)}.
+        # Las referencias débiles permiten liberar las imágenes sin etiquetas vivas.
+        self._latex_img_cache = OrderedDict()
+        
+        # Resolución de las ecuaciones adaptada a la densidad de la pantalla
+        self._dpi = _dpi_ecuaciones(float(self.parent.tk.call('tk', 'scaling')))
+        
+        # Fondo del tema para que el texto de las secciones no destaque
+        self._color_fondo = ttk.Style(self.parent).lookup('TFrame', 'background') or None
+        
         self.crear_interface()
     
     def crear_interface(self):
@@ -41,136 +286,226 @@ class VisualizadorEcuaciones:
         self.notebook = ttk.Notebook(self.parent)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Crear pestañas para cada categoría
-        self.crear_tab_cinematica_diferencial()
-        self.crear_tab_cinematica_4ruedas()
-        self.crear_tab_dinamica()
-        self.crear_tab_geometria()
-    
-    def crear_tab_cinematica_diferencial(self):
-        """Crea la pestaña de cinemática para robot diferencial."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Cinemática Diferencial")
-        
-        # Canvas con scrollbar
-        canvas = tk.Canvas(frame, bg='white')
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Contenido pendiente de cada pestaña: {id_pestaña: (función, frame)}.
+        # Las ecuaciones se construyen la primera vez que se activa la pestaña.
+        self._pestanas_pendientes = {}
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Ecuaciones aún sin renderizar de cada pestaña:
+        # {id_frame_desplazable: [(seccion, contenedor, ecuacion_latex), ...]}
+        self._ecuaciones_pendientes = {}
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Desplazamiento de rueda acumulado por canvas: {id_canvas: (delta, id_after)}
+        self._desplazamiento_rueda = {}
         
-        # Contenido
-        self._agregar_ecuaciones_cinematica_diferencial(scrollable_frame)
+        # Secciones pendientes de construir, en orden de aparición
+        self._secciones_en_espera = deque()
+        self._id_construccion = None
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Crear pestañas para cada categoría
+        self._crear_tab_desplazable("Cinemática Diferencial",
+                                    self._agregar_ecuaciones_cinematica_diferencial)
+        self._crear_tab_desplazable("Cinemática 4 Ruedas",
+                                    self._agregar_ecuaciones_cinematica_4ruedas)
+        self._crear_tab_desplazable("Dinámica", self._agregar_ecuaciones_dinamica)
+        self._crear_tab_desplazable("Geometría", self._agregar_ecuaciones_geometria)
         
-        # Habilitar scroll con rueda del mouse
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_cambio_pestana)
         
-        # Scroll con rueda - solo cuando el cursor está sobre el canvas
-        def _bind_wheel():
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Construir la pestaña seleccionada inicialmente
+        self._on_cambio_pestana()
+    
+    def _on_cambio_pestana(self, event=None):
+        """Construye el contenido de la pestaña activa si aún no existe."""
+        pendiente = self._pestanas_pendientes.pop(self.notebook.select(), None)
+        if pendiente is not None:
+            agregar_ecuaciones, scrollable_frame = pendiente
+            agregar_ecuaciones(scrollable_frame)
+    
+    def _conectar_region_desplazamiento(self, canvas, scrollable_frame):
+        """
+        Mantiene la región de desplazamiento del canvas ajustada al contenido,
+        recalculándola como máximo una vez cada 30 ms durante los cambios de tamaño.
+        """
+        id_after = [None]
         
-        def _unbind_wheel():
-            canvas.unbind_all("<MouseWheel>")
+        def _actualizar_region():
+            id_after[0] = None
+            # El frame es el único elemento del canvas: su tamaño solicitado
+            # define la región sin recorrer los elementos con bbox("all")
+            canvas.configure(scrollregion=(0, 0, scrollable_frame.winfo_reqwidth(),
+                                           scrollable_frame.winfo_reqheight()))
         
-        canvas.bind("<Enter>", lambda e: _bind_wheel())
-        canvas.bind("<Leave>", lambda e: _unbind_wheel())
+        def _on_configure(event):
+            if id_after[0] is None:
+                id_after[0] = canvas.after(30, _actualizar_region)
         
-        # Navegación por teclado
-        canvas.bind("<Up>", lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind("<Down>", lambda e: canvas.yview_scroll(1, "units"))
-        canvas.bind("<Prior>", lambda e: canvas.yview_scroll(-1, "pages"))
-        canvas.bind("<Next>", lambda e: canvas.yview_scroll(1, "pages"))
-        canvas.config(takefocus=True)
+        scrollable_frame.bind("<Configure>", _on_configure)
     
-    def crear_tab_cinematica_4ruedas(self):
-        """Crea la pestaña de cinemática para robot de 4 ruedas."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Cinemática 4 Ruedas")
+    def _conectar_desplazamiento(self, canvas, scrollbar, scrollable_frame):
+        """
+        Enlaza el canvas con su scrollbar y renderiza las ecuaciones que
+        entran en la zona visible cada vez que cambia la vista o su tamaño.
+        """
+        def _on_desplazamiento(primero, ultimo):
+            scrollbar.set(primero, ultimo)
+            self._materializar_visibles(canvas, scrollable_frame)
         
-        canvas = tk.Canvas(frame, bg='white')
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        canvas.configure(yscrollcommand=_on_desplazamiento)
+    
+    def _instalar_rueda_mouse(self, canvas):
+        """
+        Habilita el scroll con la rueda del mouse solo mientras el cursor
+        está sobre el canvas, para que cada pestaña desplace su propio contenido.
+        """
+        def _on_mousewheel(event):
+            self._on_rueda_mouse(canvas, event)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+    
+    def _on_rueda_mouse(self, canvas, event):
+        """
+        Acumula los eventos de la rueda del mouse y los aplica en un único
+        desplazamiento cada 10 ms, evitando un redibujado por evento.
+        """
+        clave = str(canvas)
+        delta, id_after = self._desplazamiento_rueda.get(clave, (0, None))
+        if id_after is None:
+            id_after = canvas.after(10, self._aplicar_desplazamiento_rueda, canvas)
+        self._desplazamiento_rueda[clave] = (delta + event.delta, id_after)
+    
+    def _aplicar_desplazamiento_rueda(self, canvas):
+        """Aplica el desplazamiento acumulado de la rueda del mouse."""
+        delta, _ = self._desplazamiento_rueda.pop(str(canvas), (0, None))
+        unidades = int(-1*(delta/120))
+        if unidades:
+            canvas.yview_scroll(unidades, "units")
+    
+    def _materializar_visibles(self, canvas, scrollable_frame):
+        """Renderiza las ecuaciones pendientes que solapan la zona visible."""
+        pendientes = self._ecuaciones_pendientes.get(str(scrollable_frame))
+        if not pendientes:
+            return
+        
+        # Sin geometría calculada todavía no se puede saber qué es visible
+        alto_total = scrollable_frame.winfo_height()
+        if alto_total <= 1:
+            return
+        
+        primero, ultimo = canvas.yview()
+        y_min = primero * alto_total
+        y_max = ultimo * alto_total
+        
+        restantes = []
+        for seccion, contenedor, ecuacion_latex in pendientes:
+            y = seccion.winfo_y() + contenedor.winfo_y()
+            if y + contenedor.winfo_height() >= y_min and y <= y_max:
+                self._materializar_ecuacion(contenedor, ecuacion_latex)
+            else:
+                restantes.append((seccion, contenedor, ecuacion_latex))
+        
+        self._ecuaciones_pendientes[str(scrollable_frame)] = restantes
+    
+    def _materializar_ecuacion(self, contenedor, ecuacion_latex):
+        """Muestra la imagen de una ecuación dentro de su contenedor."""
+        imagen = self._obtener_imagen_ecuacion(ecuacion_latex)
+        etiqueta = tk.Label(contenedor, image=imagen, bg='white')
+        etiqueta.image = imagen  # Mantener referencia para evitar su liberación
+        etiqueta.pack(expand=True)
+    
+    def _obtener_imagen_ecuacion(self, ecuacion_latex):
+        """
+        Devuelve la imagen de una ecuación LaTeX como PhotoImage,
+        reutilizando la caché.
+        """
+        referencia = self._latex_img_cache.get(ecuacion_latex)
+        imagen = referencia() if referencia is not None else None
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        if imagen is not None:
+            self._latex_img_cache.move_to_end(ecuacion_latex)
+            return imagen
         
-        self._agregar_ecuaciones_cinematica_4ruedas(scrollable_frame)
+        datos = _renderizar_latex_png(ecuacion_latex, self._dpi)
+        imagen = tk.PhotoImage(data=base64.b64encode(datos))
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self._latex_img_cache[ecuacion_latex] = weakref.ref(imagen)
+        self._latex_img_cache.move_to_end(ecuacion_latex)
+        if len(self._latex_img_cache) > self.TAMANO_CACHE_IMAGENES:
+            self._latex_img_cache.popitem(last=False)
         
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        return imagen
     
-    def crear_tab_dinamica(self):
-        """Crea la pestaña de dinámica."""
+    def _crear_tab_desplazable(self, texto, agregar_ecuaciones):
+        """
+        Crea una pestaña con contenido desplazable.
+        
+        Args:
+            texto: Título de la pestaña
+            agregar_ecuaciones: Función que construye el contenido de la pestaña
+                                (se llama la primera vez que se activa)
+        """
         frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Dinámica")
+        self.notebook.add(frame, text=texto)
         
+        # Canvas con scrollbar
         canvas = tk.Canvas(frame, bg='white')
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._conectar_region_desplazamiento(canvas, scrollable_frame)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self._conectar_desplazamiento(canvas, scrollbar, scrollable_frame)
         
-        self._agregar_ecuaciones_dinamica(scrollable_frame)
+        # Contenido (se construye al activar la pestaña)
+        self._pestanas_pendientes[str(frame)] = (agregar_ecuaciones, scrollable_frame)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-    
-    def crear_tab_geometria(self):
-        """Crea la pestaña de relaciones geométricas."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Geometría")
+        # Habilitar scroll con rueda del mouse
+        self._instalar_rueda_mouse(canvas)
         
-        canvas = tk.Canvas(frame, bg='white')
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Navegación por teclado
+        canvas.bind("<Up>", lambda e: canvas.yview_scroll(-1, "units"))
+        canvas.bind("<Down>", lambda e: canvas.yview_scroll(1, "units"))
+        canvas.bind("<Prior>", lambda e: canvas.yview_scroll(-1, "pages"))
+        canvas.bind("<Next>", lambda e: canvas.yview_scroll(1, "pages"))
+        canvas.config(takefocus=True)
+    
+    def _crear_seccion_ecuacion(self, parent, titulo, ecuacion_latex, leyenda, contexto, unidades):
+        """
+        Encola una sección con una ecuación y su información.
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        Las secciones se construyen de una en una en callbacks de inactividad,
+        de modo que la pestaña se muestra de inmediato y el resto aparece
+        progresivamente sin bloquear la interfaz.
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        self._agregar_ecuaciones_geometria(scrollable_frame)
+        Args:
+            parent: Frame padre
+            titulo: Título de la ecuación
+            ecuacion_latex: Ecuación en formato LaTeX
+            leyenda: Diccionario con definición de variables
+            contexto: Texto explicativo del contexto y propósito
+            unidades: Descripción del sistema de unidades
+        """
+        self._secciones_en_espera.append(
+            (parent, titulo, ecuacion_latex, leyenda, contexto, unidades))
+        if self._id_construccion is None:
+            self._id_construccion = self.parent.after_idle(self._construir_siguiente_seccion)
+    
+    def _construir_siguiente_seccion(self):
+        """Construye la siguiente sección en espera y programa la posterior."""
+        self._id_construccion = None
+        if not self._secciones_en_espera:
+            return
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self._construir_seccion(*self._secciones_en_espera.popleft())
         
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        if self._secciones_en_espera:
+            self._id_construccion = self.parent.after_idle(self._construir_siguiente_seccion)
     
-    def _crear_seccion_ecuacion(self, parent, titulo, ecuacion_latex, leyenda, contexto, unidades):
+    def _construir_seccion(self, parent, titulo, ecuacion_latex, leyenda, contexto, unidades):
         """
         Crea una sección con una ecuación y su información.
         
@@ -186,50 +521,42 @@ class VisualizadorEcuaciones:
         frame = ttk.LabelFrame(parent, text=titulo, padding=10)
         frame.pack(fill='x', padx=10, pady=5)
         
-        # Renderizar ecuación con matplotlib
-        fig = Figure(figsize=(8, 1.5), dpi=100, facecolor='white')
-        ax = fig.add_subplot(111)
-        ax.axis('off')
-        
-        # Renderizar LaTeX
-        ax.text(0.5, 0.5, f'${ecuacion_latex}$', 
-                ha='center', va='center', fontsize=14,
-                transform=ax.transAxes)
-        
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='x')
-        
-        # Contexto
-        context_frame = ttk.Frame(frame)
-        context_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(context_frame, text="Contexto y Propósito:", 
-                 font=('Arial', 9, 'bold')).pack(anchor='w')
-        ttk.Label(context_frame, text=contexto, 
-                 wraplength=700, justify='left').pack(anchor='w', padx=10)
-        
-        # Leyenda
-        leyenda_frame = ttk.Frame(frame)
-        leyenda_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(leyenda_frame, text="Leyenda de Variables:", 
-                 font=('Arial', 9, 'bold')).pack(anchor='w')
-        
-        for var, info in leyenda.items():
-            ttk.Label(leyenda_frame, 
-                     text=f"  • {var}: {info}", 
-                     wraplength=700, justify='left').pack(anchor='w', padx=10)
-        
-        # Unidades
-        unidades_frame = ttk.Frame(frame)
-        unidades_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(unidades_frame, text="Unidades:", 
-                 font=('Arial', 9, 'bold')).pack(anchor='w')
-        ttk.Label(unidades_frame, text=unidades, 
-                 wraplength=700, justify='left', 
-                 foreground='darkblue').pack(anchor='w', padx=10)
+        # Contenedor de altura fija para la ecuación; se renderiza al hacerse visible
+        contenedor = tk.Frame(frame, height=150, bg='white')
+        contenedor.pack_propagate(False)
+        contenedor.pack(fill='x')
+        self._ecuaciones_pendientes.setdefault(str(parent), []).append(
+            (frame, contenedor, ecuacion_latex))
+        
+        # Contexto, leyenda y unidades en un único widget de texto con estilos
+        texto = tk.Text(frame, wrap='word', height=1, font='TkDefaultFont',
+                        borderwidth=0, highlightthickness=0, cursor='arrow',
+                        background=self._color_fondo)
+        texto.tag_configure('titulo', font=('Arial', 9, 'bold'), spacing1=5)
+        texto.tag_configure('cuerpo', lmargin1=10, lmargin2=10)
+        texto.tag_configure('unidades', lmargin1=10, lmargin2=10, foreground='darkblue')
+        
+        texto.insert('end', "Contexto y Propósito:\n", 'titulo')
+        texto.insert('end', contexto + "\n", 'cuerpo')
+        
+        texto.insert('end', "Leyenda de Variables:\n", 'titulo')
+        texto.insert('end', "\n".join(f"  • {var}: {info}" for var, info in leyenda.items()) + "\n",
+                     'cuerpo')
+        
+        texto.insert('end', "Unidades:\n", 'titulo')
+        texto.insert('end', unidades, 'unidades')
+        
+        texto.configure(state='disabled')
+        texto.pack(fill='x', pady=5)
+        texto.bind('<Configure>', self._ajustar_alto_texto)
+    
+    @staticmethod
+    def _ajustar_alto_texto(event):
+        """Ajusta el alto del texto de una sección a sus líneas visibles."""
+        texto = event.widget
+        lineas = int(texto.tk.call(texto._w, 'count', '-displaylines', '1.0', 'end'))
+        if lineas != int(texto.cget('height')):
+            texto.configure(height=lineas)
     
     def _agregar_ecuaciones_cinematica_diferencial(self, parent):
         """Agrega ecuaciones de cinemática para robot diferencial."""
@@ -624,132 +951,5 @@ class VisualizadorEcuaciones:
                  text="Configuración espacial y distribución de componentes", 
                  font=('Arial', 10, 'italic')).pack()
         
-        # Ecuación 1: Centro de Masa Descentrado
-        self._crear_seccion_ecuacion(
-            parent,
-            "1. Posición del Centro de Masa Descentrado",
-            r"\vec{r}_{CM} = (A, B, C)",
-            {
-                "r⃗_CM": "Vector posición del centro de masa [m]",
-                "A": "Desplazamiento longitudinal (eje X) [m]",
-                "B": "Desplazamiento lateral (eje Y) [m]",
-                "C": "Desplazamiento vertical (eje Z) [m]"
-            },
-            "Define la posición del centro de masa respecto al sistema de coordenadas del robot. "
-            "Para robot centrado: A=B=C=0. Para descentrado, estos valores afectan la "
-            "distribución de fuerzas normales entre ruedas, especialmente en terrenos inclinados. "
-            "Se usa en el cálculo de momentos y equilibrio de fuerzas.",
-            "SI: todas las distancias en metros (m)"
-        )
-        
-        # Ecuación 2: Distancia al Centro Instantáneo de Rotación
-        self._crear_seccion_ecuacion(
-            parent,
-            "2. Radio de Giro (Robot Diferencial)",
-            r"R = \frac{v}{\omega} = \frac{L}{2} \cdot \frac{v_L + v_R}{v_R - v_L}",
-            {
-                "R": "Radio de curvatura de la trayectoria [m]",
-                "v": "Velocidad lineal del robot [m/s]",
-                "ω": "Velocidad angular [rad/s]",
-                "L": "Distancia entre ruedas [m]",
-                "v_L, v_R": "Velocidades de ruedas izq./der. [m/s]"
-            },
-            "Radio del círculo que describe el centro del robot durante un giro. Si ω=0 (v_L=v_R), "
-            "R→∞ (línea recta). Si v=0 (v_L=-v_R), R=0 (giro sobre sí mismo). Define el centro "
-            "instantáneo de rotación (CIR) del robot. Se usa para análisis de trayectorias.",
-            "SI: radio en m, velocidades en m/s o rad/s"
-        )
-        
-        # Ecuación 3: Posición de Ruedas en Robot Diferencial
-        self._crear_seccion_ecuacion(
-            parent,
-            "3. Posición de Ruedas: Robot Diferencial",
-            r"\vec{r}_L = \left(0, -\frac{L}{2}, 0\right), \quad "
-            r"\vec{r}_R = \left(0, +\frac{L}{2}, 0\right), \quad "
-            r"\vec{r}_{caster} = (d_{caster}, 0, 0)",
-            {
-                "r⃗_L": "Posición de rueda izquierda en coord. del robot [m]",
-                "r⃗_R": "Posición de rueda derecha en coord. del robot [m]",
-                "r⃗_caster": "Posición de rueda loca [m]",
-                "L": "Distancia entre ruedas motrices [m]",
-                "d_caster": "Distancia de rueda loca al eje motriz [m]"
-            },
-            "Posiciones de las ruedas en el sistema de coordenadas solidario al robot (origen "
-            "en el centro del eje de ruedas motrices). Define la geometría del robot diferencial. "
-            "Se usa para calcular distribución de fuerzas y momentos.",
-            "SI: todas las posiciones y distancias en metros (m)"
-        )
-        
-        # Ecuación 4: Posición de Ruedas en Robot 4 Ruedas
-        self._crear_seccion_ecuacion(
-            parent,
-            "4. Posición de Ruedas: Robot 4 Ruedas",
-            r"\vec{r}_{FL} = \left(+\frac{D_l}{2}, -\frac{D_w}{2}, 0\right), \quad "
-            r"\vec{r}_{FR} = \left(+\frac{D_l}{2}, +\frac{D_w}{2}, 0\right), \quad "
-            r"\vec{r}_{BL} = \left(-\frac{D_l}{2}, -\frac{D_w}{2}, 0\right), \quad "
-            r"\vec{r}_{BR} = \left(-\frac{D_l}{2}, +\frac{D_w}{2}, 0\right)",
-            {
-                "r⃗_FL, r⃗_FR, r⃗_BL, r⃗_BR": "Posiciones de ruedas Front-Left, Front-Right, Back-Left, Back-Right [m]",
-                "D_l": "Distancia entre ejes delantero y trasero (largo) [m]",
-                "D_w": "Distancia entre ruedas izq. y der. (ancho) [m]"
-            },
-            "Posiciones de las 4 ruedas en el sistema de coordenadas del robot (origen en el "
-            "centro geométrico). Define la geometría del robot de 4 ruedas. Se usa para calcular "
-            "distribución de cargas, momentos y cinemática.",
-            "SI: todas las posiciones y distancias en metros (m)"
-        )
-        
-        # Ecuación 5: Transformación de Coordenadas
-        self._crear_seccion_ecuacion(
-            parent,
-            "5. Transformación Robot → Global",
-            r"x_{global} = x_{robot} \cos\theta - y_{robot} \sin\theta + x_0, \quad "
-            r"y_{global} = x_{robot} \sin\theta + y_{robot} \cos\theta + y_0",
-            {
-                "x_global, y_global": "Coordenadas en sistema global (inercial) [m]",
-                "x_robot, y_robot": "Coordenadas en sistema del robot [m]",
-                "θ": "Orientación del robot [rad]",
-                "x_0, y_0": "Posición del origen del robot en sistema global [m]"
-            },
-            "Transformación de coordenadas del sistema solidario al robot al sistema global fijo. "
-            "Aplica rotación por ángulo θ seguida de traslación. Equivale a multiplicar por matriz "
-            "de rotación 2D y sumar vector de posición. Se usa para ubicar ruedas en espacio global.",
-            "SI: coordenadas en m, ángulo en rad. La rotación preserva distancias (transformación ortogonal)"
-        )
-        
-        # Ecuación 6: Componentes de Gravedad en Terreno Inclinado
-        self._crear_seccion_ecuacion(
-            parent,
-            "6. Componentes de Gravedad en Plano Inclinado",
-            r"g_{\perp} = g \cos(\theta_{pitch}), \quad g_{\parallel} = g \sin(\theta_{pitch})",
-            {
-                "g_⊥": "Componente de gravedad perpendicular al plano [m/s²]",
-                "g_∥": "Componente de gravedad paralela al plano [m/s²]",
-                "g": "Aceleración gravitacional (9.81 m/s²)",
-                "θ_pitch": "Ángulo de inclinación del terreno [rad]"
-            },
-            "Descomposición del vector gravedad en componentes normal y tangencial respecto "
-            "al plano inclinado. La componente perpendicular afecta las fuerzas normales, "
-            "mientras que la paralela genera una fuerza tangencial que el robot debe vencer. "
-            "Proviene de la geometría vectorial.",
-            "SI: aceleraciones en m/s², ángulo en rad"
-        )
-        
-        # Ecuación 7: Momento de Inercia Simplificado
-        self._crear_seccion_ecuacion(
-            parent,
-            "7. Momento de Inercia (Aproximación)",
-            r"I_z \approx \frac{m}{12}(L^2 + W^2)",
-            {
-                "I_z": "Momento de inercia respecto al eje Z [kg·m²]",
-                "m": "Masa del robot [kg]",
-                "L": "Largo del robot [m]",
-                "W": "Ancho del robot [m]"
-            },
-            "Aproximación del momento de inercia del robot como una placa rectangular homogénea. "
-            "Se usa para relacionar torque angular con aceleración angular (τ = I·α). En este "
-            "proyecto se asume distribución de masa simplificada. Útil para análisis dinámico "
-            "más detallado.",
-            "SI: momento de inercia en kg·m², masa en kg, dimensiones en m"
-        )
-
+        for ecuacion in _ECUACIONES_GEOMETRICAS:
+            self._crear_seccion_ecuacion(parent, *ecuacion)
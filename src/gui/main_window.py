@@ -3,9 +3,13 @@ Ventana principal de la aplicación.
 Integra todos los componentes: parámetros, visualizaciones, monitoreo.
 """
 
+import logging
+import math
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
+from enum import IntFlag
+from types import MappingProxyType
 
 from ..models import (DiferencialCentrado, DiferencialDescentrado,
                       CuatroRuedasCentrado, CuatroRuedasDescentrado)
@@ -17,11 +21,71 @@ from .tabla_resultados import TablaResultados
 from .ecuaciones import VisualizadorEcuaciones
 
 
+_log = logging.getLogger(__name__)
+
+
+# Factores de conversión a SI de cada familia de unidades {unidad: factor_a_SI},
+# compartidos (de solo lectura) por todos los controles de parámetros
+_FACTORES_LONGITUD = MappingProxyType({'m': 1.0, 'cm': 0.01})
+_FACTORES_MASA = MappingProxyType({'kg': 1.0, 'g': 0.001})
+_FACTORES_VELOCIDAD = MappingProxyType({'m/s': 1.0, 'km/h': 0.277778})
+_FACTORES_VELOCIDAD_ANGULAR = MappingProxyType({'rad/s': 1.0, 'deg/s': 0.0174533})
+_FACTORES_ANGULO = MappingProxyType({'deg': 1.0, 'rad': 57.2958})
+_FACTORES_TIEMPO = MappingProxyType({'s': 1.0})
+_FACTORES_ADIMENSIONAL = MappingProxyType({'adim.': 1.0})
+
+
+class TipoRobot(IntFlag):
+    """Características del tipo de robot seleccionado."""
+    DIFERENCIAL = 1
+    CUATRO_RUEDAS = 2
+    CENTRADO = 4
+    DESCENTRADO = 8
+
+
+# Valor del selector de tipo de robot -> características
+_TIPOS_ROBOT = MappingProxyType({
+    'diferencial_centrado': TipoRobot.DIFERENCIAL | TipoRobot.CENTRADO,
+    'diferencial_descentrado': TipoRobot.DIFERENCIAL | TipoRobot.DESCENTRADO,
+    'cuatro_ruedas_centrado': TipoRobot.CUATRO_RUEDAS | TipoRobot.CENTRADO,
+    'cuatro_ruedas_descentrado': TipoRobot.CUATRO_RUEDAS | TipoRobot.DESCENTRADO
+})
+
+# Características -> clase del modelo de robot
+_CLASES_ROBOT = MappingProxyType({
+    TipoRobot.DIFERENCIAL | TipoRobot.CENTRADO: DiferencialCentrado,
+    TipoRobot.DIFERENCIAL | TipoRobot.DESCENTRADO: DiferencialDescentrado,
+    TipoRobot.CUATRO_RUEDAS | TipoRobot.CENTRADO: CuatroRuedasCentrado,
+    TipoRobot.CUATRO_RUEDAS | TipoRobot.DESCENTRADO: CuatroRuedasDescentrado
+})
+
+# Parámetros que recibe el constructor de cada modelo de robot
+_ARGUMENTOS_COMUNES = ('masa', 'coef_friccion', 'largo', 'ancho', 'radio_rueda')
+_ARGUMENTOS_DIFERENCIAL = ('distancia_ruedas', 'distancia_rueda_loca')
+_ARGUMENTOS_CUATRO_RUEDAS = ('distancia_ancho', 'distancia_largo')
+_ARGUMENTOS_DESCENTRADO = ('A', 'B', 'C')
+
+# Características -> claves de los argumentos del constructor
+_ARGUMENTOS_ROBOT = MappingProxyType({
+    TipoRobot.DIFERENCIAL | TipoRobot.CENTRADO:
+        _ARGUMENTOS_COMUNES + _ARGUMENTOS_DIFERENCIAL,
+    TipoRobot.DIFERENCIAL | TipoRobot.DESCENTRADO:
+        _ARGUMENTOS_COMUNES + _ARGUMENTOS_DIFERENCIAL + _ARGUMENTOS_DESCENTRADO,
+    TipoRobot.CUATRO_RUEDAS | TipoRobot.CENTRADO:
+        _ARGUMENTOS_COMUNES + _ARGUMENTOS_CUATRO_RUEDAS,
+    TipoRobot.CUATRO_RUEDAS | TipoRobot.DESCENTRADO:
+        _ARGUMENTOS_COMUNES + _ARGUMENTOS_CUATRO_RUEDAS + _ARGUMENTOS_DESCENTRADO
+})
+
+
 class VentanaPrincipal:
     """
     Ventana principal de la aplicación de simulación de robot móvil.
     """
     
+    # Etiqueta de eventos (bindtag) para la rueda del mouse en el panel de parámetros
+    ETIQUETA_SCROLL_PARAMETROS = 'ScrollParametros'
+    
     def __init__(self, root):
         """Inicializa la ventana principal."""
         self.root = root
@@ -45,15 +109,17 @@ class VentanaPrincipal:
         # Establecer tamaño mínimo de ventana para mantener usabilidad
         self.root.minsize(800, 600)
         
-        # Permitir maximizar
-        self.root.state('normal')
-        
         # Variables de estado
         self.robot = None
+        self._num_ruedas = None  # Fijo para cada robot creado
         self.motor_simulacion = None
         self.tipo_robot = tk.StringVar(value='diferencial_centrado')
+        self._tipo = _TIPOS_ROBOT[self.tipo_robot.get()]
         self.parametros = {}
         
+        # Actualizaciones de controles pendientes (dict usado como conjunto ordenado)
+        self._actualizaciones_pendientes = {}
+        
         # Visualizadores
         self.viz_2d = Visualizador2D()
         self.viz_3d = Visualizador3D()
@@ -61,8 +127,8 @@ class VentanaPrincipal:
         # Construir interfaz
         self._crear_interfaz()
         
-        # Inicializar parámetros por defecto
-        self._cargar_parametros_defecto()
+        # Inicializar parámetros por defecto tras el primer dibujado
+        self.root.after(0, self._cargar_parametros_defecto)
     
     def _crear_interfaz(self):
         """Crea la interfaz de usuario completa."""
@@ -85,20 +151,35 @@ class VentanaPrincipal:
         canvas_params.create_window((0, 0), window=self.frame_parametros, anchor='nw')
         canvas_params.configure(yscrollcommand=scrollbar_params.set)
         
-        # Habilitar scroll con rueda del mouse
-        def _on_mousewheel(event):
-            canvas_params.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        # Scroll con rueda del mouse - solo cuando el cursor está sobre el canvas
-        # Esto evita conflictos con otros widgets scrolleables
-        def _bind_wheel():
-            canvas_params.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def _unbind_wheel():
-            canvas_params.unbind_all("<MouseWheel>")
-        
-        canvas_params.bind("<Enter>", lambda e: _bind_wheel())
-        canvas_params.bind("<Leave>", lambda e: _unbind_wheel())
+        # Habilitar scroll con rueda del mouse; los eventos se acumulan y se
+        # aplican en un único desplazamiento cada 16 ms (un redibujado por cuadro)
+        self._scroll_acumulado = 0
+        self._scroll_id_pendiente = None
+        
+        def _aplicar_scroll():
+            unidades = int(-1*(self._scroll_acumulado/120))
+            self._scroll_acumulado = 0
+            self._scroll_id_pendiente = None
+            if unidades:
+                canvas_params.yview_scroll(unidades, "units")
+        
+        def _acumular_scroll(delta):
+            self._scroll_acumulado += delta
+            if self._scroll_id_pendiente is None:
+                self._scroll_id_pendiente = canvas_params.after(16, _aplicar_scroll)
+        
+        # Scroll con rueda del mouse - solo cuando el cursor está sobre el panel.
+        # Se enlaza una sola vez a una etiqueta de eventos propia del panel (ver
+        # _etiquetar_scroll_parametros) en lugar de instalar un bind_all global
+        # en cada <Enter>; esto evita conflictos con otros widgets scrolleables
+        canvas_params.bind_class(self.ETIQUETA_SCROLL_PARAMETROS, "<MouseWheel>",
+                                 lambda e: _acumular_scroll(e.delta))
+        
+        # En Linux la rueda genera <Button-4>/<Button-5> en lugar de <MouseWheel>
+        canvas_params.bind_class(self.ETIQUETA_SCROLL_PARAMETROS, "<Button-4>",
+                                 lambda e: _acumular_scroll(120))
+        canvas_params.bind_class(self.ETIQUETA_SCROLL_PARAMETROS, "<Button-5>",
+                                 lambda e: _acumular_scroll(-120))
         
         # Navegación por teclado para accesibilidad
         canvas_params.bind("<Up>", lambda e: canvas_params.yview_scroll(-1, "units"))
@@ -131,10 +212,23 @@ class VentanaPrincipal:
         
         # Crear controles de parámetros
         self._crear_controles_parametros()
+        self._etiquetar_scroll_parametros(canvas_params)
         
         # Crear pestañas de visualización
         self._crear_pestanas_visualizacion()
     
+    def _etiquetar_scroll_parametros(self, widget):
+        """
+        Añade la etiqueta de scroll del panel a un widget y a sus descendientes.
+        
+        La etiqueta va al final de los bindtags, de modo que la rueda se
+        procesa después de los enlaces propios de cada widget, igual que
+        con bind_all.
+        """
+        widget.bindtags(widget.bindtags() + (self.ETIQUETA_SCROLL_PARAMETROS,))
+        for hijo in widget.winfo_children():
+            self._etiquetar_scroll_parametros(hijo)
+    
     def _crear_controles_parametros(self):
         """Crea todos los controles de parámetros en el panel izquierdo."""
         # Título
@@ -153,9 +247,12 @@ class VentanaPrincipal:
             ('Cuatro Ruedas Descentrado', 'cuatro_ruedas_descentrado')
         ]
         
+        # Un único trace por variable en lugar de un command por Radiobutton
+        self.tipo_robot.trace_add('write', lambda *args: self._on_tipo_robot_change())
+        
         for texto, valor in tipos:
             rb = ttk.Radiobutton(frame_tipo, text=texto, variable=self.tipo_robot,
-                                value=valor, command=self._on_tipo_robot_change)
+                                value=valor)
             rb.pack(anchor='w', pady=2)
         
         # Parámetros físicos
@@ -165,34 +262,44 @@ class VentanaPrincipal:
         
         self.param_masa = ParametroControl(
             frame_fisicos, "Masa", (0.1, 100), 10.0,
-            ['kg', 'g'], 'kg', {'kg': 1.0, 'g': 0.001}
+            ['kg', 'g'], 'kg', _FACTORES_MASA
         )
         self.param_masa.pack(fill='x', pady=2)
         
         self.param_coef_friccion = ParametroControl(
             frame_fisicos, "Coef. fricción estático", (0.0, 2.0), 0.5,
-            ['adim.'], 'adim.', {'adim.': 1.0}
+            ['adim.'], 'adim.', _FACTORES_ADIMENSIONAL
         )
         self.param_coef_friccion.pack(fill='x', pady=2)
         
         self.param_largo = ParametroControl(
             frame_fisicos, "Largo", (0.1, 5.0), 0.8,
-            ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
         )
         self.param_largo.pack(fill='x', pady=2)
         
         self.param_ancho = ParametroControl(
             frame_fisicos, "Ancho", (0.1, 5.0), 0.6,
-            ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
         )
         self.param_ancho.pack(fill='x', pady=2)
         
         self.param_radio_rueda = ParametroControl(
             frame_fisicos, "Radio de rueda", (0.01, 0.5), 0.1,
-            ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
         )
         self.param_radio_rueda.pack(fill='x', pady=2)
         
+        # Controles de cada grupo como pares (clave del parámetro, control);
+        # los grupos dinámicos se rellenan en los métodos _actualizar_controles_*
+        self._controles_fisicos = [
+            ('masa', self.param_masa),
+            ('coef_friccion', self.param_coef_friccion),
+            ('largo', self.param_largo),
+            ('ancho', self.param_ancho),
+            ('radio_rueda', self.param_radio_rueda)
+        ]
+        
         # Parámetros de tren de rodaje (dinámicos según tipo)
         self.frame_rodaje = ttk.LabelFrame(self.frame_parametros,
                                           text="Tren de Rodaje", padding=10)
@@ -209,22 +316,19 @@ class VentanaPrincipal:
         frame_movimiento.pack(fill='x', padx=10, pady=5)
         
         self.modo_movimiento = tk.StringVar(value='A')
+        self.modo_movimiento.trace_add('write', lambda *args: self._on_modo_movimiento_change())
         
         rb_modo_a = ttk.Radiobutton(frame_movimiento, 
                                     text="Modo A: Rampa-Constante-Rampa",
-                                    variable=self.modo_movimiento, value='A',
-                                    command=self._on_modo_movimiento_change)
+                                    variable=self.modo_movimiento, value='A')
         rb_modo_a.pack(anchor='w', pady=2)
         
         rb_modo_b = ttk.Radiobutton(frame_movimiento,
                                     text="Modo B: Velocidades Fijas",
-                                    variable=self.modo_movimiento, value='B',
-                                    command=self._on_modo_movimiento_change)
+                                    variable=self.modo_movimiento, value='B')
         rb_modo_b.pack(anchor='w', pady=2)
         
         self.frame_modo_a = ttk.Frame(frame_movimiento)
-        self.frame_modo_a.pack(fill='x', pady=5)
-        
         self.frame_modo_b = ttk.Frame(frame_movimiento)
         
         # Perfil de terreno
@@ -233,20 +337,18 @@ class VentanaPrincipal:
         frame_terreno.pack(fill='x', padx=10, pady=5)
         
         self.tipo_terreno = tk.IntVar(value=1)
+        self.tipo_terreno.trace_add('write', lambda *args: self._on_tipo_terreno_change())
         
         rb_plano = ttk.Radiobutton(frame_terreno, text="Plano",
-                                   variable=self.tipo_terreno, value=1,
-                                   command=self._on_tipo_terreno_change)
+                                   variable=self.tipo_terreno, value=1)
         rb_plano.pack(anchor='w', pady=2)
         
         rb_simple = ttk.Radiobutton(frame_terreno, text="Inclinación Simple",
-                                    variable=self.tipo_terreno, value=2,
-                                    command=self._on_tipo_terreno_change)
+                                    variable=self.tipo_terreno, value=2)
         rb_simple.pack(anchor='w', pady=2)
         
         rb_compuesto = ttk.Radiobutton(frame_terreno, text="Inclinación Compuesta",
-                                       variable=self.tipo_terreno, value=3,
-                                       command=self._on_tipo_terreno_change)
+                                       variable=self.tipo_terreno, value=3)
         rb_compuesto.pack(anchor='w', pady=2)
         
         self.frame_terreno_params = ttk.Frame(frame_terreno)
@@ -257,7 +359,8 @@ class VentanaPrincipal:
                                 command=self._aplicar_parametros)
         btn_aplicar.pack(pady=10)
         
-        # Inicializar controles dinámicos
+        # Crear y mostrar controles dinámicos
+        self._crear_controles_dinamicos()
         self._actualizar_controles_rodaje()
         self._actualizar_controles_centro_masa()
         self._actualizar_controles_movimiento()
@@ -297,10 +400,7 @@ class VentanaPrincipal:
         self.tab_tabla = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_tabla, text="Tabla de Resultados")
         
-        self.tabla_resultados = TablaResultados(self.tab_tabla)
-        self.tabla_resultados.pack(fill='both', expand=True)
-        
-        # Pestaña: 3D (se habilitará según terreno)
+        # Pestaña: 3D (solo visible con terreno inclinado; ver _actualizar_pestana_3d)
         self.tab_3d = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_3d, text="Vista 3D")
         
@@ -308,332 +408,415 @@ class VentanaPrincipal:
         self.tab_ecuaciones = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_ecuaciones, text="Ecuaciones")
         
+        # La tabla y las ecuaciones se construyen al abrir su pestaña por primera vez
+        self.tabla_resultados = None
+        self.visualizador_ecuaciones = None
+        self._pestanas_diferidas = {
+            str(self.tab_tabla): self._construir_tabla_resultados,
+            str(self.tab_ecuaciones): self._construir_visualizador_ecuaciones
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_cambio_pestana)
+        
+        self._actualizar_pestana_3d()
+    
+    def _actualizar_pestana_3d(self):
+        """
+        Oculta la pestaña 3D con terreno plano y la muestra con terreno inclinado.
+        
+        Sigue al terreno de los parámetros aplicados (el que usa la vista 3D),
+        no a la selección aún sin aplicar. La pestaña se oculta con
+        notebook.hide() y se vuelve a mostrar en su posición original con
+        notebook.add(), sin destruir su contenido.
+        """
+        if self.parametros.get('tipo_terreno', 1) == 1:
+            self.notebook.hide(self.tab_3d)
+        else:
+            self.notebook.add(self.tab_3d)
+    
+    def _on_cambio_pestana(self, event=None):
+        """Construye el contenido de una pestaña diferida la primera vez que se abre."""
+        construir = self._pestanas_diferidas.pop(self.notebook.select(), None)
+        if construir is not None:
+            construir()
+    
+    def _construir_tabla_resultados(self):
+        """Crea la tabla de resultados y la rellena con el historial existente."""
+        self.tabla_resultados = TablaResultados(self.tab_tabla)
+        self.tabla_resultados.pack(fill='both', expand=True)
+        
+        if self.robot:
+            self.tabla_resultados.actualizar(self.robot.get_historial(), self._num_ruedas)
+    
+    def _construir_visualizador_ecuaciones(self):
+        """Crea el visualizador de ecuaciones."""
         self.visualizador_ecuaciones = VisualizadorEcuaciones(self.tab_ecuaciones)
         # No necesita pack, el visualizador ya se empaqueta internamente
     
-    def _actualizar_controles_rodaje(self):
-        """Actualiza controles de tren de rodaje según tipo de robot."""
-        # Limpiar controles existentes
-        for widget in self.frame_rodaje.winfo_children():
-            widget.destroy()
-        
-        tipo = self.tipo_robot.get()
-        
-        if 'diferencial' in tipo:
-            self.param_dist_ruedas = ParametroControl(
-                self.frame_rodaje, "Distancia entre ruedas", (0.1, 2.0), 0.4,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_dist_ruedas.pack(fill='x', pady=2)
-            
-            self.param_dist_rueda_loca = ParametroControl(
-                self.frame_rodaje, "Dist. rueda loca - eje", (0.05, 1.0), 0.2,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_dist_rueda_loca.pack(fill='x', pady=2)
-        
-        else:  # cuatro ruedas
-            self.param_dist_ancho = ParametroControl(
-                self.frame_rodaje, "Distancia ancho ruedas", (0.2, 2.0), 0.5,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_dist_ancho.pack(fill='x', pady=2)
+    def _crear_controles_dinamicos(self):
+        """
+        Crea una sola vez los controles de todas las variantes (tipo de robot,
+        modo de movimiento y terreno); al cambiar de opción solo se muestran
+        u ocultan, sin destruir ni recrear widgets.
+        """
+        # Tren de rodaje: robot diferencial
+        self.frame_rodaje_diferencial = ttk.Frame(self.frame_rodaje)
+        
+        self.param_dist_ruedas = ParametroControl(
+            self.frame_rodaje_diferencial, "Distancia entre ruedas", (0.1, 2.0), 0.4,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_dist_ruedas.pack(fill='x', pady=2)
+        
+        self.param_dist_rueda_loca = ParametroControl(
+            self.frame_rodaje_diferencial, "Dist. rueda loca - eje", (0.05, 1.0), 0.2,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_dist_rueda_loca.pack(fill='x', pady=2)
+        
+        # Tren de rodaje: robot de cuatro ruedas
+        self.frame_rodaje_cuatro_ruedas = ttk.Frame(self.frame_rodaje)
+        
+        self.param_dist_ancho = ParametroControl(
+            self.frame_rodaje_cuatro_ruedas, "Distancia ancho ruedas", (0.2, 2.0), 0.5,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_dist_ancho.pack(fill='x', pady=2)
+        
+        self.param_dist_largo = ParametroControl(
+            self.frame_rodaje_cuatro_ruedas, "Distancia largo ruedas", (0.2, 2.0), 0.7,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_dist_largo.pack(fill='x', pady=2)
+        
+        # Centro de masa: robot descentrado
+        self.frame_cm_descentrado = ttk.Frame(self.frame_centro_masa)
+        
+        self.param_A = ParametroControl(
+            self.frame_cm_descentrado, "A (despl. X)", (-0.5, 0.5), 0.0,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_A.pack(fill='x', pady=2)
+        
+        self.param_B = ParametroControl(
+            self.frame_cm_descentrado, "B (despl. Y)", (-0.5, 0.5), 0.0,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_B.pack(fill='x', pady=2)
+        
+        self.param_C = ParametroControl(
+            self.frame_cm_descentrado, "C (despl. Z)", (-0.5, 0.5), 0.0,
+            ['m', 'cm'], 'm', _FACTORES_LONGITUD
+        )
+        self.param_C.pack(fill='x', pady=2)
+        
+        # Centro de masa: robot centrado
+        self.label_cm_centrado = ttk.Label(self.frame_centro_masa,
+                                           text="Centro de masa en el origen\n(A=B=C=0)")
+        
+        # Modo A: Rampa-Constante-Rampa
+        self.param_v_objetivo = ParametroControl(
+            self.frame_modo_a, "Velocidad lineal objetivo", (0.0, 10.0), 1.0,
+            ['m/s', 'km/h'], 'm/s', _FACTORES_VELOCIDAD
+        )
+        self.param_v_objetivo.pack(fill='x', pady=2)
+        
+        self.param_omega_objetivo = ParametroControl(
+            self.frame_modo_a, "Velocidad angular objetivo", (-3.14, 3.14), 0.3,
+            ['rad/s', 'deg/s'], 'rad/s', _FACTORES_VELOCIDAD_ANGULAR
+        )
+        self.param_omega_objetivo.pack(fill='x', pady=2)
+        
+        self.param_t_acel = ParametroControl(
+            self.frame_modo_a, "Tiempo aceleración", (0.0, 20.0), 2.0,
+            ['s'], 's', _FACTORES_TIEMPO
+        )
+        self.param_t_acel.pack(fill='x', pady=2)
+        
+        self.param_t_const = ParametroControl(
+            self.frame_modo_a, "Tiempo constante", (0.0, 50.0), 5.0,
+            ['s'], 's', _FACTORES_TIEMPO
+        )
+        self.param_t_const.pack(fill='x', pady=2)
+        
+        self.param_t_decel = ParametroControl(
+            self.frame_modo_a, "Tiempo desaceleración", (0.0, 20.0), 2.0,
+            ['s'], 's', _FACTORES_TIEMPO
+        )
+        self.param_t_decel.pack(fill='x', pady=2)
+        
+        # Modo B: Velocidades Fijas
+        self.param_v_fija = ParametroControl(
+            self.frame_modo_b, "Velocidad lineal", (0.0, 10.0), 1.0,
+            ['m/s', 'km/h'], 'm/s', _FACTORES_VELOCIDAD
+        )
+        self.param_v_fija.pack(fill='x', pady=2)
+        
+        self.param_omega_fija = ParametroControl(
+            self.frame_modo_b, "Velocidad angular", (-3.14, 3.14), 0.0,
+            ['rad/s', 'deg/s'], 'rad/s', _FACTORES_VELOCIDAD_ANGULAR
+        )
+        self.param_omega_fija.pack(fill='x', pady=2)
+        
+        self.param_duracion = ParametroControl(
+            self.frame_modo_b, "Duración", (0.1, 100.0), 10.0,
+            ['s'], 's', _FACTORES_TIEMPO
+        )
+        self.param_duracion.pack(fill='x', pady=2)
+        
+        # Terreno inclinado (pitch en ambos casos, roll solo en compuesto)
+        self.param_angulo_pitch = ParametroControl(
+            self.frame_terreno_params, "Ángulo inclinación", (0.0, 90.0), 15.0,
+            ['deg', 'rad'], 'deg', _FACTORES_ANGULO
+        )
+        
+        self.param_angulo_roll = ParametroControl(
+            self.frame_terreno_params, "Ángulo roll", (0.0, 90.0), 10.0,
+            ['deg', 'rad'], 'deg', _FACTORES_ANGULO
+        )
+        
+        # Grupos de controles: {nombre: (frame, [(clave del parámetro, control), ...])}
+        self._grupos = {
+            'diferencial': (self.frame_rodaje_diferencial, [
+                ('distancia_ruedas', self.param_dist_ruedas),
+                ('distancia_rueda_loca', self.param_dist_rueda_loca)
+            ]),
+            'cuatro_ruedas': (self.frame_rodaje_cuatro_ruedas, [
+                ('distancia_ancho', self.param_dist_ancho),
+                ('distancia_largo', self.param_dist_largo)
+            ]),
+            'descentrado': (self.frame_cm_descentrado, [
+                ('A', self.param_A), ('B', self.param_B), ('C', self.param_C)
+            ]),
+            'centrado': (self.label_cm_centrado, []),
+            'modo_a': (self.frame_modo_a, [
+                ('velocidad_lineal_objetivo', self.param_v_objetivo),
+                ('velocidad_angular_objetivo', self.param_omega_objetivo),
+                ('tiempo_aceleracion', self.param_t_acel),
+                ('tiempo_constante', self.param_t_const),
+                ('tiempo_desaceleracion', self.param_t_decel)
+            ]),
+            'modo_b': (self.frame_modo_b, [
+                ('velocidad_lineal_fija', self.param_v_fija),
+                ('velocidad_angular_fija', self.param_omega_fija),
+                ('duracion', self.param_duracion)
+            ])
+        }
+    
+    def _mostrar_grupo(self, nombre, oculto, **opciones_pack):
+        """
+        Muestra un grupo de controles y oculta su alternativa.
+        
+        Args:
+            nombre: Grupo a mostrar
+            oculto: Grupo alternativo a ocultar
+            **opciones_pack: Opciones de pack del grupo mostrado
             
-            self.param_dist_largo = ParametroControl(
-                self.frame_rodaje, "Distancia largo ruedas", (0.2, 2.0), 0.7,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_dist_largo.pack(fill='x', pady=2)
+        Returns:
+            Lista de pares (clave del parámetro, control) del grupo mostrado
+        """
+        self._grupos[oculto][0].pack_forget()
+        widget, controles = self._grupos[nombre]
+        widget.pack(**opciones_pack)
+        return controles
+    
+    def _actualizar_controles_rodaje(self):
+        """Muestra los controles de tren de rodaje según tipo de robot."""
+        if self._tipo & TipoRobot.DIFERENCIAL:
+            self._controles_rodaje = self._mostrar_grupo('diferencial', 'cuatro_ruedas',
+                                                         fill='x')
+        else:
+            self._controles_rodaje = self._mostrar_grupo('cuatro_ruedas', 'diferencial',
+                                                         fill='x')
     
     def _actualizar_controles_centro_masa(self):
-        """Actualiza controles de centro de masa."""
-        # Limpiar controles existentes
-        for widget in self.frame_centro_masa.winfo_children():
-            widget.destroy()
-        
-        tipo = self.tipo_robot.get()
-        
-        if 'descentrado' in tipo:
-            self.param_A = ParametroControl(
-                self.frame_centro_masa, "A (despl. X)", (-0.5, 0.5), 0.0,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_A.pack(fill='x', pady=2)
-            
-            self.param_B = ParametroControl(
-                self.frame_centro_masa, "B (despl. Y)", (-0.5, 0.5), 0.0,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_B.pack(fill='x', pady=2)
-            
-            self.param_C = ParametroControl(
-                self.frame_centro_masa, "C (despl. Z)", (-0.5, 0.5), 0.0,
-                ['m', 'cm'], 'm', {'m': 1.0, 'cm': 0.01}
-            )
-            self.param_C.pack(fill='x', pady=2)
+        """Muestra los controles de centro de masa según tipo de robot."""
+        if self._tipo & TipoRobot.DESCENTRADO:
+            self._controles_centro_masa = self._mostrar_grupo('descentrado', 'centrado',
+                                                              fill='x')
         else:
-            label = ttk.Label(self.frame_centro_masa,
-                             text="Centro de masa en el origen\n(A=B=C=0)")
-            label.pack()
+            self._controles_centro_masa = self._mostrar_grupo('centrado', 'descentrado')
     
     def _actualizar_controles_movimiento(self):
-        """Actualiza controles de perfil de movimiento."""
-        # Limpiar ambos frames
-        for widget in self.frame_modo_a.winfo_children():
-            widget.destroy()
-        for widget in self.frame_modo_b.winfo_children():
-            widget.destroy()
-        
-        modo = self.modo_movimiento.get()
-        
-        if modo == 'A':
-            # Modo Rampa-Constante-Rampa
-            self.param_v_objetivo = ParametroControl(
-                self.frame_modo_a, "Velocidad lineal objetivo", (0.0, 10.0), 1.0,
-                ['m/s', 'km/h'], 'm/s', {'m/s': 1.0, 'km/h': 0.277778}
-            )
-            self.param_v_objetivo.pack(fill='x', pady=2)
-            
-            self.param_omega_objetivo = ParametroControl(
-                self.frame_modo_a, "Velocidad angular objetivo", (-3.14, 3.14), 0.3,
-                ['rad/s', 'deg/s'], 'rad/s', 
-                {'rad/s': 1.0, 'deg/s': 0.0174533}
-            )
-            self.param_omega_objetivo.pack(fill='x', pady=2)
-            
-            self.param_t_acel = ParametroControl(
-                self.frame_modo_a, "Tiempo aceleración", (0.0, 20.0), 2.0,
-                ['s'], 's', {'s': 1.0}
-            )
-            self.param_t_acel.pack(fill='x', pady=2)
-            
-            self.param_t_const = ParametroControl(
-                self.frame_modo_a, "Tiempo constante", (0.0, 50.0), 5.0,
-                ['s'], 's', {'s': 1.0}
-            )
-            self.param_t_const.pack(fill='x', pady=2)
-            
-            self.param_t_decel = ParametroControl(
-                self.frame_modo_a, "Tiempo desaceleración", (0.0, 20.0), 2.0,
-                ['s'], 's', {'s': 1.0}
-            )
-            self.param_t_decel.pack(fill='x', pady=2)
-            
-            self.frame_modo_a.pack(fill='x', pady=5)
-            self.frame_modo_b.pack_forget()
-        
+        """Muestra los controles del modo de movimiento seleccionado."""
+        if self.modo_movimiento.get() == 'A':
+            self._controles_movimiento = self._mostrar_grupo('modo_a', 'modo_b',
+                                                             fill='x', pady=5)
         else:
-            # Modo Velocidades Fijas
-            self.param_v_fija = ParametroControl(
-                self.frame_modo_b, "Velocidad lineal", (0.0, 10.0), 1.0,
-                ['m/s', 'km/h'], 'm/s', {'m/s': 1.0, 'km/h': 0.277778}
-            )
-            self.param_v_fija.pack(fill='x', pady=2)
-            
-            self.param_omega_fija = ParametroControl(
-                self.frame_modo_b, "Velocidad angular", (-3.14, 3.14), 0.0,
-                ['rad/s', 'deg/s'], 'rad/s',
-                {'rad/s': 1.0, 'deg/s': 0.0174533}
-            )
-            self.param_omega_fija.pack(fill='x', pady=2)
-            
-            self.param_duracion = ParametroControl(
-                self.frame_modo_b, "Duración", (0.1, 100.0), 10.0,
-                ['s'], 's', {'s': 1.0}
-            )
-            self.param_duracion.pack(fill='x', pady=2)
-            
-            self.frame_modo_b.pack(fill='x', pady=5)
-            self.frame_modo_a.pack_forget()
+            self._controles_movimiento = self._mostrar_grupo('modo_b', 'modo_a',
+                                                             fill='x', pady=5)
     
     def _actualizar_controles_terreno(self):
-        """Actualiza controles de perfil de terreno."""
-        # Limpiar controles existentes
-        for widget in self.frame_terreno_params.winfo_children():
-            widget.destroy()
-        
+        """Muestra los controles de ángulos según el perfil de terreno."""
         tipo = self.tipo_terreno.get()
         
+        self.param_angulo_pitch.pack_forget()
+        self.param_angulo_roll.pack_forget()
+        self._controles_terreno = []
+        
         if tipo == 2:
             # Inclinación simple
-            self.param_angulo_pitch = ParametroControl(
-                self.frame_terreno_params, "Ángulo inclinación", (0.0, 90.0), 15.0,
-                ['deg', 'rad'], 'deg', {'deg': 1.0, 'rad': 57.2958}
-            )
+            self.param_angulo_pitch.label.configure(text="Ángulo inclinación")
             self.param_angulo_pitch.pack(fill='x', pady=2)
+            
+            self._controles_terreno = [('angulo_pitch', self.param_angulo_pitch)]
         
         elif tipo == 3:
             # Inclinación compuesta
-            self.param_angulo_pitch = ParametroControl(
-                self.frame_terreno_params, "Ángulo pitch", (0.0, 90.0), 15.0,
-                ['deg', 'rad'], 'deg', {'deg': 1.0, 'rad': 57.2958}
-            )
+            self.param_angulo_pitch.label.configure(text="Ángulo pitch")
             self.param_angulo_pitch.pack(fill='x', pady=2)
-            
-            self.param_angulo_roll = ParametroControl(
-                self.frame_terreno_params, "Ángulo roll", (0.0, 90.0), 10.0,
-                ['deg', 'rad'], 'deg', {'deg': 1.0, 'rad': 57.2958}
-            )
             self.param_angulo_roll.pack(fill='x', pady=2)
+            
+            self._controles_terreno = [
+                ('angulo_pitch', self.param_angulo_pitch),
+                ('angulo_roll', self.param_angulo_roll)
+            ]
     
     def _on_tipo_robot_change(self):
         """Maneja cambio en el tipo de robot."""
-        self._actualizar_controles_rodaje()
-        self._actualizar_controles_centro_masa()
+        self._tipo = _TIPOS_ROBOT[self.tipo_robot.get()]
+        self._programar_actualizacion(self._actualizar_controles_rodaje,
+                                      self._actualizar_controles_centro_masa)
     
     def _on_modo_movimiento_change(self):
         """Maneja cambio en el modo de movimiento."""
-        self._actualizar_controles_movimiento()
+        self._programar_actualizacion(self._actualizar_controles_movimiento)
     
     def _on_tipo_terreno_change(self):
         """Maneja cambio en el tipo de terreno."""
-        self._actualizar_controles_terreno()
+        self._programar_actualizacion(self._actualizar_controles_terreno)
+    
+    def _programar_actualizacion(self, *actualizaciones):
+        """
+        Encola actualizaciones de controles para el próximo ciclo inactivo.
+        
+        Los cambios rápidos y sucesivos (p. ej. recorrer las opciones con el
+        teclado) se agrupan y cada actualización se ejecuta una sola vez con
+        la selección final.
+        """
+        if not self._actualizaciones_pendientes:
+            self.root.after_idle(self._ejecutar_actualizaciones)
+        self._actualizaciones_pendientes.update(dict.fromkeys(actualizaciones))
+    
+    def _ejecutar_actualizaciones(self):
+        """Ejecuta las actualizaciones de controles encoladas."""
+        pendientes, self._actualizaciones_pendientes = self._actualizaciones_pendientes, {}
+        for actualizacion in pendientes:
+            actualizacion()
     
     def _cargar_parametros_defecto(self):
-        """Carga parámetros por defecto al iniciar."""
-        self._aplicar_parametros()
+        """Carga parámetros por defecto al iniciar (sin escribir en el log)."""
+        self._aplicar_parametros(silencioso=True)
     
-    def _aplicar_parametros(self):
-        """Aplica los parámetros actuales y crea el robot."""
-        self.panel_monitoreo.agregar_log("Aplicando parámetros...", "info")
+    def _aplicar_parametros(self, silencioso: bool = False):
+        """
+        Aplica los parámetros actuales y crea el robot.
         
-        # Recopilar todos los parámetros
+        Args:
+            silencioso: Si es True, no registra los parámetros en el log
+        """
+        # Recopilar todos los parámetros de los controles visibles
         params = {}
+        for controles in (self._controles_fisicos, self._controles_rodaje,
+                          self._controles_centro_masa, self._controles_movimiento,
+                          self._controles_terreno):
+            for clave, control in controles:
+                params[clave] = control.get_valor_si()
         
-        # Físicos
-        params['masa'] = self.param_masa.get_valor_si()
-        params['coef_friccion'] = self.param_coef_friccion.get_valor_si()
-        params['largo'] = self.param_largo.get_valor_si()
-        params['ancho'] = self.param_ancho.get_valor_si()
-        params['radio_rueda'] = self.param_radio_rueda.get_valor_si()
-        
-        # Tren de rodaje
-        tipo = self.tipo_robot.get()
-        if 'diferencial' in tipo:
-            params['distancia_ruedas'] = self.param_dist_ruedas.get_valor_si()
-            params['distancia_rueda_loca'] = self.param_dist_rueda_loca.get_valor_si()
-        else:
-            params['distancia_ancho'] = self.param_dist_ancho.get_valor_si()
-            params['distancia_largo'] = self.param_dist_largo.get_valor_si()
-        
-        # Centro de masa
-        if 'descentrado' in tipo:
-            params['A'] = self.param_A.get_valor_si()
-            params['B'] = self.param_B.get_valor_si()
-            params['C'] = self.param_C.get_valor_si()
-        
-        # Perfil de movimiento
+        params['tipo'] = self.tipo_robot.get()
         params['modo_movimiento'] = self.modo_movimiento.get()
-        if params['modo_movimiento'] == 'A':
-            params['velocidad_lineal_objetivo'] = self.param_v_objetivo.get_valor_si()
-            params['velocidad_angular_objetivo'] = self.param_omega_objetivo.get_valor_si()
-            params['tiempo_aceleracion'] = self.param_t_acel.get_valor_si()
-            params['tiempo_constante'] = self.param_t_const.get_valor_si()
-            params['tiempo_desaceleracion'] = self.param_t_decel.get_valor_si()
-        else:
-            params['velocidad_lineal_fija'] = self.param_v_fija.get_valor_si()
-            params['velocidad_angular_fija'] = self.param_omega_fija.get_valor_si()
-            params['duracion'] = self.param_duracion.get_valor_si()
-        
-        # Perfil de terreno
         params['tipo_terreno'] = self.tipo_terreno.get()
-        if params['tipo_terreno'] >= 2:
-            params['angulo_pitch'] = self.param_angulo_pitch.get_valor_si()
-        else:
-            params['angulo_pitch'] = 0.0
         
-        if params['tipo_terreno'] == 3:
-            params['angulo_roll'] = self.param_angulo_roll.get_valor_si()
-        else:
-            params['angulo_roll'] = 0.0
+        # Sin inclinación, los ángulos ausentes valen cero
+        params.setdefault('angulo_pitch', 0.0)
+        params.setdefault('angulo_roll', 0.0)
         
         # Guardar parámetros
         self.parametros = params
+        self._actualizar_pestana_3d()
+        
+        if silencioso:
+            return
         
-        # Registrar parámetros aplicados
-        tipo_robot = self.tipo_robot.get()
-        self.panel_monitoreo.agregar_log(f"Tipo de robot: {tipo_robot}", "info")
-        self.panel_monitoreo.agregar_log(f"Masa: {params['masa']:.2f} kg", "info")
-        self.panel_monitoreo.agregar_log(f"Coef. fricción: {params['coef_friccion']:.2f}", "info")
-        self.panel_monitoreo.agregar_log(f"Modo movimiento: {params['modo_movimiento']}", "info")
-        self.panel_monitoreo.agregar_log(f"Tipo terreno: {params['tipo_terreno']}", "info")
-        self.panel_monitoreo.agregar_log("✓ Parámetros aplicados correctamente", "success")
+        # Registrar parámetros aplicados (una sola escritura en el log)
+        self.panel_monitoreo.agregar_logs([
+            ("Aplicando parámetros...", "info"),
+            (f"Tipo de robot: {params['tipo']}", "info"),
+            (f"Masa: {params['masa']:.2f} kg", "info"),
+            (f"Coef. fricción: {params['coef_friccion']:.2f}", "info"),
+            (f"Modo movimiento: {params['modo_movimiento']}", "info"),
+            (f"Tipo terreno: {params['tipo_terreno']}", "info"),
+            ("✓ Parámetros aplicados correctamente", "success")
+        ])
     
     def _crear_robot(self):
-        """Crea la instancia del robot según el tipo seleccionado."""
-        tipo = self.tipo_robot.get()
+        """Crea la instancia del robot según el tipo de los parámetros aplicados."""
         params = self.parametros
+        tipo = _TIPOS_ROBOT[params['tipo']]
+        
+        argumentos = {clave: params[clave] for clave in _ARGUMENTOS_ROBOT[tipo]}
         
-        if tipo == 'diferencial_centrado':
-            self.robot = DiferencialCentrado(
-                masa=params['masa'],
-                coef_friccion=params['coef_friccion'],
-                largo=params['largo'],
-                ancho=params['ancho'],
-                radio_rueda=params['radio_rueda'],
-                distancia_ruedas=params['distancia_ruedas'],
-                distancia_rueda_loca=params['distancia_rueda_loca']
-            )
-        
-        elif tipo == 'diferencial_descentrado':
-            self.robot = DiferencialDescentrado(
-                masa=params['masa'],
-                coef_friccion=params['coef_friccion'],
-                largo=params['largo'],
-                ancho=params['ancho'],
-                radio_rueda=params['radio_rueda'],
-                distancia_ruedas=params['distancia_ruedas'],
-                distancia_rueda_loca=params['distancia_rueda_loca'],
-                A=params['A'],
-                B=params['B'],
-                C=params['C']
-            )
-        
-        elif tipo == 'cuatro_ruedas_centrado':
-            self.robot = CuatroRuedasCentrado(
-                masa=params['masa'],
-                coef_friccion=params['coef_friccion'],
-                largo=params['largo'],
-                ancho=params['ancho'],
-                radio_rueda=params['radio_rueda'],
-                distancia_ancho=params['distancia_ancho'],
-                distancia_largo=params['distancia_largo']
-            )
-        
-        else:  # cuatro_ruedas_descentrado
-            self.robot = CuatroRuedasDescentrado(
-                masa=params['masa'],
-                coef_friccion=params['coef_friccion'],
-                largo=params['largo'],
-                ancho=params['ancho'],
-                radio_rueda=params['radio_rueda'],
-                distancia_ancho=params['distancia_ancho'],
-                distancia_largo=params['distancia_largo'],
-                A=params['A'],
-                B=params['B'],
-                C=params['C']
-            )
+        self.robot = _CLASES_ROBOT[tipo](**argumentos)
+        self._num_ruedas = self.robot.get_numero_ruedas()
     
     def _iniciar_simulacion(self):
         """Inicia la simulación."""
-        self.panel_monitoreo.agregar_log("=== INICIANDO SIMULACIÓN ===", "info")
+        # Validar parámetros (con el tipo guardado al aplicarlos)
+        tipo = self.parametros['tipo']
+        self.panel_monitoreo.agregar_logs([
+            ("=== INICIANDO SIMULACIÓN ===", "info"),
+            (f"Validando parámetros para {tipo}...", "info")
+        ])
+        
+        # Validar en un hilo aparte para no bloquear la interfaz; el botón
+        # Iniciar queda deshabilitado hasta recibir el resultado
+        self.panel_monitoreo.btn_iniciar.config(state='disabled')
+        parametros = self.parametros
+        
+        def validar():
+            try:
+                es_valido, mensaje_error = ValidadorParametros.validar(tipo, parametros)
+            except Exception as e:
+                # Un error inesperado se notifica como validación fallida, para
+                # que el botón Iniciar vuelva a habilitarse
+                _log.exception("Error validando parámetros")
+                es_valido, mensaje_error = False, f"Error validando parámetros: {e}"
+            # Continuar en el hilo principal de Tkinter
+            self.root.after(0, self._on_validacion_terminada,
+                            parametros, es_valido, mensaje_error)
+        
+        threading.Thread(target=validar, daemon=True).start()
+    
+    def _on_validacion_terminada(self, parametros: dict, es_valido: bool, mensaje_error):
+        """
+        Continúa el inicio de la simulación con el resultado de la validación.
         
-        # Validar parámetros
-        tipo = self.tipo_robot.get()
-        self.panel_monitoreo.agregar_log(f"Validando parámetros para {tipo}...", "info")
+        Args:
+            parametros: Parámetros que se validaron
+            es_valido: True si los parámetros son válidos
+            mensaje_error: Descripción del error, o None si son válidos
+        """
+        # Si se aplicaron otros parámetros durante la validación, validarlos de nuevo
+        if parametros is not self.parametros:
+            self._iniciar_simulacion()
+            return
         
-        es_valido, mensaje_error = ValidadorParametros.validar(tipo, self.parametros)
+        tipo = parametros['tipo']
         
         if not es_valido:
-            self.panel_monitoreo.agregar_log("✗ Validación fallida", "error")
-            self.panel_monitoreo.agregar_log(mensaje_error, "error")
+            self.panel_monitoreo.btn_iniciar.config(state='normal')
+            self.panel_monitoreo.agregar_logs([
+                ("✗ Validación fallida", "error"),
+                (mensaje_error, "error")
+            ])
             messagebox.showerror("Error de Validación", mensaje_error)
             return
         
-        self.panel_monitoreo.agregar_log("✓ Validación exitosa", "success")
+        self.panel_monitoreo.agregar_logs([
+            ("✓ Validación exitosa", "success"),
+            ("Creando instancia del robot...", "info")
+        ])
         
         # Crear robot
-        self.panel_monitoreo.agregar_log("Creando instancia del robot...", "info")
         self._crear_robot()
         self.panel_monitoreo.agregar_log(f"✓ Robot creado: {tipo}", "success")
         
@@ -648,7 +831,8 @@ class VentanaPrincipal:
             self.robot,
             self.parametros,
             callback_actualizacion=self._actualizar_visualizaciones,
-            callback_finalizacion=self._finalizar_simulacion
+            callback_finalizacion=self._finalizar_simulacion,
+            root=self.root
         )
         self.panel_monitoreo.agregar_log("✓ Motor de simulación configurado", "success")
         
@@ -673,14 +857,16 @@ class VentanaPrincipal:
         def actualizar_gui():
             if exitoso:
                 self.panel_monitoreo.set_estado("Completado ✓", "success")
-                self.panel_monitoreo.agregar_log("", "info")  # Línea en blanco
-                self.panel_monitoreo.agregar_log("=" * 50, "success")
-                self.panel_monitoreo.agregar_log("     SIMULACIÓN COMPLETADA EXITOSAMENTE", "success")
-                self.panel_monitoreo.agregar_log("=" * 50, "success")
-                self.panel_monitoreo.agregar_log(mensaje, "success")
-                self.panel_monitoreo.agregar_log("✓ Todas las gráficas han sido generadas", "success")
-                self.panel_monitoreo.agregar_log("✓ Los resultados están disponibles en las pestañas", "success")
-                self.panel_monitoreo.agregar_log("", "info")
+                self.panel_monitoreo.agregar_logs([
+                    ("", "info"),  # Línea en blanco
+                    ("=" * 50, "success"),
+                    ("     SIMULACIÓN COMPLETADA EXITOSAMENTE", "success"),
+                    ("=" * 50, "success"),
+                    (mensaje, "success"),
+                    ("✓ Todas las gráficas han sido generadas", "success"),
+                    ("✓ Los resultados están disponibles en las pestañas", "success"),
+                    ("", "info")
+                ])
                 
                 # Mostrar notificación
                 messagebox.showinfo(
@@ -690,11 +876,13 @@ class VentanaPrincipal:
                 )
             else:
                 self.panel_monitoreo.set_estado("Error ✗", "error")
-                self.panel_monitoreo.agregar_log("", "info")
-                self.panel_monitoreo.agregar_log("=" * 50, "error")
-                self.panel_monitoreo.agregar_log("     ERROR EN LA SIMULACIÓN", "error")
-                self.panel_monitoreo.agregar_log("=" * 50, "error")
-                self.panel_monitoreo.agregar_log(mensaje, "error")
+                self.panel_monitoreo.agregar_logs([
+                    ("", "info"),
+                    ("=" * 50, "error"),
+                    ("     ERROR EN LA SIMULACIÓN", "error"),
+                    ("=" * 50, "error"),
+                    (mensaje, "error")
+                ])
                 
                 messagebox.showerror("Error en Simulación", mensaje)
             
@@ -733,7 +921,8 @@ class VentanaPrincipal:
         self.panel_monitoreo.agregar_log("Limpiando visualizaciones...", "info")
         self.viz_2d.limpiar_todas()
         self.viz_3d.limpiar()
-        self.tabla_resultados.limpiar()
+        if self.tabla_resultados is not None:
+            self.tabla_resultados.limpiar()
         self.panel_monitoreo.agregar_log("✓ Visualizaciones limpiadas", "success")
         
         self.panel_monitoreo.set_estado("Listo", "info")
@@ -741,74 +930,66 @@ class VentanaPrincipal:
         self.panel_monitoreo.agregar_log("✓ Sistema listo para nueva simulación", "success")
     
     def _inicializar_visualizaciones(self):
-        """Inicializa las visualizaciones en las pestañas."""
-        num_ruedas = self.robot.get_numero_ruedas()
-        
-        # Limpiar pestañas
-        for widget in self.tab_trayectoria.winfo_children():
-            widget.destroy()
-        for widget in self.tab_vel_robot.winfo_children():
-            widget.destroy()
-        for widget in self.tab_vel_ruedas.winfo_children():
-            widget.destroy()
-        for widget in self.tab_fuerzas.winfo_children():
-            widget.destroy()
-        for widget in self.tab_aceleraciones.winfo_children():
-            widget.destroy()
-        for widget in self.tab_torque.winfo_children():
-            widget.destroy()
-        for widget in self.tab_potencia.winfo_children():
-            widget.destroy()
-        for widget in self.tab_3d.winfo_children():
-            widget.destroy()
-        
-        # Crear y empaquetar visualizaciones
-        widget_traj = self.viz_2d.crear_figura_trayectoria(self.tab_trayectoria)
-        widget_traj.pack(fill='both', expand=True)
-        
-        widget_vel = self.viz_2d.crear_figura_velocidad_robot(self.tab_vel_robot)
-        widget_vel.pack(fill='both', expand=True)
-        
-        widget_vr = self.viz_2d.crear_figura_velocidad_ruedas(self.tab_vel_ruedas, num_ruedas)
-        widget_vr.pack(fill='both', expand=True)
-        
-        widget_f = self.viz_2d.crear_figura_fuerzas(self.tab_fuerzas, num_ruedas)
-        widget_f.pack(fill='both', expand=True)
-        
-        widget_a = self.viz_2d.crear_figura_aceleraciones(self.tab_aceleraciones)
-        widget_a.pack(fill='both', expand=True)
-        
-        widget_t = self.viz_2d.crear_figura_torque(self.tab_torque, num_ruedas)
-        widget_t.pack(fill='both', expand=True)
-        
-        widget_p = self.viz_2d.crear_figura_potencia(self.tab_potencia, num_ruedas)
-        widget_p.pack(fill='both', expand=True)
-        
-        widget_3d = self.viz_3d.crear_figura_3d(self.tab_3d)
-        widget_3d.pack(fill='both', expand=True)
+        """
+        Prepara las visualizaciones para una nueva simulación.
+        
+        Las figuras se crean en la primera simulación y en las siguientes solo
+        se limpian; las que dependen del número de ruedas se recrean si cambia.
+        """
+        num_ruedas = self._num_ruedas
+        figuras = self.viz_2d.figuras
+        
+        if figuras:
+            self.viz_2d.limpiar_todas()
+            self.viz_3d.limpiar()
+        else:
+            widget_traj = self.viz_2d.crear_figura_trayectoria(self.tab_trayectoria)
+            widget_traj.pack(fill='both', expand=True)
+            
+            widget_vel = self.viz_2d.crear_figura_velocidad_robot(self.tab_vel_robot)
+            widget_vel.pack(fill='both', expand=True)
+            
+            widget_a = self.viz_2d.crear_figura_aceleraciones(self.tab_aceleraciones)
+            widget_a.pack(fill='both', expand=True)
+            
+            widget_3d = self.viz_3d.crear_figura_3d(self.tab_3d)
+            widget_3d.pack(fill='both', expand=True)
+        
+        # Figuras con una serie por rueda
+        for nombre, tab, crear_figura in (
+                ('velocidad_ruedas', self.tab_vel_ruedas, self.viz_2d.crear_figura_velocidad_ruedas),
+                ('fuerzas', self.tab_fuerzas, self.viz_2d.crear_figura_fuerzas),
+                ('torque', self.tab_torque, self.viz_2d.crear_figura_torque),
+                ('potencia', self.tab_potencia, self.viz_2d.crear_figura_potencia)):
+            if nombre in figuras and figuras[nombre]['num_ruedas'] == num_ruedas:
+                continue
+            
+            for widget in tab.winfo_children():
+                widget.destroy()
+            crear_figura(tab, num_ruedas).pack(fill='both', expand=True)
         
         # Forzar actualización de geometría
         self.root.update_idletasks()
     
     def _actualizar_visualizaciones(self):
-        """Actualiza todas las visualizaciones con los datos actuales."""
+        """
+        Actualiza todas las visualizaciones con los datos actuales.
+        
+        El motor de simulación la ejecuta en el hilo principal de Tkinter.
+        """
         if not self.robot:
-            print("[DEBUG] No hay robot para actualizar")
+            _log.debug("No hay robot para actualizar")
             return
         
         historial = self.robot.get_historial()
-        num_ruedas = self.robot.get_numero_ruedas()
         
-        print(f"[DEBUG] Callback: {len(historial.get('tiempo', []))} puntos en historial")
+        _log.debug("Callback: %d puntos en historial", len(historial['tiempo']))
         
-        # Actualizar en el hilo principal de Tkinter
-        self.root.after(0, self._actualizar_graficas_thread_safe, historial, num_ruedas)
+        self._actualizar_graficas_thread_safe(historial, self._num_ruedas)
     
     def _actualizar_graficas_thread_safe(self, historial, num_ruedas):
         """Actualiza gráficas de forma segura desde el hilo de Tkinter."""
         try:
-            print(f"[DEBUG] Actualizando gráficas thread-safe con {len(historial.get('tiempo', []))} puntos")
-            
             self.viz_2d.actualizar_trayectoria(historial)
             self.viz_2d.actualizar_velocidad_robot(historial)
             self.viz_2d.actualizar_velocidad_ruedas(historial)
@@ -816,21 +997,20 @@ class VentanaPrincipal:
             self.viz_2d.actualizar_aceleraciones(historial)
             self.viz_2d.actualizar_torque(historial)
             self.viz_2d.actualizar_potencia(historial)
-            self.tabla_resultados.actualizar(historial, num_ruedas)
+            if self.tabla_resultados is not None:
+                self.tabla_resultados.actualizar(historial, num_ruedas)
             
             # Actualizar 3D si hay inclinación
             if self.parametros.get('tipo_terreno', 1) > 1:
                 pitch = self.parametros.get('angulo_pitch', 0)
                 roll = self.parametros.get('angulo_roll', 0)
-                self.viz_3d.actualizar_3d(historial, np.deg2rad(pitch),
-                                          np.deg2rad(roll),
+                self.viz_3d.actualizar_3d(historial, math.radians(pitch),
+                                          math.radians(roll),
                                           self.parametros.get('tipo_terreno', 1))
             
-            print("[DEBUG] Gráficas actualizadas correctamente")
+            _log.debug("Gráficas actualizadas correctamente")
         except Exception as e:
             error_msg = f"Error actualizando gráficas: {str(e)}"
-            print(error_msg)
-            import traceback
-            traceback.print_exc()
+            _log.exception(error_msg)
             self.panel_monitoreo.agregar_log(error_msg, "error")
 
@@ -2,13 +2,56 @@
 Motor de simulación que ejecuta en hilo separado.
 """
 
+import logging
 import threading
 import time
+from functools import lru_cache
 import numpy as np
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 from ..models import RobotMovilBase
 
 
+_log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=16)
+def _perfil_rampa(n_acel: int, n_const: int, n_decel: int,
+                  v_obj: float, omega_obj: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Construye (y memoiza) los arrays del perfil Rampa-Constante-Rampa.
+    
+    Los arrays devueltos son de solo lectura porque se comparten entre llamadas.
+    """
+    # Factor de escala por paso: rampa de subida, constante, rampa de bajada
+    factor = np.concatenate([
+        np.linspace(0.0, 1.0, n_acel, endpoint=False),
+        np.ones(n_const),
+        np.linspace(1.0, 0.0, n_decel, endpoint=False)
+    ])
+    
+    velocidades = factor * v_obj
+    omegas = factor * omega_obj
+    velocidades.flags.writeable = False
+    omegas.flags.writeable = False
+    
+    return velocidades, omegas
+
+
+@lru_cache(maxsize=16)
+def _perfil_fijo(n_pasos: int, v_obj: float, omega_obj: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Construye (y memoiza) los arrays del perfil de velocidades fijas.
+    
+    Los arrays devueltos son de solo lectura porque se comparten entre llamadas.
+    """
+    velocidades = np.full(n_pasos, v_obj)
+    omegas = np.full(n_pasos, omega_obj)
+    velocidades.flags.writeable = False
+    omegas.flags.writeable = False
+    
+    return velocidades, omegas
+
+
 class MotorSimulacion:
     """
     Gestiona la simulación del robot en un hilo separado.
@@ -17,7 +60,8 @@ class MotorSimulacion:
     
     def __init__(self, robot: RobotMovilBase, parametros: Dict, 
                  callback_actualizacion: Optional[Callable] = None,
-                 callback_finalizacion: Optional[Callable] = None):
+                 callback_finalizacion: Optional[Callable] = None,
+                 root=None):
         """
         Inicializa el motor de simulación.
         
@@ -26,17 +70,27 @@ class MotorSimulacion:
             parametros: Diccionario con parámetros de simulación
             callback_actualizacion: Función a llamar en cada actualización
             callback_finalizacion: Función a llamar cuando la simulación termina
+            root: Ventana raíz de Tkinter; si se indica, callback_actualizacion
+                  se ejecuta en el hilo principal mediante after_idle
         """
         self.robot = robot
         self.parametros = parametros
         self.callback_actualizacion = callback_actualizacion
         self.callback_finalizacion = callback_finalizacion
+        self.root = root
+        
+        # True mientras haya una actualización encolada sin ejecutar
+        self.actualizacion_pendiente = False
         
         self.hilo = None
         self.ejecutando = False
         self.pausado = False
         self.completada_exitosamente = False
         
+        # Evento activo mientras la simulación no está pausada
+        self.evento_reanudar = threading.Event()
+        self.evento_reanudar.set()
+        
         # Parámetros de simulación
         self.dt = 0.05  # Paso de tiempo (s)
         self.tiempo_actualizacion_grafica = 0.1  # Actualizar gráficas cada 100ms
@@ -48,37 +102,43 @@ class MotorSimulacion:
         
         self.ejecutando = True
         self.pausado = False
+        self.evento_reanudar.set()
         self.hilo = threading.Thread(target=self._ejecutar_simulacion, daemon=True)
         self.hilo.start()
     
     def detener(self):
         """Detiene la simulación."""
         self.ejecutando = False
+        # Despertar el hilo si está pausado para que pueda terminar
+        self.evento_reanudar.set()
         if self.hilo is not None:
             self.hilo.join(timeout=1.0)
     
     def pausar(self):
         """Pausa la simulación."""
         self.pausado = True
+        self.evento_reanudar.clear()
     
     def reanudar(self):
         """Reanuda la simulación."""
         self.pausado = False
+        self.evento_reanudar.set()
     
     def _ejecutar_simulacion(self):
         """Ejecuta el bucle principal de simulación."""
         try:
-            print("[DEBUG] Iniciando simulación...")
+            _log.debug("Iniciando simulación...")
             
             # Obtener perfil de movimiento
             modo = self.parametros.get('modo_movimiento', 'A')
             
             if modo == 'A':
-                perfil = self._generar_perfil_rampa()
+                velocidades, omegas = self._generar_perfil_rampa()
             else:
-                perfil = self._generar_perfil_fijo()
+                velocidades, omegas = self._generar_perfil_fijo()
             
-            print(f"[DEBUG] Perfil generado: {len(perfil)} pasos, duración ~{len(perfil)*self.dt:.1f}s")
+            total_pasos = len(velocidades)
+            _log.debug("Perfil generado: %d pasos, duración ~%.1fs", total_pasos, total_pasos * self.dt)
             
             # Obtener perfil de terreno
             tipo_terreno = self.parametros.get('tipo_terreno', 1)
@@ -88,22 +148,40 @@ class MotorSimulacion:
             angulo_pitch = np.deg2rad(angulo_pitch_deg)
             angulo_roll = np.deg2rad(angulo_roll_deg)
             
-            # Tiempo de última actualización de gráfica
-            ultimo_tiempo_grafica = time.time()
+            pitchs, rolls = self._generar_perfil_terreno(tipo_terreno, angulo_pitch,
+                                                         angulo_roll, total_pasos)
+            inclinacion_actual = None
+            
+            # Preasignar el historial para todos los pasos del perfil
+            self.robot.iniciar_historial(total_pasos)
+            
+            # Pasos entre actualizaciones de gráfica (dt es fijo)
+            pasos_por_actualizacion = max(1, int(round(self.tiempo_actualizacion_grafica / self.dt)))
             actualizaciones = 0
             
+            # Instante objetivo del próximo paso (reloj monotónico)
+            proximo_paso = time.monotonic()
+            
             # Ejecutar simulación paso a paso
-            for i, (v_obj, omega_obj) in enumerate(perfil):
+            for i in range(total_pasos):
                 if not self.ejecutando:
                     break
                 
-                while self.pausado:
-                    time.sleep(0.1)
+                v_obj = velocidades[i]
+                omega_obj = omegas[i]
+                
+                # Bloquear mientras esté pausada (sin sondeo)
+                if not self.evento_reanudar.is_set():
+                    self.evento_reanudar.wait()
                     if not self.ejecutando:
                         break
                 
-                # Aplicar perfil de terreno (plano -> inclinado -> plano)
-                self._aplicar_perfil_terreno(tipo_terreno, angulo_pitch, angulo_roll, i, len(perfil))
+                # Aplicar perfil de terreno (plano -> inclinado -> plano),
+                # solo en las transiciones entre regiones
+                inclinacion = (pitchs[i], rolls[i])
+                if inclinacion != inclinacion_actual:
+                    self.robot.set_inclinacion(*inclinacion)
+                    inclinacion_actual = inclinacion
                 
                 # Actualizar cinemática
                 self.robot.actualizar_cinematica(v_obj, omega_obj, self.dt)
@@ -115,22 +193,27 @@ class MotorSimulacion:
                 self.robot.registrar_estado(datos_dinamica)
                 
                 # Actualizar visualización (con throttling)
-                tiempo_actual = time.time()
-                if tiempo_actual - ultimo_tiempo_grafica >= self.tiempo_actualizacion_grafica:
-                    if self.callback_actualizacion:
-                        self.callback_actualizacion()
-                        actualizaciones += 1
-                    ultimo_tiempo_grafica = tiempo_actual
+                if i % pasos_por_actualizacion == 0 and self.callback_actualizacion:
+                    self._solicitar_actualizacion()
+                    actualizaciones += 1
                 
-                # Dormir para mantener tiempo real
-                time.sleep(self.dt)
+                # Dormir hasta el siguiente instante objetivo para mantener tiempo real,
+                # descontando el tiempo ya invertido en el paso
+                proximo_paso += self.dt
+                espera = proximo_paso - time.monotonic()
+                if espera > 0:
+                    time.sleep(espera)
+                else:
+                    # Paso más lento que dt: resincronizar sin dormir
+                    proximo_paso = time.monotonic()
             
-            print(f"[DEBUG] Simulación completada: {i+1} pasos, {actualizaciones} actualizaciones")
+            _log.debug("Simulación completada: %d pasos, %d actualizaciones",
+                       self.robot.num_registros, actualizaciones)
             
             # Actualización final
             if self.callback_actualizacion:
-                print("[DEBUG] Actualizando gráficas final...")
-                self.callback_actualizacion()
+                _log.debug("Actualizando gráficas final...")
+                self._solicitar_actualizacion()
             
             # Marcar como completada exitosamente
             self.completada_exitosamente = True
@@ -138,15 +221,13 @@ class MotorSimulacion:
             
             # Notificar finalización
             if self.callback_finalizacion:
-                print("[DEBUG] Notificando finalización...")
+                _log.debug("Notificando finalización...")
                 self.callback_finalizacion(exitoso=True, mensaje="Simulación completada exitosamente")
             
-            print("[DEBUG] Simulación terminada")
+            _log.debug("Simulación terminada")
         
         except Exception as e:
-            print(f"[ERROR] Error en simulación: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Error en simulación: %s", e)
             self.completada_exitosamente = False
             self.ejecutando = False
             
@@ -154,12 +235,35 @@ class MotorSimulacion:
             if self.callback_finalizacion:
                 self.callback_finalizacion(exitoso=False, mensaje=f"Error en simulación: {str(e)}")
     
-    def _generar_perfil_rampa(self) -> list:
+    def _solicitar_actualizacion(self):
+        """
+        Solicita una actualización de la visualización.
+        
+        Con ventana raíz, la actualización se encola en el hilo principal y
+        las solicitudes que llegan mientras otra sigue pendiente se descartan,
+        de modo que nunca se acumulan redibujados.
+        """
+        if self.root is None:
+            self.callback_actualizacion()
+            return
+        
+        if self.actualizacion_pendiente:
+            return
+        
+        self.actualizacion_pendiente = True
+        self.root.after_idle(self._ejecutar_actualizacion)
+    
+    def _ejecutar_actualizacion(self):
+        """Ejecuta la actualización encolada (hilo principal de Tkinter)."""
+        self.actualizacion_pendiente = False
+        self.callback_actualizacion()
+    
+    def _generar_perfil_rampa(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Genera perfil de movimiento Rampa-Constante-Rampa.
         
         Returns:
-            Lista de tuplas (v, omega) para cada paso de tiempo
+            Tupla (velocidades, omegas) de arrays con el valor de cada paso de tiempo
         """
         t_acel = self.parametros.get('tiempo_aceleracion', 2.0)
         t_const = self.parametros.get('tiempo_constante', 5.0)
@@ -168,84 +272,58 @@ class MotorSimulacion:
         v_obj = self.parametros.get('velocidad_lineal_objetivo', 1.0)
         omega_obj = self.parametros.get('velocidad_angular_objetivo', 0.0)
         
-        perfil = []
-        
-        # Fase 1: Aceleración (rampa)
         n_acel = int(t_acel / self.dt)
-        for i in range(n_acel):
-            factor = i / max(n_acel, 1)
-            v = v_obj * factor
-            omega = omega_obj * factor
-            perfil.append((v, omega))
-        
-        # Fase 2: Velocidad constante
         n_const = int(t_const / self.dt)
-        for i in range(n_const):
-            perfil.append((v_obj, omega_obj))
-        
-        # Fase 3: Desaceleración (rampa)
         n_decel = int(t_decel / self.dt)
-        for i in range(n_decel):
-            factor = 1.0 - (i / max(n_decel, 1))
-            v = v_obj * factor
-            omega = omega_obj * factor
-            perfil.append((v, omega))
         
-        return perfil
+        return _perfil_rampa(n_acel, n_const, n_decel, float(v_obj), float(omega_obj))
     
-    def _generar_perfil_fijo(self) -> list:
+    def _generar_perfil_fijo(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Genera perfil de movimiento con velocidades fijas.
         
         Returns:
-            Lista de tuplas (v, omega) para cada paso de tiempo
+            Tupla (velocidades, omegas) de arrays con el valor de cada paso de tiempo
         """
         duracion = self.parametros.get('duracion', 10.0)
         v_obj = self.parametros.get('velocidad_lineal_fija', 1.0)
         omega_obj = self.parametros.get('velocidad_angular_fija', 0.0)
         
         n_pasos = int(duracion / self.dt)
-        perfil = [(v_obj, omega_obj)] * n_pasos
         
-        return perfil
+        return _perfil_fijo(n_pasos, float(v_obj), float(omega_obj))
     
-    def _aplicar_perfil_terreno(self, tipo_terreno: int, pitch: float, roll: float,
-                               paso_actual: int, total_pasos: int):
+    def _generar_perfil_terreno(self, tipo_terreno: int, pitch: float, roll: float,
+                                total_pasos: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Aplica el perfil de terreno (plano -> inclinado -> plano).
+        Genera el perfil de terreno (plano -> inclinado -> plano) para todos los pasos.
         
         Args:
             tipo_terreno: 1=plano, 2=simple, 3=compuesto
             pitch: Ángulo pitch (rad)
             roll: Ángulo roll (rad)
-            paso_actual: Paso actual de simulación
             total_pasos: Total de pasos de simulación
+            
+        Returns:
+            Tupla (pitchs, rolls) de arrays con la inclinación de cada paso (rad)
         """
+        pitchs = np.zeros(total_pasos)
+        rolls = np.zeros(total_pasos)
+        
         if tipo_terreno == 1:
             # Terreno plano
-            self.robot.set_inclinacion(0, 0)
-            return
+            return pitchs, rolls
         
         # Definir regiones: plano (20%) -> inclinado (60%) -> plano (20%)
         limite_inicio_inclinacion = int(total_pasos * 0.2)
         limite_fin_inclinacion = int(total_pasos * 0.8)
         
-        if paso_actual < limite_inicio_inclinacion:
-            # Región plana inicial
-            self.robot.set_inclinacion(0, 0)
-        
-        elif paso_actual < limite_fin_inclinacion:
-            # Región inclinada
-            if tipo_terreno == 2:
-                # Inclinación simple (solo pitch)
-                self.robot.set_inclinacion(pitch, 0)
-            else:
-                # Inclinación compuesta (pitch y roll)
-                self.robot.set_inclinacion(pitch, roll)
+        # Región inclinada: pitch en ambos casos, roll solo en inclinación compuesta
+        pitchs[limite_inicio_inclinacion:limite_fin_inclinacion] = pitch
+        if tipo_terreno == 3:
+            rolls[limite_inicio_inclinacion:limite_fin_inclinacion] = roll
         
-        else:
-            # Región plana final
-            self.robot.set_inclinacion(0, 0)
+        return pitchs, rolls
     
     def esta_ejecutando(self) -> bool:
         """Retorna True si la simulación está en ejecución."""
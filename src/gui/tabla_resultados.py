@@ -4,9 +4,45 @@ Tabla de resultados con estadísticas (mín, máx, promedio, moda) y energía to
 
 import tkinter as tk
 from tkinter import ttk
+from functools import lru_cache
 import numpy as np
-from typing import Dict
-from scipy import stats
+from typing import Dict, Optional, Tuple
+
+
+# Variables por rueda del historial: (clave, nombre, unidad)
+VARIABLES_RUEDAS = (
+    ('velocidades_ruedas', 'Velocidad angular', 'rad/s'),
+    ('fuerzas_tangenciales', 'Fuerza tangencial', 'N'),
+    ('fuerzas_normales', 'Fuerza normal', 'N'),
+    ('torques', 'Torque', 'N·m'),
+    ('potencias', 'Potencia', 'W'),
+)
+
+# Número de intervalos usados para estimar la moda de datos continuos
+NUM_BINS_MODA = 256
+
+
+@lru_cache(maxsize=4)
+def _obtener_etiquetas_ruedas(num_ruedas: int) -> Tuple[str, ...]:
+    """Retorna etiquetas para las ruedas según el número."""
+    if num_ruedas == 2:
+        return ('rueda izquierda', 'rueda derecha')
+    else:
+        return ('rueda adelante izq.', 'rueda adelante der.',
+                'rueda atrás izq.', 'rueda atrás der.')
+
+
+@lru_cache(maxsize=4)
+def _etiquetas_variables_ruedas(num_ruedas: int) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Retorna, para cada variable de VARIABLES_RUEDAS, el nombre de fila
+    de cada rueda (p. ej. 'Torque rueda izquierda').
+    """
+    etiquetas_ruedas = _obtener_etiquetas_ruedas(num_ruedas)
+    return tuple(
+        tuple(f'{nombre} {etiqueta}' for etiqueta in etiquetas_ruedas)
+        for _, nombre, _ in VARIABLES_RUEDAS
+    )
 
 
 class TablaResultados(ttk.Frame):
@@ -14,10 +50,32 @@ class TablaResultados(ttk.Frame):
     Muestra tabla con estadísticas de todas las variables y energía total.
     """
     
+    # Formato de los valores estadísticos de la tabla
+    FORMATO_ESTADISTICA = "%.6f"
+    
     def __init__(self, parent, **kwargs):
         """Inicializa la tabla de resultados."""
         super().__init__(parent, **kwargs)
         
+        # Historial mostrado por última vez: (array base de 'tiempo', pasos, ruedas)
+        self._ultimo_mostrado = None
+        
+        # Integración incremental de la energía: array base de 'tiempo',
+        # pasos ya integrados y energía acumulada hasta ellos
+        self._energia_base = None
+        self._energia_pasos = 0
+        self._energia_acumulada = 0.0
+        
+        # Buffer reutilizable para |P| al integrar la energía
+        self._buffer_abs = np.empty(0)
+        
+        # Matriz (pasos, variables) reutilizada entre actualizaciones: solo se
+        # copian los pasos nuevos del mismo historial. Se mantiene en float64:
+        # float32 no alcanza para los 6 decimales que muestra la tabla.
+        self._matriz_base = None
+        self._matriz_pasos = 0
+        self._buffer_matriz = np.empty((0, 0))
+        
         self._crear_widgets()
     
     def _crear_widgets(self):
@@ -74,150 +132,241 @@ class TablaResultados(ttk.Frame):
             historial: Historial de simulación
             num_ruedas: Número de ruedas del robot
         """
-        # Limpiar tabla actual
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Omitir si el historial no cambió desde la última actualización. El
+        # historial del robot son vistas de arrays que solo crecen, así que el
+        # array base y el número de pasos identifican su contenido.
+        tiempo = historial['tiempo']
+        clave = (getattr(tiempo, 'base', None), len(tiempo), num_ruedas)
+        if (self._ultimo_mostrado is not None and clave[0] is not None
+                and clave[0] is self._ultimo_mostrado[0]
+                and clave[1:] == self._ultimo_mostrado[1:]):
+            return
+        self._ultimo_mostrado = clave
         
         if len(historial['tiempo']) == 0:
-            self.label_energia.config(text="0.000 J")
+            self.limpiar()
             return
         
         # Calcular estadísticas para cada variable
         datos = []
         
         # 1. Velocidad lineal del robot
-        v = np.array(historial['v'])
+        v = np.asarray(historial['v'])
         datos.append(('Velocidad lineal del robot', 'm/s', v))
         
         # 2. Velocidad angular del robot
-        omega = np.array(historial['omega'])
+        omega = np.asarray(historial['omega'])
         datos.append(('Velocidad angular del robot', 'rad/s', omega))
         
         # 3. Aceleración lineal del robot
-        a_lin = np.array(historial['a_lineal'])
+        a_lin = np.asarray(historial['a_lineal'])
         datos.append(('Aceleración lineal del robot', 'm/s²', a_lin))
         
         # 4. Aceleración angular del robot
-        a_ang = np.array(historial['a_angular'])
+        a_ang = np.asarray(historial['a_angular'])
         datos.append(('Aceleración angular del robot', 'rad/s²', a_ang))
         
-        # 5-8. Velocidades angulares por rueda
-        velocidades_ruedas = historial['velocidades_ruedas']
-        etiquetas_ruedas = self._obtener_etiquetas_ruedas(num_ruedas)
-        
-        for i in range(num_ruedas):
-            omega_rueda = np.array([vr[i] for vr in velocidades_ruedas])
-            datos.append((f'Velocidad angular {etiquetas_ruedas[i]}', 'rad/s', omega_rueda))
-        
-        # 9-12. Fuerzas tangenciales por rueda
-        fuerzas_tang = historial['fuerzas_tangenciales']
-        for i in range(num_ruedas):
-            ft = np.array([f[i] for f in fuerzas_tang])
-            datos.append((f'Fuerza tangencial {etiquetas_ruedas[i]}', 'N', ft))
-        
-        # 13-16. Fuerzas normales por rueda
-        fuerzas_norm = historial['fuerzas_normales']
-        for i in range(num_ruedas):
-            fn = np.array([f[i] for f in fuerzas_norm])
-            datos.append((f'Fuerza normal {etiquetas_ruedas[i]}', 'N', fn))
-        
-        # 17-20. Torques por rueda
-        torques = historial['torques']
-        for i in range(num_ruedas):
-            tau = np.array([t[i] for t in torques])
-            datos.append((f'Torque {etiquetas_ruedas[i]}', 'N·m', tau))
-        
-        # 21-24. Potencias por rueda
-        potencias = historial['potencias']
-        for i in range(num_ruedas):
-            pot = np.array([p[i] for p in potencias])
-            datos.append((f'Potencia {etiquetas_ruedas[i]}', 'W', pot))
+        # 5-24. Variables por rueda: cada una es una matriz (pasos, ruedas)
+        etiquetas = _etiquetas_variables_ruedas(num_ruedas)
+        for (clave, _, unidad), etiquetas_variable in zip(VARIABLES_RUEDAS, etiquetas):
+            matriz_ruedas = np.asarray(historial[clave])
+            for i, etiqueta in enumerate(etiquetas_variable):
+                datos.append((etiqueta, unidad, matriz_ruedas[:, i]))
         
         # 25. Potencia total
-        pot_total = np.array(historial['potencia_total'])
+        pot_total = np.asarray(historial['potencia_total'])
         datos.append(('Potencia total del robot', 'W', pot_total))
         
-        # Insertar datos en la tabla
-        for variable, unidad, valores in datos:
-            if len(valores) > 0:
-                minimo = np.min(valores)
-                maximo = np.max(valores)
-                promedio = np.mean(valores)
-                moda = self._calcular_moda(valores)
-                
-                self.tree.insert('', 'end', values=(
-                    variable,
-                    unidad,
-                    f'{minimo:.6f}',
-                    f'{maximo:.6f}',
-                    f'{promedio:.6f}',
-                    f'{moda:.6f}'
-                ))
+        # Estadísticas de todas las variables a la vez (una columna por variable)
+        matriz = self._actualizar_matriz(tiempo, [valores for _, _, valores in datos])
+        minimos = matriz.min(axis=0)
+        maximos = matriz.max(axis=0)
+        promedios = matriz.mean(axis=0)
+        
+        modas = self._calcular_modas(matriz, minimos, maximos)
+        
+        # Preparar todas las filas antes de tocar el widget. Los valores se
+        # formatean como float de Python (tolist), más rápido que np.float64.
+        estadisticas = np.column_stack([minimos, maximos, promedios, modas]).tolist()
+        fmt = self.FORMATO_ESTADISTICA
+        filas = []
+        for (variable, unidad, _), (minimo, maximo, promedio, moda) in zip(datos, estadisticas):
+            filas.append((variable, unidad,
+                          fmt % minimo, fmt % maximo, fmt % promedio, fmt % moda))
+        
+        # Reemplazar el contenido de la tabla (borrado en una sola llamada)
+        self.tree.delete(*self.tree.get_children())
+        for fila in filas:
+            self.tree.insert('', 'end', values=fila)
         
         # Calcular energía total (integral de potencia)
         energia_total = self._calcular_energia(historial)
         self.label_energia.config(text=f"{energia_total:.3f} J")
     
-    def _obtener_etiquetas_ruedas(self, num_ruedas: int) -> list:
-        """Retorna etiquetas para las ruedas según el número."""
-        if num_ruedas == 2:
-            return ['rueda izquierda', 'rueda derecha']
-        else:
-            return ['rueda adelante izq.', 'rueda adelante der.',
-                   'rueda atrás izq.', 'rueda atrás der.']
-    
-    def _calcular_moda(self, valores: np.ndarray) -> float:
+    def _actualizar_matriz(self, tiempo: np.ndarray, columnas: list) -> np.ndarray:
         """
-        Calcula la moda de un array de valores.
-        Para datos continuos, usamos histograma.
-        """
-        if len(valores) == 0:
-            return 0.0
+        Retorna la matriz (pasos, variables) del historial, copiando en el
+        buffer reutilizable solo los pasos añadidos desde la última llamada.
         
-        # Para datos continuos, discretizar en bins
-        try:
-            # Intentar calcular moda con scipy
-            moda_resultado = stats.mode(valores, keepdims=True)
-            if hasattr(moda_resultado, 'mode'):
-                moda = moda_resultado.mode[0]
-            else:
-                moda = moda_resultado[0][0]
+        Args:
+            tiempo: Array 'tiempo' del historial (identifica el historial)
+            columnas: Valores de cada variable, todos de la misma longitud
             
-            # Si todos los valores son diferentes, la moda no es muy significativa
-            # En ese caso, retornar el valor más cercano a la media
-            if len(np.unique(valores)) == len(valores):
-                moda = np.median(valores)
+        Returns:
+            Vista del buffer con todos los pasos
+        """
+        n = len(tiempo)
+        num_variables = len(columnas)
+        
+        # Empezar de cero si cambió el historial o el número de variables
+        base = getattr(tiempo, 'base', None)
+        if (base is None or base is not self._matriz_base or n < self._matriz_pasos
+                or self._buffer_matriz.shape[1] != num_variables):
+            self._matriz_base = base
+            self._matriz_pasos = 0
+        
+        # Ampliar el buffer (duplicando) solo si no caben los pasos nuevos
+        if n > len(self._buffer_matriz) or self._buffer_matriz.shape[1] != num_variables:
+            buffer = np.empty((max(n, 2 * len(self._buffer_matriz)), num_variables))
+            if self._matriz_pasos:
+                buffer[:self._matriz_pasos] = self._buffer_matriz[:self._matriz_pasos]
+            self._buffer_matriz = buffer
+        
+        inicio = self._matriz_pasos
+        for j, valores in enumerate(columnas):
+            self._buffer_matriz[inicio:n, j] = valores[inicio:]
+        self._matriz_pasos = n
+        
+        return self._buffer_matriz[:n]
+    
+    @staticmethod
+    def _calcular_modas(matriz: np.ndarray, minimos: Optional[np.ndarray] = None,
+                        maximos: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calcula la moda de cada columna de una matriz (pasos, variables).
+        
+        Para datos continuos, cada columna se discretiza en NUM_BINS_MODA
+        intervalos iguales y su moda es el promedio de los valores del
+        intervalo más poblado. Todas las columnas se cuentan a la vez con un
+        único np.bincount (cada una usa su propio rango de índices). Las
+        columnas constantes (p. ej. normales en terreno plano o velocidades
+        fijas) no se discretizan: su moda es su valor.
+        
+        Args:
+            matriz: Valores con una columna por variable (al menos un paso)
+            minimos: Mínimo de cada columna, si ya se calculó
+            maximos: Máximo de cada columna, si ya se calculó
             
-            return float(moda)
-        except:
-            # Si falla, usar mediana como aproximación
-            return float(np.median(valores))
+        Returns:
+            Array con la moda de cada columna
+        """
+        if minimos is None:
+            minimos = matriz.min(axis=0)
+        if maximos is None:
+            maximos = matriz.max(axis=0)
+        
+        modas = np.asarray(minimos, dtype=np.float64).copy()
+        variables = np.flatnonzero(maximos > minimos)
+        if len(variables) == 0:
+            return modas
+        
+        valores = matriz[:, variables]
+        minimos = minimos[variables]
+        escalas = NUM_BINS_MODA / (maximos[variables] - minimos)
+        desplazamientos = np.arange(len(variables)) * NUM_BINS_MODA
+        
+        # Índice de intervalo de cada valor (el máximo cae en el último),
+        # desplazado para que cada columna tenga sus propios intervalos
+        indices = ((valores - minimos) * escalas).astype(np.intp)
+        np.minimum(indices, NUM_BINS_MODA - 1, out=indices)
+        indices += desplazamientos
+        
+        total_bins = len(variables) * NUM_BINS_MODA
+        conteos = np.bincount(indices.ravel(), minlength=total_bins)
+        sumas = np.bincount(indices.ravel(), weights=valores.ravel(), minlength=total_bins)
+        
+        # Intervalo más poblado de cada columna y promedio de sus valores
+        picos = conteos.reshape(len(variables), NUM_BINS_MODA).argmax(axis=1)
+        picos += desplazamientos
+        modas[variables] = sumas[picos] / conteos[picos]
+        
+        return modas
     
     def _calcular_energia(self, historial: Dict) -> float:
         """
         Calcula la energía total consumida integrando la potencia.
         E = ∫ P(t) dt
         
+        Mientras la simulación avanza, solo se integran los pasos nuevos
+        y se suman a la energía acumulada en la actualización anterior.
+        
         Args:
             historial: Historial de simulación
             
         Returns:
             Energía total en Joules
         """
-        if len(historial['tiempo']) < 2:
+        tiempo = historial['tiempo']
+        n = len(tiempo)
+        if n < 2:
             return 0.0
         
-        tiempo = np.array(historial['tiempo'])
-        potencia_total = np.array(historial['potencia_total'])
+        # Continuar desde la integración anterior si es el mismo historial
+        base = getattr(tiempo, 'base', None)
+        if base is None or base is not self._energia_base or n < self._energia_pasos:
+            self._energia_base = base
+            self._energia_pasos = 1
+            self._energia_acumulada = 0.0
+        
+        # Tramo nuevo, incluyendo el último paso ya integrado
+        inicio = self._energia_pasos - 1
+        if n - inicio >= 2:
+            # Ampliar el buffer de |P| solo cuando el tramo no cabe
+            if len(self._buffer_abs) < n - inicio:
+                self._buffer_abs = np.empty(max(n - inicio, 2 * len(self._buffer_abs)))
+            
+            self._energia_acumulada += self._integrar_trapecio(
+                historial['potencia_total'][inicio:], tiempo[inicio:], self._buffer_abs)
+            self._energia_pasos = n
+        
+        return self._energia_acumulada
+    
+    @staticmethod
+    def _integrar_trapecio(potencia: np.ndarray, tiempo: np.ndarray,
+                           buffer: Optional[np.ndarray] = None) -> float:
+        """
+        Integra |P(t)| con la regla del trapecio.
         
-        # Integrar usando regla del trapecio
-        energia = np.trapz(np.abs(potencia_total), tiempo)
+        Args:
+            potencia: Potencia en cada paso [W] (al menos 2 pasos)
+            tiempo: Tiempo de cada paso [s]
+            buffer: Array reutilizable para |P| (None = crear uno temporal)
+            
+        Returns:
+            Energía del tramo en Joules
+        """
+        potencia = np.asarray(potencia)
+        n = len(potencia)
+        if buffer is not None and len(buffer) >= n:
+            potencia_abs = np.abs(potencia, out=buffer[:n])
+        else:
+            potencia_abs = np.abs(potencia)
+        
+        dt = tiempo[1] - tiempo[0]
+        if abs(tiempo[-1] - tiempo[0] - dt * (n - 1)) < 1e-9:
+            # Paso uniforme (caso habitual): solo se recorre la potencia
+            energia = dt * (potencia_abs.sum() - 0.5 * (potencia_abs[0] + potencia_abs[-1]))
+        else:
+            # Producto escalar: multiplica y suma en una sola pasada
+            energia = 0.5 * np.dot(potencia_abs[1:] + potencia_abs[:-1], np.diff(tiempo))
         
-        return energia
+        return float(energia)
     
     def limpiar(self):
         """Limpia la tabla."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._ultimo_mostrado = None
+        self._energia_base = None
+        self._matriz_base = None
+        self.tree.delete(*self.tree.get_children())
         self.label_energia.config(text="0.000 J")
 
@@ -8,6 +8,7 @@ Clases:
 Autor: Sistema de Simulación de Robots Móviles
 """
 
+import math
 import numpy as np
 from typing import Dict
 from .robot_base import RobotMovilBase
@@ -88,12 +89,12 @@ class DiferencialCentrado(RobotMovilBase):
         
         # Actualizar posición y orientación (integración de Euler)
         self.theta += self.omega * dt
-        self.x += self.v * np.cos(self.theta) * dt
-        self.y += self.v * np.sin(self.theta) * dt
+        self.x += self.v * math.cos(self.theta) * dt
+        self.y += self.v * math.sin(self.theta) * dt
         
         # Actualizar altura Z basándose en la inclinación del terreno
         # La altura aumenta/disminuye según la componente vertical del movimiento
-        self.z += self.v * np.sin(self.inclinacion_pitch) * dt
+        self.z += self.v * math.sin(self.inclinacion_pitch) * dt
         
         # Actualizar tiempo
         self.tiempo_actual += dt
@@ -135,7 +136,7 @@ class DiferencialCentrado(RobotMovilBase):
         peso = self.masa * g
         
         # Factores de reducción por inclinación
-        factor_pitch = np.cos(self.inclinacion_pitch)
+        factor_pitch = math.cos(self.inclinacion_pitch)
         
         # Distribución base (simétrica para robot centrado)
         N_base = peso * factor_pitch / 2.0
@@ -143,7 +144,7 @@ class DiferencialCentrado(RobotMovilBase):
         # Redistribución por inclinación roll (izquierda-derecha)
         if abs(self.inclinacion_roll) > 1e-6:
             # Roll positivo aumenta carga en rueda derecha
-            delta_N = peso * np.sin(self.inclinacion_roll) / 2.0
+            delta_N = peso * math.sin(self.inclinacion_roll) / 2.0
             N_L = N_base - delta_N
             N_R = N_base + delta_N
         else:
@@ -175,14 +176,14 @@ class DiferencialCentrado(RobotMovilBase):
         # DINÁMICA: Cálculo de torques necesarios (ECUACIONES COMPLETAS)
         # ═══════════════════════════════════════════════════════════════
         # Resistencias del chasis
-        fv = self.coef_resistencia_lineal * abs(self.v) * np.sign(self.v) if self.v != 0 else 0.0
-        fw = self.coef_resistencia_angular * abs(self.omega) * np.sign(self.omega) if self.omega != 0 else 0.0
+        fv = self.coef_resistencia_lineal * self.v
+        fw = self.coef_resistencia_angular * self.omega
         
         # Componente de aceleración y resistencia lineal
         fuerza_total_lineal = self.masa * self.a_lineal + fv
         
         # Componente de pendiente (gravedad)
-        fuerza_pendiente = self.masa * g * np.sin(self.inclinacion_pitch)
+        fuerza_pendiente = self.masa * g * math.sin(self.inclinacion_pitch)
         
         # ✅ ECUACIÓN DINÁMICA LINEAL:
         #    m·v̇ = (1/R)(τ_R + τ_L) - f_v(v) - m·g·sin(α)
@@ -226,8 +227,8 @@ class DiferencialCentrado(RobotMovilBase):
         F_friccion_max_R = self.coef_friccion * N_R
         
         # Aplicar límites de adherencia (saturación)
-        F_L = np.clip(F_L_requerida, -F_friccion_max_L, F_friccion_max_L)
-        F_R = np.clip(F_R_requerida, -F_friccion_max_R, F_friccion_max_R)
+        F_L = min(max(F_L_requerida, -F_friccion_max_L), F_friccion_max_L)
+        F_R = min(max(F_R_requerida, -F_friccion_max_R), F_friccion_max_R)
         
         fuerzas_tangenciales = np.array([F_L, F_R])
         
@@ -345,8 +346,8 @@ class DiferencialDescentrado(RobotMovilBase):
         
         # Actualizar posición y orientación
         self.theta += self.omega * dt
-        self.x += self.v * np.cos(self.theta) * dt
-        self.y += self.v * np.sin(self.theta) * dt
+        self.x += self.v * math.cos(self.theta) * dt
+        self.y += self.v * math.sin(self.theta) * dt
         
         # Actualizar tiempo
         self.tiempo_actual += dt
@@ -389,7 +390,7 @@ class DiferencialDescentrado(RobotMovilBase):
         peso = self.masa * g
         
         # Factores de inclinación
-        factor_pitch = np.cos(self.inclinacion_pitch)
+        factor_pitch = math.cos(self.inclinacion_pitch)
         
         # Distribución base
         N_base = peso * factor_pitch / 2.0
@@ -406,7 +407,7 @@ class DiferencialDescentrado(RobotMovilBase):
         
         # Efecto adicional de inclinación roll
         if abs(self.inclinacion_roll) > 1e-6:
-            delta_N = peso * np.sin(self.inclinacion_roll) / 2.0
+            delta_N = peso * math.sin(self.inclinacion_roll) / 2.0
             N_L -= delta_N
             N_R += delta_N
         
@@ -420,14 +421,14 @@ class DiferencialDescentrado(RobotMovilBase):
         # DINÁMICA: Cálculo de torques necesarios (ECUACIONES COMPLETAS)
         # ═══════════════════════════════════════════════════════════════
         # Resistencias
-        fv = self.coef_resistencia_lineal * abs(self.v) * np.sign(self.v) if self.v != 0 else 0.0
-        fw = self.coef_resistencia_angular * abs(self.omega) * np.sign(self.omega) if self.omega != 0 else 0.0
+        fv = self.coef_resistencia_lineal * self.v
+        fw = self.coef_resistencia_angular * self.omega
         
         # Componente de aceleración y resistencia
         fuerza_total_lineal = self.masa * self.a_lineal + fv
         
         # Componente de pendiente (gravedad)
-        fuerza_pendiente = self.masa * g * np.sin(self.inclinacion_pitch)
+        fuerza_pendiente = self.masa * g * math.sin(self.inclinacion_pitch)
         
         # 🆕 MOMENTO GRAVITATORIO EN YAW (para CG descentrado en terreno inclinado)
         tau_g_z = self.calcular_momento_gravitatorio_z()
@@ -460,8 +461,8 @@ class DiferencialDescentrado(RobotMovilBase):
         F_friccion_max_R = self.coef_friccion * N_R
         
         # Aplicar límites de adherencia
-        F_L = np.clip(F_L_requerida, -F_friccion_max_L, F_friccion_max_L)
-        F_R = np.clip(F_R_requerida, -F_friccion_max_R, F_friccion_max_R)
+        F_L = min(max(F_L_requerida, -F_friccion_max_L), F_friccion_max_L)
+        F_R = min(max(F_R_requerida, -F_friccion_max_R), F_friccion_max_R)
         
         fuerzas_tangenciales = np.array([F_L, F_R])
         
@@ -510,8 +511,8 @@ class DiferencialDescentrado(RobotMovilBase):
         g = 9.81
         
         # Componentes de gravedad en marco del robot
-        g_x = g * np.sin(self.inclinacion_pitch)
-        g_y = g * np.sin(self.inclinacion_roll)
+        g_x = g * math.sin(self.inclinacion_pitch)
+        g_y = g * math.sin(self.inclinacion_roll)
         
         # Momento: τ_z = A·m·g_y - B·m·g_x
         tau_g_z = self.masa * (self.A * g_y - self.B * g_x)
@@ -8,6 +8,7 @@ Clases:
 Autor: Sistema de Simulación de Robots Móviles
 """
 
+import math
 import numpy as np
 from typing import Dict
 from .robot_base import RobotMovilBase
@@ -58,12 +59,12 @@ class CuatroRuedasCentrado(RobotMovilBase):
         
         # Actualizar posición y orientación (Euler)
         self.theta += self.omega * dt
-        self.x += self.v * np.cos(self.theta) * dt
-        self.y += self.v * np.sin(self.theta) * dt
+        self.x += self.v * math.cos(self.theta) * dt
+        self.y += self.v * math.sin(self.theta) * dt
         
         # Actualizar altura Z basándose en la inclinación del terreno
         # La altura aumenta/disminuye según la componente vertical del movimiento
-        self.z += self.v * np.sin(self.inclinacion_pitch) * dt
+        self.z += self.v * math.sin(self.inclinacion_pitch) * dt
         
         # Actualizar tiempo
         self.tiempo_actual += dt
@@ -101,8 +102,8 @@ class CuatroRuedasCentrado(RobotMovilBase):
         peso = self.masa * g
         
         # Factores de inclinación
-        factor_pitch = np.cos(self.inclinacion_pitch)
-        factor_roll = np.cos(self.inclinacion_roll)
+        factor_pitch = math.cos(self.inclinacion_pitch)
+        factor_roll = math.cos(self.inclinacion_roll)
         
         # Distribución base (simétrica: 25% por rueda)
         N_base = peso / 4.0
@@ -110,7 +111,7 @@ class CuatroRuedasCentrado(RobotMovilBase):
         # Redistribución por inclinación pitch (adelante-atrás)
         if abs(self.inclinacion_pitch) > 1e-6:
             # Pitch positivo: cuesta arriba → más carga atrás
-            delta_pitch = peso * np.sin(self.inclinacion_pitch) / 2.0
+            delta_pitch = peso * math.sin(self.inclinacion_pitch) / 2.0
             N_adelante = N_base * factor_pitch - delta_pitch / 2.0
             N_atras = N_base * factor_pitch + delta_pitch / 2.0
         else:
@@ -120,7 +121,7 @@ class CuatroRuedasCentrado(RobotMovilBase):
         # Redistribución por inclinación roll (izquierda-derecha)
         if abs(self.inclinacion_roll) > 1e-6:
             # Roll positivo: inclinación a derecha → más carga derecha
-            delta_roll = peso * np.sin(self.inclinacion_roll) / 2.0
+            delta_roll = peso * math.sin(self.inclinacion_roll) / 2.0
             N_FL = N_adelante - delta_roll / 2.0
             N_FR = N_adelante + delta_roll / 2.0
             N_RL = N_atras - delta_roll / 2.0
@@ -144,16 +145,16 @@ class CuatroRuedasCentrado(RobotMovilBase):
         F_base = self.masa * self.a_lineal / 4.0
         
         # Componente de pendiente
-        F_pendiente = self.masa * g * np.sin(self.inclinacion_pitch) / 4.0
+        F_pendiente = self.masa * g * math.sin(self.inclinacion_pitch) / 4.0
         
         # Límites de fricción por rueda
         F_friccion_max = self.coef_friccion * fuerzas_normales
         
         # Fuerza tangencial por rueda (limitada por fricción)
-        F_FL = np.clip(F_base + F_pendiente, -F_friccion_max[0], F_friccion_max[0])
-        F_FR = np.clip(F_base + F_pendiente, -F_friccion_max[1], F_friccion_max[1])
-        F_RL = np.clip(F_base + F_pendiente, -F_friccion_max[2], F_friccion_max[2])
-        F_RR = np.clip(F_base + F_pendiente, -F_friccion_max[3], F_friccion_max[3])
+        F_FL = min(max(F_base + F_pendiente, -F_friccion_max[0]), F_friccion_max[0])
+        F_FR = min(max(F_base + F_pendiente, -F_friccion_max[1]), F_friccion_max[1])
+        F_RL = min(max(F_base + F_pendiente, -F_friccion_max[2]), F_friccion_max[2])
+        F_RR = min(max(F_base + F_pendiente, -F_friccion_max[3]), F_friccion_max[3])
         
         fuerzas_tangenciales = np.array([F_FL, F_FR, F_RL, F_RR])
         
@@ -221,8 +222,8 @@ class CuatroRuedasDescentrado(RobotMovilBase):
         
         # Actualizar posición y orientación
         self.theta += self.omega * dt
-        self.x += self.v * np.cos(self.theta) * dt
-        self.y += self.v * np.sin(self.theta) * dt
+        self.x += self.v * math.cos(self.theta) * dt
+        self.y += self.v * math.sin(self.theta) * dt
         
         # Actualizar tiempo
         self.tiempo_actual += dt
@@ -292,14 +293,14 @@ class CuatroRuedasDescentrado(RobotMovilBase):
         
         # Efecto de inclinaciones del terreno
         if abs(self.inclinacion_pitch) > 1e-6:
-            delta_pitch = peso * np.sin(self.inclinacion_pitch) / 2.0
+            delta_pitch = peso * math.sin(self.inclinacion_pitch) / 2.0
             N_FL -= delta_pitch / 2.0
             N_FR -= delta_pitch / 2.0
             N_RL += delta_pitch / 2.0
             N_RR += delta_pitch / 2.0
         
         if abs(self.inclinacion_roll) > 1e-6:
-            delta_roll = peso * np.sin(self.inclinacion_roll) / 2.0
+            delta_roll = peso * math.sin(self.inclinacion_roll) / 2.0
             N_FL -= delta_roll / 2.0
             N_FR += delta_roll / 2.0
             N_RL -= delta_roll / 2.0
@@ -333,15 +334,15 @@ class CuatroRuedasDescentrado(RobotMovilBase):
         
         # Fuerzas tangenciales
         F_base = self.masa * self.a_lineal / 4.0
-        F_pendiente = self.masa * g * np.sin(self.inclinacion_pitch) / 4.0
+        F_pendiente = self.masa * g * math.sin(self.inclinacion_pitch) / 4.0
         
         # Límites de fricción (diferentes para cada rueda por N asimétrico)
         F_friccion_max = self.coef_friccion * fuerzas_normales
         
-        F_FL = np.clip(F_base + F_pendiente, -F_friccion_max[0], F_friccion_max[0])
-        F_FR = np.clip(F_base + F_pendiente, -F_friccion_max[1], F_friccion_max[1])
-        F_RL = np.clip(F_base + F_pendiente, -F_friccion_max[2], F_friccion_max[2])
-        F_RR = np.clip(F_base + F_pendiente, -F_friccion_max[3], F_friccion_max[3])
+        F_FL = min(max(F_base + F_pendiente, -F_friccion_max[0]), F_friccion_max[0])
+        F_FR = min(max(F_base + F_pendiente, -F_friccion_max[1]), F_friccion_max[1])
+        F_RL = min(max(F_base + F_pendiente, -F_friccion_max[2]), F_friccion_max[2])
+        F_RR = min(max(F_base + F_pendiente, -F_friccion_max[3]), F_friccion_max[3])
         
         fuerzas_tangenciales = np.array([F_FL, F_FR, F_RL, F_RR])
         
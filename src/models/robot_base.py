@@ -8,6 +8,7 @@ Autor: Sistema de Simulación de Robots Móviles
 """
 
 from abc import ABC, abstractmethod
+import math
 import numpy as np
 from typing import Dict, List, Tuple
 
@@ -20,6 +21,14 @@ class RobotMovilBase(ABC):
     Cada tipo de robot (diferencial/4 ruedas) implementa sus métodos específicos.
     """
     
+    # Variables escalares del historial (un valor por paso)
+    CLAVES_HISTORIAL = ('tiempo', 'x', 'y', 'z', 'theta', 'v', 'omega',
+                        'a_lineal', 'a_angular', 'potencia_total')
+    
+    # Variables por rueda del historial (un valor por rueda y paso)
+    CLAVES_HISTORIAL_RUEDAS = ('velocidades_ruedas', 'fuerzas_tangenciales',
+                               'fuerzas_normales', 'torques', 'potencias')
+    
     def __init__(self, masa: float, coef_friccion: float, largo: float, ancho: float, radio_rueda: float):
         """
         Inicializa el robot con parámetros físicos y estado en origen.
@@ -51,24 +60,11 @@ class RobotMovilBase(ABC):
         self.inclinacion_pitch = 0.0  # Ángulo de inclinación pitch (rad)
         self.inclinacion_roll = 0.0  # Ángulo de inclinación roll (rad)
         
-        # Historial de simulación (todas las variables en SI)
-        self.historial = {
-            'tiempo': [],
-            'x': [],
-            'y': [],
-            'z': [],  # Coordenada Z (altura)
-            'theta': [],
-            'v': [],
-            'omega': [],
-            'a_lineal': [],
-            'a_angular': [],
-            'velocidades_ruedas': [],  # Lista de listas (una por rueda)
-            'fuerzas_tangenciales': [],  # Lista de listas
-            'fuerzas_normales': [],  # Lista de listas
-            'torques': [],  # Lista de listas
-            'potencias': [],  # Lista de listas
-            'potencia_total': []
-        }
+        # Historial de simulación (todas las variables en SI), almacenado como
+        # arrays NumPy preasignados: uno por variable (una columna por rueda)
+        self._buffers_historial = {}
+        self.num_registros = 0
+        self.iniciar_historial(0)
         
         # Tiempo de simulación
         self.tiempo_actual = 0.0
@@ -133,10 +129,10 @@ class RobotMovilBase(ABC):
         g = 9.81
         
         # Componente lateral de gravedad
-        F_lateral = self.masa * g * abs(np.sin(self.inclinacion_roll))
+        F_lateral = self.masa * g * abs(math.sin(self.inclinacion_roll))
         
         # Fuerza normal total
-        N_total = self.masa * g * np.cos(self.inclinacion_pitch) * np.cos(self.inclinacion_roll)
+        N_total = self.masa * g * math.cos(self.inclinacion_pitch) * math.cos(self.inclinacion_roll)
         
         # Límite de fricción lateral
         F_friccion_max = self.coef_friccion * N_total
@@ -158,23 +154,62 @@ class RobotMovilBase(ABC):
                       f"   Margen de seguridad: {margen*100:.1f}%")
             return True, mensaje, margen
     
+    def iniciar_historial(self, capacidad: int):
+        """
+        Preasigna el historial para un número conocido de pasos y lo vacía.
+        
+        Args:
+            capacidad: Número de pasos a registrar (se amplía si se supera)
+        """
+        num_ruedas = self.get_numero_ruedas()
+        self._buffers_historial = {clave: np.empty(capacidad)
+                                   for clave in self.CLAVES_HISTORIAL}
+        for clave in self.CLAVES_HISTORIAL_RUEDAS:
+            self._buffers_historial[clave] = np.empty((capacidad, num_ruedas))
+        self.num_registros = 0
+    
+    def _ampliar_historial(self):
+        """Duplica la capacidad del historial conservando los registros."""
+        capacidad = max(64, 2 * len(self._buffers_historial['tiempo']))
+        for clave, buffer in self._buffers_historial.items():
+            nuevo = np.empty((capacidad,) + buffer.shape[1:])
+            nuevo[:self.num_registros] = buffer[:self.num_registros]
+            self._buffers_historial[clave] = nuevo
+    
     def registrar_estado(self, datos_dinamica: Dict):
         """Registra el estado actual en el historial de simulación."""
-        self.historial['tiempo'].append(self.tiempo_actual)
-        self.historial['x'].append(self.x)
-        self.historial['y'].append(self.y)
-        self.historial['z'].append(self.z)
-        self.historial['theta'].append(self.theta)
-        self.historial['v'].append(self.v)
-        self.historial['omega'].append(self.omega)
-        self.historial['a_lineal'].append(self.a_lineal)
-        self.historial['a_angular'].append(self.a_angular)
-        self.historial['velocidades_ruedas'].append(datos_dinamica['velocidades_ruedas'].copy())
-        self.historial['fuerzas_tangenciales'].append(datos_dinamica['fuerzas_tangenciales'].copy())
-        self.historial['fuerzas_normales'].append(datos_dinamica['fuerzas_normales'].copy())
-        self.historial['torques'].append(datos_dinamica['torques'].copy())
-        self.historial['potencias'].append(datos_dinamica['potencias'].copy())
-        self.historial['potencia_total'].append(datos_dinamica['potencia_total'])
+        i = self.num_registros
+        if i == len(self._buffers_historial['tiempo']):
+            self._ampliar_historial()
+        
+        buffers = self._buffers_historial
+        buffers['tiempo'][i] = self.tiempo_actual
+        buffers['x'][i] = self.x
+        buffers['y'][i] = self.y
+        buffers['z'][i] = self.z
+        buffers['theta'][i] = self.theta
+        buffers['v'][i] = self.v
+        buffers['omega'][i] = self.omega
+        buffers['a_lineal'][i] = self.a_lineal
+        buffers['a_angular'][i] = self.a_angular
+        buffers['velocidades_ruedas'][i] = datos_dinamica['velocidades_ruedas']
+        buffers['fuerzas_tangenciales'][i] = datos_dinamica['fuerzas_tangenciales']
+        buffers['fuerzas_normales'][i] = datos_dinamica['fuerzas_normales']
+        buffers['torques'][i] = datos_dinamica['torques']
+        buffers['potencias'][i] = datos_dinamica['potencias']
+        buffers['potencia_total'][i] = datos_dinamica['potencia_total']
+        
+        self.num_registros = i + 1
+    
+    @property
+    def historial(self) -> Dict[str, np.ndarray]:
+        """
+        Historial de la simulación como vistas de los pasos registrados.
+        
+        Las variables por rueda son arrays 2D de forma (pasos, ruedas).
+        """
+        n = self.num_registros
+        return {clave: buffer[:n] for clave, buffer in self._buffers_historial.items()}
     
     def get_historial(self) -> Dict:
         """Obtiene el historial completo de la simulación."""
@@ -207,6 +242,5 @@ class RobotMovilBase(ABC):
         self.inclinacion_roll = 0.0
         
         # Limpiar historial
-        for key in self.historial:
-            self.historial[key] = []
+        self.iniciar_historial(0)
 
@@ -1,15 +1,160 @@
 """
 Visualizador 2D para trayectorias y gráficas vs tiempo.
 Utiliza Matplotlib con backend TkAgg.
+
+Las gráficas se actualizan por blitting: cada figura crea sus líneas una sola
+vez como artistas animados y en cada actualización solo cambia sus datos,
+restaura el fondo estático (ejes, rejilla, etiquetas) guardado en el último
+redibujado completo y vuelve a dibujar las líneas encima. El redibujado
+completo solo ocurre cuando los datos salen de los límites de los ejes (que
+se amplían con holgura) o cuando cambia el tamaño de la ventana.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib.patches as mpatches
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from typing import Dict, List
 
 
+# Etiquetas y colores de las series por rueda según el número de ruedas
+_ETIQUETAS_RUEDAS = {
+    2: ('Izquierda', 'Derecha'),
+    4: ('Adelante Izq.', 'Adelante Der.', 'Atrás Izq.', 'Atrás Der.')
+}
+_COLORES_RUEDAS = ('b', 'r', 'g', 'orange')
+
+# Estilos diferenciados para mejor visualización cuando se superponen
+_ESTILOS_VELOCIDAD_RUEDAS = (
+    {'color': '#1f77b4', 'linestyle': '-', 'linewidth': 2.5, 'alpha': 0.9},   # Azul sólido
+    {'color': '#d62728', 'linestyle': '--', 'linewidth': 2.5, 'alpha': 0.9},  # Rojo discontinuo
+    {'color': '#2ca02c', 'linestyle': '-.', 'linewidth': 2.5, 'alpha': 0.9},  # Verde punto-raya
+    {'color': '#ff7f0e', 'linestyle': ':', 'linewidth': 3.0, 'alpha': 0.9}    # Naranja punteado (más grueso)
+)
+
+# Margen alrededor de los datos (fracción del rango, como el autoscale de Matplotlib)
+MARGEN_LIMITES = 0.05
+
+# Holgura extra en el sentido en que crecen los datos, para no tener que
+# redibujar la figura completa en cada actualización
+HOLGURA_LIMITES = 0.25
+
+# Los límites se reducen si los datos ocupan menos de esta fracción del eje
+FRACCION_MINIMA_LIMITES = 0.5
+
+
+def _diezmar(t: np.ndarray, y: np.ndarray, max_puntos: int):
+    """
+    Reduce una serie temporal a unos max_puntos conservando sus extremos.
+    
+    Divide la serie en max_puntos/2 tramos consecutivos y conserva de cada uno
+    el mínimo y el máximo (además del primer y el último punto), de modo que
+    la línea dibujada a la resolución de la pantalla es la misma que con todos
+    los puntos pero su coste no crece con la duración de la simulación.
+    
+    Args:
+        t: Tiempos (paso uniforme)
+        y: Valores de la serie
+        max_puntos: Número aproximado de puntos a conservar
+    
+    Returns:
+        Tupla (t, y) diezmada
+    """
+    n = len(t)
+    if n <= max_puntos:
+        return t, y
+    
+    tamano = -(-n // (max_puntos // 2))  # Puntos por tramo (redondeo hacia arriba)
+    tramos = -(-n // tamano)
+    
+    # El último tramo se completa repitiendo el último valor
+    matriz = np.pad(y, (0, tramos * tamano - n), mode='edge').reshape(tramos, tamano)
+    inicio_tramos = np.arange(tramos) * tamano
+    
+    indices = np.concatenate(([0],
+                              inicio_tramos + matriz.argmin(axis=1),
+                              inicio_tramos + matriz.argmax(axis=1),
+                              [n - 1]))
+    indices = np.unique(np.minimum(indices, n - 1))
+    
+    return t[indices], y[indices]
+
+
+def _ajustar_limites(ax, x, y, reducir: bool = True) -> bool:
+    """
+    Amplía (o reduce) los límites de los ejes para que contengan los datos.
+    
+    Mientras los datos quepan en los límites actuales no se modifica nada, de
+    modo que la mayoría de actualizaciones pueden hacerse por blitting. Los
+    límites se fijan con set_xbound/set_ybound, que no desactivan el autoscale
+    (en ejes de aspecto igual Matplotlib puede así alargar uno de ellos).
+    
+    Args:
+        ax: Ejes de Matplotlib
+        x: Datos del eje X
+        y: Datos del eje Y (puede ser 2D, una columna por serie)
+        reducir: Si es False, los límites solo se amplían
+    
+    Returns:
+        True si cambió algún límite (requiere redibujado completo)
+    """
+    if len(x) == 0:
+        return False
+    
+    cambiado = False
+    for datos, obtener, establecer in ((x, ax.get_xbound, ax.set_xbound),
+                                       (y, ax.get_ybound, ax.set_ybound)):
+        minimo = float(np.nanmin(datos))
+        maximo = float(np.nanmax(datos))
+        inferior, superior = obtener()
+        
+        excede_inferior = minimo < inferior
+        excede_superior = maximo > superior
+        sobra_espacio = reducir and (maximo - minimo) < FRACCION_MINIMA_LIMITES * (superior - inferior)
+        if not (excede_inferior or excede_superior or sobra_espacio):
+            continue
+        
+        amplitud = maximo - minimo
+        if amplitud == 0.0:
+            # Serie constante: solo un margen proporcional al valor
+            margen = MARGEN_LIMITES * (abs(maximo) or 1.0)
+            nuevos = (minimo - margen, maximo + margen)
+        else:
+            nuevos = (minimo - amplitud * (MARGEN_LIMITES + (HOLGURA_LIMITES if excede_inferior else 0.0)),
+                      maximo + amplitud * (MARGEN_LIMITES + (HOLGURA_LIMITES if excede_superior else 0.0)))
+        if np.allclose(nuevos, (inferior, superior)):
+            continue
+        
+        establecer(nuevos)
+        cambiado = True
+    
+    return cambiado
+
+
+def _igualar_aspecto(ax):
+    """
+    Alarga el rango de uno de los ejes para que la escala de X e Y sea la misma.
+    
+    Con los límites ya proporcionados al tamaño de los ejes, Matplotlib no
+    necesita modificarlos al dibujar una gráfica de aspecto igual.
+    
+    Args:
+        ax: Ejes de Matplotlib con aspecto 'equal'
+    """
+    posicion = ax.get_position(original=True)
+    proporcion = (ax.figure.bbox.height * posicion.height) / (ax.figure.bbox.width * posicion.width)
+    
+    x0, x1 = ax.get_xbound()
+    y0, y1 = ax.get_ybound()
+    
+    if (y1 - y0) < proporcion * (x1 - x0):
+        centro, mitad = (y0 + y1) / 2, proporcion * (x1 - x0) / 2
+        ax.set_ybound(centro - mitad, centro + mitad)
+    else:
+        centro, mitad = (x0 + x1) / 2, (y1 - y0) / proporcion / 2
+        ax.set_xbound(centro - mitad, centro + mitad)
+
+
 class Visualizador2D:
     """
     Gestiona todas las visualizaciones 2D de la simulación.
@@ -19,6 +164,86 @@ class Visualizador2D:
         """Inicializa el visualizador 2D."""
         self.figuras = {}
         self.canvas = {}
+        
+        # Artistas animados de cada figura (se dibujan sobre el fondo guardado)
+        self._artistas = {}
+        
+        # Fondo estático de cada figura, capturado tras cada redibujado completo
+        self._fondos = {}
+        
+        # Límites de cada ejes al crear la figura (se restauran al limpiarla)
+        self._limites_iniciales = {}
+    
+    def _crear_canvas(self, nombre: str, fig: Figure, parent, artistas: List):
+        """
+        Crea el canvas de Tk de una figura y prepara su actualización por blitting.
+        
+        Args:
+            nombre: Clave de la figura
+            fig: Figura de Matplotlib
+            parent: Widget padre de Tkinter
+            artistas: Artistas animados que cambian en cada actualización
+        
+        Returns:
+            Widget de Tk del canvas
+        """
+        for artista in artistas:
+            artista.set_animated(True)
+        self._artistas[nombre] = list(artistas)
+        self._fondos.pop(nombre, None)
+        self._limites_iniciales[nombre] = [(ax, ax.get_xbound(), ax.get_ybound())
+                                           for ax in fig.axes]
+        
+        canvas = FigureCanvasTkAgg(fig, master=parent)
+        # Cada redibujado completo (incluidos los cambios de tamaño) renueva el fondo
+        canvas.mpl_connect('draw_event', lambda event: self._on_draw(nombre))
+        canvas.draw()
+        self.canvas[nombre] = canvas
+        
+        return canvas.get_tk_widget()
+    
+    def _on_draw(self, nombre: str):
+        """Guarda el fondo estático tras un redibujado completo y dibuja los artistas."""
+        fig = self.figuras[nombre]['fig']
+        self._fondos[nombre] = fig.canvas.copy_from_bbox(fig.bbox)
+        self._dibujar_artistas(nombre)
+    
+    def _dibujar_artistas(self, nombre: str):
+        """Dibuja los artistas animados de una figura sobre el fondo actual."""
+        fig = self.figuras[nombre]['fig']
+        for artista in self._artistas[nombre]:
+            fig.draw_artist(artista)
+    
+    def _refrescar(self, nombre: str, limites_cambiados: bool):
+        """
+        Muestra en pantalla los datos actuales de una figura.
+        
+        Si cambiaron los límites de los ejes, la figura se redibuja completa;
+        en otro caso solo se restaura el fondo y se dibujan los artistas.
+        
+        Args:
+            nombre: Clave de la figura
+            limites_cambiados: True si cambió algún límite de los ejes
+        """
+        canvas = self.canvas[nombre]
+        fig = self.figuras[nombre]['fig']
+        
+        if limites_cambiados or nombre not in self._fondos:
+            # Las figuras con dos gráficas reajustan márgenes (cambian los ticks)
+            if len(fig.axes) > 1:
+                fig.tight_layout()
+            canvas.draw()
+            return
+        
+        canvas.restore_region(self._fondos[nombre])
+        self._dibujar_artistas(nombre)
+        canvas.blit(fig.bbox)
+    
+    @staticmethod
+    def _asignar_serie(linea, t: np.ndarray, y: np.ndarray):
+        """Asigna a una línea la serie diezmada a dos puntos por píxel de sus ejes."""
+        max_puntos = 2 * max(int(linea.axes.bbox.width), 1)
+        linea.set_data(*_diezmar(t, y, max_puntos))
     
     def crear_figura_trayectoria(self, parent, **kwargs):
         """
@@ -26,7 +251,7 @@ class Visualizador2D:
         
         Args:
             parent: Widget padre de Tkinter
-            
+        
         Returns:
             Canvas de matplotlib
         """
@@ -38,13 +263,17 @@ class Visualizador2D:
         ax.grid(True, alpha=0.3)
         ax.axis('equal')
         
-        self.figuras['trayectoria'] = {'fig': fig, 'ax': ax}
+        linea, = ax.plot([], [], 'b-', linewidth=1.5, label='Trayectoria')
+        inicio, = ax.plot([], [], 'go', markersize=10, label='Inicio')
+        final, = ax.plot([], [], 'ro', markersize=10, label='Final')
+        ax.legend()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['trayectoria'] = canvas
+        # Los vectores de velocidad se añaden a medida que crece el historial
+        self.figuras['trayectoria'] = {'fig': fig, 'ax': ax, 'linea': linea,
+                                       'inicio': inicio, 'final': final,
+                                       'flechas': []}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('trayectoria', fig, parent, [linea, inicio, final])
     
     def actualizar_trayectoria(self, historial: Dict, intervalo_vectores: int = 10):
         """
@@ -57,51 +286,65 @@ class Visualizador2D:
         if 'trayectoria' not in self.figuras:
             return
         
-        ax = self.figuras['trayectoria']['ax']
-        ax.clear()
+        datos = self.figuras['trayectoria']
+        ax = datos['ax']
+        
+        x = np.asarray(historial['x'])
+        y = np.asarray(historial['y'])
+        theta = np.asarray(historial['theta'])
+        v = np.asarray(historial['v'])
         
-        x = np.array(historial['x'])
-        y = np.array(historial['y'])
-        theta = np.array(historial['theta'])
-        v = np.array(historial['v'])
+        # Un historial más corto que los vectores ya dibujados es una simulación nueva
+        if len(x) <= (len(datos['flechas']) - 1) * intervalo_vectores:
+            self._quitar_flechas()
+        
+        datos['linea'].set_data(x, y)
         
         if len(x) == 0:
-            ax.set_xlabel('X (m)')
-            ax.set_ylabel('Y (m)')
-            ax.set_title('Trayectoria del Robot')
-            ax.grid(True, alpha=0.3)
-            self.canvas['trayectoria'].draw()
+            datos['inicio'].set_data([], [])
+            datos['final'].set_data([], [])
+            self._refrescar('trayectoria', False)
             return
         
-        # Dibujar trayectoria
-        ax.plot(x, y, 'b-', linewidth=1.5, label='Trayectoria')
-        
-        # Dibujar vectores de velocidad a intervalos regulares
-        indices = range(0, len(x), intervalo_vectores)
+        # Dibujar vectores de velocidad a intervalos regulares (solo los nuevos)
         escala_vector = 0.5  # Factor de escala para visualización
         
-        for i in indices:
-            if i < len(x):
-                # Vector de velocidad centrado en el robot
-                vx = v[i] * np.cos(theta[i]) * escala_vector
-                vy = v[i] * np.sin(theta[i]) * escala_vector
-                
-                ax.arrow(x[i], y[i], vx, vy,
-                        head_width=0.1, head_length=0.05,
-                        fc='red', ec='red', alpha=0.6)
+        for i in range(len(datos['flechas']) * intervalo_vectores, len(x), intervalo_vectores):
+            # Vector de velocidad centrado en el robot
+            vx = v[i] * np.cos(theta[i]) * escala_vector
+            vy = v[i] * np.sin(theta[i]) * escala_vector
+            
+            # add_artist (a diferencia de ax.arrow) no solicita un autoscale
+            # que sustituiría los límites con holgura
+            flecha = mpatches.FancyArrow(x[i], y[i], vx, vy,
+                                         head_width=0.1, head_length=0.05,
+                                         fc='red', ec='red', alpha=0.6, animated=True)
+            ax.add_artist(flecha)
+            datos['flechas'].append(flecha)
+            self._artistas['trayectoria'].append(flecha)
         
         # Marcar posición inicial y final
-        ax.plot(x[0], y[0], 'go', markersize=10, label='Inicio')
-        ax.plot(x[-1], y[-1], 'ro', markersize=10, label='Final')
-        
-        ax.set_xlabel('X (m)')
-        ax.set_ylabel('Y (m)')
-        ax.set_title('Trayectoria del Robot')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        ax.axis('equal')
-        
-        self.canvas['trayectoria'].draw()
+        datos['inicio'].set_data(x[:1], y[:1])
+        datos['final'].set_data(x[-1:], y[-1:])
+        
+        # Con aspecto igual Matplotlib ajusta los límites a partir de dataLim
+        # (p. ej. al cambiar el tamaño de la ventana): mantenerlo al día
+        ax.dataLim.set_points(np.array([[np.nanmin(x), np.nanmin(y)],
+                                        [np.nanmax(x), np.nanmax(y)]]))
+        
+        # Con aspecto igual uno de los ejes se alarga: los límites solo se amplían
+        limites_cambiados = _ajustar_limites(ax, x, y, reducir=False)
+        if limites_cambiados:
+            _igualar_aspecto(ax)
+        self._refrescar('trayectoria', limites_cambiados)
+    
+    def _quitar_flechas(self):
+        """Elimina los vectores de velocidad de la trayectoria."""
+        datos = self.figuras['trayectoria']
+        for flecha in datos['flechas']:
+            flecha.remove()
+            self._artistas['trayectoria'].remove(flecha)
+        datos['flechas'] = []
     
     def crear_figura_velocidad_robot(self, parent, **kwargs):
         """Crea figura para velocidades del robot."""
@@ -119,45 +362,33 @@ class Visualizador2D:
         ax2.set_title('Velocidad Angular del Robot')
         ax2.grid(True, alpha=0.3)
         
-        fig.tight_layout()
+        linea_v, = ax1.plot([], [], color='#1f77b4', linestyle='-', linewidth=2.5, label='v', alpha=0.9)
+        linea_omega, = ax2.plot([], [], color='#d62728', linestyle='-', linewidth=2.5, label='ω', alpha=0.9)
         
-        self.figuras['velocidad_robot'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2}
+        fig.tight_layout()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['velocidad_robot'] = canvas
+        self.figuras['velocidad_robot'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2,
+                                           'linea_v': linea_v, 'linea_omega': linea_omega}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('velocidad_robot', fig, parent, [linea_v, linea_omega])
     
     def actualizar_velocidad_robot(self, historial: Dict):
         """Actualiza gráfica de velocidades del robot."""
         if 'velocidad_robot' not in self.figuras:
             return
         
-        ax1 = self.figuras['velocidad_robot']['ax1']
-        ax2 = self.figuras['velocidad_robot']['ax2']
+        datos = self.figuras['velocidad_robot']
         
-        ax1.clear()
-        ax2.clear()
+        t = np.asarray(historial['tiempo'])
+        v = np.asarray(historial['v'])
+        omega = np.asarray(historial['omega'])
         
-        t = np.array(historial['tiempo'])
-        v = np.array(historial['v'])
-        omega = np.array(historial['omega'])
+        self._asignar_serie(datos['linea_v'], t, v)
+        self._asignar_serie(datos['linea_omega'], t, omega)
         
-        ax1.plot(t, v, color='#1f77b4', linestyle='-', linewidth=2.5, label='v', alpha=0.9)
-        ax1.set_xlabel('Tiempo (s)')
-        ax1.set_ylabel('Velocidad lineal (m/s)')
-        ax1.set_title('Velocidad Lineal del Robot')
-        ax1.grid(True, alpha=0.3)
-        
-        ax2.plot(t, omega, color='#d62728', linestyle='-', linewidth=2.5, label='ω', alpha=0.9)
-        ax2.set_xlabel('Tiempo (s)')
-        ax2.set_ylabel('Velocidad angular (rad/s)')
-        ax2.set_title('Velocidad Angular del Robot')
-        ax2.grid(True, alpha=0.3)
-        
-        self.figuras['velocidad_robot']['fig'].tight_layout()
-        self.canvas['velocidad_robot'].draw()
+        limites_cambiados = _ajustar_limites(datos['ax1'], t, v)
+        limites_cambiados |= _ajustar_limites(datos['ax2'], t, omega)
+        self._refrescar('velocidad_robot', limites_cambiados)
     
     def crear_figura_velocidad_ruedas(self, parent, num_ruedas: int, **kwargs):
         """Crea figura para velocidades angulares de ruedas."""
@@ -168,62 +399,52 @@ class Visualizador2D:
         ax.set_title('Velocidad Angular de Ruedas')
         ax.grid(True, alpha=0.3)
         
-        self.figuras['velocidad_ruedas'] = {'fig': fig, 'ax': ax, 'num_ruedas': num_ruedas}
+        lineas = [ax.plot([], [], label=etiqueta, **estilo)[0]
+                  for etiqueta, estilo in zip(_ETIQUETAS_RUEDAS[num_ruedas],
+                                              _ESTILOS_VELOCIDAD_RUEDAS)]
+        ax.legend()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['velocidad_ruedas'] = canvas
+        self.figuras['velocidad_ruedas'] = {'fig': fig, 'ax': ax, 'num_ruedas': num_ruedas,
+                                            'lineas': lineas}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('velocidad_ruedas', fig, parent, lineas)
     
     def actualizar_velocidad_ruedas(self, historial: Dict):
         """Actualiza gráfica de velocidades de ruedas."""
         if 'velocidad_ruedas' not in self.figuras:
             return
         
-        ax = self.figuras['velocidad_ruedas']['ax']
-        ax.clear()
+        datos = self.figuras['velocidad_ruedas']
         
-        t = np.array(historial['tiempo'])
-        velocidades = historial['velocidades_ruedas']
+        t = np.asarray(historial['tiempo'])
+        velocidades = np.asarray(historial['velocidades_ruedas'])
         
-        if len(velocidades) == 0:
-            ax.set_xlabel('Tiempo (s)')
-            ax.set_ylabel('Velocidad angular (rad/s)')
-            ax.set_title('Velocidad Angular de Ruedas')
-            ax.grid(True, alpha=0.3)
-            self.canvas['velocidad_ruedas'].draw()
-            return
+        limites_cambiados = self._actualizar_series_ruedas(datos['ax'], datos['lineas'],
+                                                           t, velocidades)
+        self._refrescar('velocidad_ruedas', limites_cambiados)
+    
+    def _actualizar_series_ruedas(self, ax, lineas: List, t: np.ndarray, valores: np.ndarray) -> bool:
+        """
+        Asigna a cada línea la serie de su rueda y ajusta los límites de los ejes.
         
-        num_ruedas = len(velocidades[0])
+        Args:
+            ax: Ejes de las líneas
+            lineas: Una línea por rueda
+            t: Tiempos
+            valores: Array (pasos, ruedas)
         
-        # Estilos diferenciados para mejor visualización cuando se superponen
-        if num_ruedas == 2:
-            etiquetas = ['Izquierda', 'Derecha']
-            estilos = [
-                {'color': '#1f77b4', 'linestyle': '-', 'linewidth': 2.5, 'alpha': 0.9},  # Azul sólido
-                {'color': '#d62728', 'linestyle': '--', 'linewidth': 2.5, 'alpha': 0.9}  # Rojo discontinuo
-            ]
-        else:
-            etiquetas = ['Adelante Izq.', 'Adelante Der.', 'Atrás Izq.', 'Atrás Der.']
-            estilos = [
-                {'color': '#1f77b4', 'linestyle': '-', 'linewidth': 2.5, 'alpha': 0.9},   # Azul sólido
-                {'color': '#d62728', 'linestyle': '--', 'linewidth': 2.5, 'alpha': 0.9},  # Rojo discontinuo
-                {'color': '#2ca02c', 'linestyle': '-.', 'linewidth': 2.5, 'alpha': 0.9},  # Verde punto-raya
-                {'color': '#ff7f0e', 'linestyle': ':', 'linewidth': 3.0, 'alpha': 0.9}    # Naranja punteado (más grueso)
-            ]
-        
-        for i in range(num_ruedas):
-            omega_rueda = [v[i] for v in velocidades]
-            ax.plot(t, omega_rueda, label=etiquetas[i], **estilos[i])
+        Returns:
+            True si cambió algún límite de los ejes
+        """
+        if len(valores) == 0:
+            for linea in lineas:
+                linea.set_data([], [])
+            return False
         
-        ax.set_xlabel('Tiempo (s)')
-        ax.set_ylabel('Velocidad angular (rad/s)')
-        ax.set_title('Velocidad Angular de Ruedas')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
+        for i, linea in enumerate(lineas):
+            self._asignar_serie(linea, t, valores[:, i])
         
-        self.canvas['velocidad_ruedas'].draw()
+        return _ajustar_limites(ax, t, valores)
     
     def crear_figura_fuerzas(self, parent, num_ruedas: int, **kwargs):
         """Crea figura para fuerzas tangenciales y normales."""
@@ -241,74 +462,37 @@ class Visualizador2D:
         ax2.set_title('Fuerzas Normales por Rueda')
         ax2.grid(True, alpha=0.3)
         
-        fig.tight_layout()
+        etiquetas = _ETIQUETAS_RUEDAS[num_ruedas]
+        lineas_tang = [ax1.plot([], [], color=color, linewidth=1.5, label=etiqueta)[0]
+                       for etiqueta, color in zip(etiquetas, _COLORES_RUEDAS)]
+        lineas_norm = [ax2.plot([], [], color=color, linewidth=1.5, label=etiqueta)[0]
+                       for etiqueta, color in zip(etiquetas, _COLORES_RUEDAS)]
+        ax1.legend()
+        ax2.legend()
         
-        self.figuras['fuerzas'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2, 'num_ruedas': num_ruedas}
+        fig.tight_layout()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['fuerzas'] = canvas
+        self.figuras['fuerzas'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2, 'num_ruedas': num_ruedas,
+                                   'lineas_tang': lineas_tang, 'lineas_norm': lineas_norm}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('fuerzas', fig, parent, lineas_tang + lineas_norm)
     
     def actualizar_fuerzas(self, historial: Dict):
         """Actualiza gráfica de fuerzas."""
         if 'fuerzas' not in self.figuras:
             return
         
-        ax1 = self.figuras['fuerzas']['ax1']
-        ax2 = self.figuras['fuerzas']['ax2']
-        
-        ax1.clear()
-        ax2.clear()
+        datos = self.figuras['fuerzas']
         
-        t = np.array(historial['tiempo'])
-        f_tang = historial['fuerzas_tangenciales']
-        f_norm = historial['fuerzas_normales']
+        t = np.asarray(historial['tiempo'])
+        f_tang = np.asarray(historial['fuerzas_tangenciales'])
+        f_norm = np.asarray(historial['fuerzas_normales'])
         
-        if len(f_tang) == 0:
-            ax1.set_xlabel('Tiempo (s)')
-            ax1.set_ylabel('Fuerza tangencial (N)')
-            ax1.set_title('Fuerzas Tangenciales por Rueda')
-            ax1.grid(True, alpha=0.3)
-            
-            ax2.set_xlabel('Tiempo (s)')
-            ax2.set_ylabel('Fuerza normal (N)')
-            ax2.set_title('Fuerzas Normales por Rueda')
-            ax2.grid(True, alpha=0.3)
-            
-            self.figuras['fuerzas']['fig'].tight_layout()
-            self.canvas['fuerzas'].draw()
-            return
-        
-        num_ruedas = len(f_tang[0])
-        colores = ['b', 'r', 'g', 'orange']
-        
-        if num_ruedas == 2:
-            etiquetas = ['Izquierda', 'Derecha']
-        else:
-            etiquetas = ['Adelante Izq.', 'Adelante Der.', 'Atrás Izq.', 'Atrás Der.']
-        
-        for i in range(num_ruedas):
-            ft = [f[i] for f in f_tang]
-            fn = [f[i] for f in f_norm]
-            ax1.plot(t, ft, color=colores[i], linewidth=1.5, label=etiquetas[i])
-            ax2.plot(t, fn, color=colores[i], linewidth=1.5, label=etiquetas[i])
-        
-        ax1.set_xlabel('Tiempo (s)')
-        ax1.set_ylabel('Fuerza tangencial (N)')
-        ax1.set_title('Fuerzas Tangenciales por Rueda')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        ax2.set_xlabel('Tiempo (s)')
-        ax2.set_ylabel('Fuerza normal (N)')
-        ax2.set_title('Fuerzas Normales por Rueda')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        
-        self.figuras['fuerzas']['fig'].tight_layout()
-        self.canvas['fuerzas'].draw()
+        limites_cambiados = self._actualizar_series_ruedas(datos['ax1'], datos['lineas_tang'],
+                                                           t, f_tang)
+        limites_cambiados |= self._actualizar_series_ruedas(datos['ax2'], datos['lineas_norm'],
+                                                            t, f_norm)
+        self._refrescar('fuerzas', limites_cambiados)
     
     def crear_figura_aceleraciones(self, parent, **kwargs):
         """Crea figura para aceleraciones."""
@@ -326,45 +510,34 @@ class Visualizador2D:
         ax2.set_title('Aceleración Angular del Robot')
         ax2.grid(True, alpha=0.3)
         
-        fig.tight_layout()
+        linea_lineal, = ax1.plot([], [], 'b-', linewidth=1.5)
+        linea_angular, = ax2.plot([], [], 'r-', linewidth=1.5)
         
-        self.figuras['aceleraciones'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2}
+        fig.tight_layout()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['aceleraciones'] = canvas
+        self.figuras['aceleraciones'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2,
+                                         'linea_lineal': linea_lineal,
+                                         'linea_angular': linea_angular}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('aceleraciones', fig, parent, [linea_lineal, linea_angular])
     
     def actualizar_aceleraciones(self, historial: Dict):
         """Actualiza gráfica de aceleraciones."""
         if 'aceleraciones' not in self.figuras:
             return
         
-        ax1 = self.figuras['aceleraciones']['ax1']
-        ax2 = self.figuras['aceleraciones']['ax2']
+        datos = self.figuras['aceleraciones']
         
-        ax1.clear()
-        ax2.clear()
-        
-        t = np.array(historial['tiempo'])
-        a_lin = np.array(historial['a_lineal'])
-        a_ang = np.array(historial['a_angular'])
-        
-        ax1.plot(t, a_lin, 'b-', linewidth=1.5)
-        ax1.set_xlabel('Tiempo (s)')
-        ax1.set_ylabel('Aceleración lineal (m/s²)')
-        ax1.set_title('Aceleración Lineal del Robot')
-        ax1.grid(True, alpha=0.3)
+        t = np.asarray(historial['tiempo'])
+        a_lin = np.asarray(historial['a_lineal'])
+        a_ang = np.asarray(historial['a_angular'])
         
-        ax2.plot(t, a_ang, 'r-', linewidth=1.5)
-        ax2.set_xlabel('Tiempo (s)')
-        ax2.set_ylabel('Aceleración angular (rad/s²)')
-        ax2.set_title('Aceleración Angular del Robot')
-        ax2.grid(True, alpha=0.3)
+        self._asignar_serie(datos['linea_lineal'], t, a_lin)
+        self._asignar_serie(datos['linea_angular'], t, a_ang)
         
-        self.figuras['aceleraciones']['fig'].tight_layout()
-        self.canvas['aceleraciones'].draw()
+        limites_cambiados = _ajustar_limites(datos['ax1'], t, a_lin)
+        limites_cambiados |= _ajustar_limites(datos['ax2'], t, a_ang)
+        self._refrescar('aceleraciones', limites_cambiados)
     
     def crear_figura_torque(self, parent, num_ruedas: int, **kwargs):
         """Crea figura para torques."""
@@ -375,52 +548,28 @@ class Visualizador2D:
         ax.set_title('Torque por Rueda')
         ax.grid(True, alpha=0.3)
         
-        self.figuras['torque'] = {'fig': fig, 'ax': ax, 'num_ruedas': num_ruedas}
+        lineas = [ax.plot([], [], color=color, linewidth=1.5, label=etiqueta)[0]
+                  for etiqueta, color in zip(_ETIQUETAS_RUEDAS[num_ruedas], _COLORES_RUEDAS)]
+        ax.legend()
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['torque'] = canvas
+        self.figuras['torque'] = {'fig': fig, 'ax': ax, 'num_ruedas': num_ruedas,
+                                  'lineas': lineas}
         
-        return canvas.get_tk_widget()
+        return self._crear_canvas('torque', fig, parent, lineas)
     
     def actualizar_torque(self, historial: Dict):
         """Actualiza gráfica de torques."""
         if 'torque' not in self.figuras:
             return
         
-        ax = self.figuras['torque']['ax']
-        ax.clear()
-        
-        t = np.array(historial['tiempo'])
-        torques = historial['torques']
-        
-        if len(torques) == 0:
-            ax.set_xlabel('Tiempo (s)')
-            ax.set_ylabel('Torque (N·m)')
-            ax.set_title('Torque por Rueda')
-            ax.grid(True, alpha=0.3)
-            self.canvas['torque'].draw()
-            return
-        
-        num_ruedas = len(torques[0])
-        colores = ['b', 'r', 'g', 'orange']
-        
-        if num_ruedas == 2:
-            etiquetas = ['Izquierda', 'Derecha']
-        else:
-            etiquetas = ['Adelante Izq.', 'Adelante Der.', 'Atrás Izq.', 'Atrás Der.']
-        
-        for i in range(num_ruedas):
-            torque_rueda = [tau[i] for tau in torques]
-            ax.plot(t, torque_rueda, color=colores[i], linewidth=1.5, label=etiquetas[i])
+        datos = self.figuras['torque']
         
-        ax.set_xlabel('Tiempo (s)')
-        ax.set_ylabel('Torque (N·m)')
-        ax.set_title('Torque por Rueda')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
+        t = np.asarray(historial['tiempo'])
+        torques = np.asarray(historial['torques'])
         
-        self.canvas['torque'].draw()
+        limites_cambiados = self._actualizar_series_ruedas(datos['ax'], datos['lineas'],
+                                                           t, torques)
+        self._refrescar('torque', limites_cambiados)
     
     def crear_figura_potencia(self, parent, num_ruedas: int, **kwargs):
         """Crea figura para potencias."""
@@ -438,83 +587,56 @@ class Visualizador2D:
         ax2.set_title('Potencia Total del Robot')
         ax2.grid(True, alpha=0.3)
         
-        fig.tight_layout()
+        lineas = [ax1.plot([], [], color=color, linewidth=1.5, label=etiqueta)[0]
+                  for etiqueta, color in zip(_ETIQUETAS_RUEDAS[num_ruedas], _COLORES_RUEDAS)]
+        ax1.legend()
         
-        self.figuras['potencia'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2, 'num_ruedas': num_ruedas}
+        linea_total, = ax2.plot([], [], 'k-', linewidth=2)
         
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        self.canvas['potencia'] = canvas
+        fig.tight_layout()
         
-        return canvas.get_tk_widget()
+        self.figuras['potencia'] = {'fig': fig, 'ax1': ax1, 'ax2': ax2, 'num_ruedas': num_ruedas,
+                                    'lineas': lineas, 'linea_total': linea_total}
+        
+        return self._crear_canvas('potencia', fig, parent, lineas + [linea_total])
     
     def actualizar_potencia(self, historial: Dict):
         """Actualiza gráfica de potencias."""
         if 'potencia' not in self.figuras:
             return
         
-        ax1 = self.figuras['potencia']['ax1']
-        ax2 = self.figuras['potencia']['ax2']
+        datos = self.figuras['potencia']
         
-        ax1.clear()
-        ax2.clear()
+        t = np.asarray(historial['tiempo'])
+        potencias = np.asarray(historial['potencias'])
+        potencia_total = np.asarray(historial['potencia_total'])
         
-        t = np.array(historial['tiempo'])
-        potencias = historial['potencias']
-        potencia_total = np.array(historial['potencia_total'])
+        limites_cambiados = self._actualizar_series_ruedas(datos['ax1'], datos['lineas'],
+                                                           t, potencias)
         
-        if len(potencias) == 0:
-            ax1.set_xlabel('Tiempo (s)')
-            ax1.set_ylabel('Potencia (W)')
-            ax1.set_title('Potencia por Rueda')
-            ax1.grid(True, alpha=0.3)
-            
-            ax2.set_xlabel('Tiempo (s)')
-            ax2.set_ylabel('Potencia total (W)')
-            ax2.set_title('Potencia Total del Robot')
-            ax2.grid(True, alpha=0.3)
-            
-            self.figuras['potencia']['fig'].tight_layout()
-            self.canvas['potencia'].draw()
-            return
-        
-        num_ruedas = len(potencias[0])
-        colores = ['b', 'r', 'g', 'orange']
-        
-        if num_ruedas == 2:
-            etiquetas = ['Izquierda', 'Derecha']
-        else:
-            etiquetas = ['Adelante Izq.', 'Adelante Der.', 'Atrás Izq.', 'Atrás Der.']
+        self._asignar_serie(datos['linea_total'], t, potencia_total)
+        limites_cambiados |= _ajustar_limites(datos['ax2'], t, potencia_total)
         
-        for i in range(num_ruedas):
-            pot_rueda = [p[i] for p in potencias]
-            ax1.plot(t, pot_rueda, color=colores[i], linewidth=1.5, label=etiquetas[i])
-        
-        ax1.set_xlabel('Tiempo (s)')
-        ax1.set_ylabel('Potencia (W)')
-        ax1.set_title('Potencia por Rueda')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        ax2.plot(t, potencia_total, 'k-', linewidth=2)
-        ax2.set_xlabel('Tiempo (s)')
-        ax2.set_ylabel('Potencia total (W)')
-        ax2.set_title('Potencia Total del Robot')
-        ax2.grid(True, alpha=0.3)
-        
-        self.figuras['potencia']['fig'].tight_layout()
-        self.canvas['potencia'].draw()
+        self._refrescar('potencia', limites_cambiados)
     
     def limpiar_todas(self):
-        """Limpia todas las figuras."""
-        for nombre, datos in self.figuras.items():
-            if 'ax' in datos:
-                datos['ax'].clear()
-            if 'ax1' in datos:
-                datos['ax1'].clear()
-            if 'ax2' in datos:
-                datos['ax2'].clear()
+        """
+        Limpia todas las figuras para reutilizarlas en una nueva simulación.
+        
+        Vacía las líneas y restaura los límites iniciales de los ejes,
+        conservando ejes, leyendas y canvas.
+        """
+        if 'trayectoria' in self.figuras:
+            self._quitar_flechas()
+        
+        for nombre, artistas in self._artistas.items():
+            for artista in artistas:
+                artista.set_data([], [])
+            
+            for ax, limites_x, limites_y in self._limites_iniciales[nombre]:
+                ax.relim()
+                ax.set_xbound(limites_x)
+                ax.set_ybound(limites_y)
             
             if nombre in self.canvas:
                 self.canvas[nombre].draw()
-
@@ -64,9 +64,10 @@ class Visualizador3D:
         
         self.ax.clear()
         
-        x = np.array(historial['x'])
-        y = np.array(historial['y'])
-        z = np.array(historial.get('z', np.zeros_like(x)))  # Usar Z del historial
+        # Vistas del historial (sin copia)
+        x = np.asarray(historial['x'])
+        y = np.asarray(historial['y'])
+        z = np.asarray(historial['z']) if 'z' in historial else np.zeros_like(x)  # Usar Z del historial
         
         if len(x) == 0:
             self.ax.set_xlabel('X (m)')
@@ -79,9 +80,8 @@ class Visualizador3D:
         # Crear superficie del terreno basada en la trayectoria real
         # Para visualizar el terreno, usamos un enfoque simplificado:
         # mostramos la altura Z correspondiente al tiempo de simulación
-        x_min, x_max = min(x) - 2, max(x) + 2
-        y_min, y_max = min(y) - 2, max(y) + 2
-        z_min, z_max = min(z) if len(z) > 0 else 0, max(z) if len(z) > 0 else 0
+        x_min, x_max = x.min() - 2, x.max() + 2
+        y_min, y_max = y.min() - 2, y.max() + 2
         
         x_terreno = np.linspace(x_min, x_max, 30)
         y_terreno = np.linspace(y_min, y_max, 30)
@@ -0,0 +1,127 @@
+"""
+Tests unitarios para el renderizado de ecuaciones.
+
+Este módulo contiene tests para verificar:
+- Importación del módulo sin cargar matplotlib
+- Renderizado de ecuaciones LaTeX a PNG
+- Caché en memoria y en disco de las ecuaciones renderizadas
+- Resolución de renderizado según la densidad de la pantalla
+- Imágenes precalculadas de todas las ecuaciones
+"""
+
+import sys
+import os
+import subprocess
+import pytest
+from pathlib import Path
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui import ecuaciones
+from utils.generar_ecuaciones import recopilar_ecuaciones
+
+
+FIRMA_PNG = b'\x89PNG\r\n\x1a\n'
+
+
+class TestImportacion:
+    """Tests para la carga diferida de matplotlib."""
+    
+    def test_sin_matplotlib_al_importar(self):
+        """Verifica que importar el módulo de ecuaciones no cargue matplotlib."""
+        codigo = (
+            "import importlib.util, sys\n"
+            f"spec = importlib.util.spec_from_file_location('ecuaciones', {ecuaciones.__file__!r})\n"
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+            "print(sorted(m for m in sys.modules if m.startswith('matplotlib')))\n"
+        )
+        resultado = subprocess.run([sys.executable, '-c', codigo],
+                                   capture_output=True, text=True, check=True)
+        
+        assert resultado.stdout.strip() == "[]"
+
+
+class TestRenderizadoLatex:
+    """Tests para el renderizado memoizado de ecuaciones."""
+    
+    def setup_method(self):
+        """Configuración previa a cada test."""
+        ecuaciones._renderizar_latex_png.cache_clear()
+    
+    def test_renderiza_png(self, tmp_path, monkeypatch):
+        """Verifica que la ecuación se renderice como PNG y se guarde en disco."""
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_ECUACIONES_PRECALCULADAS', str(tmp_path / 'vacio'))
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_CACHE_ECUACIONES', str(tmp_path))
+        
+        datos = ecuaciones._renderizar_latex_png(r"v = \frac{v_L + v_R}{2}")
+        
+        assert datos.startswith(FIRMA_PNG)
+        assert len(os.listdir(tmp_path)) == 1
+    
+    def test_ecuacion_repetida(self, tmp_path, monkeypatch):
+        """Verifica que una ecuación repetida reutilice el resultado en memoria."""
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_ECUACIONES_PRECALCULADAS', str(tmp_path / 'vacio'))
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_CACHE_ECUACIONES', str(tmp_path))
+        
+        datos_1 = ecuaciones._renderizar_latex_png(r"\omega \cdot \Delta t")
+        datos_2 = ecuaciones._renderizar_latex_png(r"\omega \cdot \Delta t")
+        
+        assert datos_1 is datos_2
+        assert ecuaciones._renderizar_latex_png.cache_info().hits == 1
+    
+    def test_lectura_desde_disco(self, tmp_path, monkeypatch):
+        """Verifica que una ecuación ya guardada en disco se lea sin renderizar."""
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_ECUACIONES_PRECALCULADAS', str(tmp_path / 'vacio'))
+        monkeypatch.setattr(ecuaciones, 'DIRECTORIO_CACHE_ECUACIONES', str(tmp_path))
+        
+        datos = ecuaciones._renderizar_latex_png(r"F = m a")
+        ecuaciones._renderizar_latex_png.cache_clear()
+        
+        def _fallar(*args, **kwargs):
+            raise AssertionError("No debería renderizarse de nuevo")
+        monkeypatch.setattr(ecuaciones, '_rasterizar_latex', _fallar)
+        
+        assert ecuaciones._renderizar_latex_png(r"F = m a") == datos
+
+
+class TestResolucion:
+    """Tests para la resolución de renderizado según la pantalla."""
+    
+    def test_pantalla_estandar(self):
+        """Verifica que a 96 dpi se usen las imágenes precalculadas (100 dpi)."""
+        assert ecuaciones._dpi_ecuaciones(96 / 72) == 100
+        assert ecuaciones._dpi_ecuaciones(1.0) == 100
+    
+    def test_pantalla_hidpi(self):
+        """Verifica que en pantallas HiDPI aumente la resolución."""
+        assert ecuaciones._dpi_ecuaciones(2 * 96 / 72) == 200
+        assert ecuaciones._dpi_ecuaciones(1.5 * 96 / 72) == 150
+
+
+class TestEcuacionesPrecalculadas:
+    """Tests para las imágenes generadas con utils/generar_ecuaciones.py."""
+    
+    def test_recopilar_ecuaciones(self):
+        """Verifica que se recopilen las ecuaciones de todas las pestañas."""
+        ecuaciones_latex = recopilar_ecuaciones()
+        
+        assert len(ecuaciones_latex) >= 20
+        assert r"v_L = v - \frac{\omega L}{2}, \quad v_R = v + \frac{\omega L}{2}" in ecuaciones_latex
+    
+    def test_imagenes_actualizadas(self):
+        """Verifica que exista la imagen precalculada de cada ecuación."""
+        faltantes = [
+            ecuacion_latex for ecuacion_latex in recopilar_ecuaciones()
+            if not os.path.isfile(os.path.join(
+                ecuaciones.DIRECTORIO_ECUACIONES_PRECALCULADAS,
+                ecuaciones._nombre_archivo_ecuacion(ecuacion_latex)))
+        ]
+        
+        assert faltantes == [], "Ejecutar: python -m utils.generar_ecuaciones"
+
+
+# Función para ejecutar tests
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(exit_code)
@@ -36,15 +36,6 @@ def verificar_importaciones():
         print("  Instalar con: pip install matplotlib")
         return False
     
-    # SciPy
-    try:
-        import scipy
-        print(f"[OK] scipy {scipy.__version__}")
-    except ImportError as e:
-        print(f"[ERROR] scipy no disponible: {e}")
-        print("  Instalar con: pip install scipy")
-        return False
-    
     print("-" * 50)
     
     # Módulos del proyecto
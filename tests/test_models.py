@@ -342,6 +342,25 @@ class TestRobotMovilBase:
         
         # Debe estar vacío inicialmente
         assert len(robot.historial['tiempo']) == 0
+    
+    def test_historial_preasignado(self):
+        """Verifica el registro en arrays preasignados y su ampliación."""
+        robot = CuatroRuedasCentrado(
+            masa=20.0, coef_friccion=0.6, largo=0.6, ancho=0.4,
+            radio_rueda=0.1, distancia_ancho=0.5, distancia_largo=0.7
+        )
+        robot.iniciar_historial(10)
+        
+        # Registrar más pasos que la capacidad inicial
+        for _ in range(25):
+            robot.actualizar_cinematica(1.0, 0.2, 0.05)
+            robot.registrar_estado(robot.calcular_dinamica())
+        
+        historial = robot.get_historial()
+        assert len(historial['tiempo']) == 25
+        assert historial['torques'].shape == (25, 4)
+        assert abs(historial['tiempo'][-1] - robot.tiempo_actual) < 1e-12
+        assert historial['x'][-1] == robot.x
 
 
 class TestIntegracionCinematicaDinamica:
@@ -0,0 +1,177 @@
+"""
+Tests unitarios para el motor de simulación.
+
+Este módulo contiene tests para verificar:
+- Generación de perfiles de movimiento (Modo A y Modo B)
+- Aplicación del perfil de terreno
+- Agrupación de actualizaciones de la visualización
+"""
+
+import sys
+import pytest
+import numpy as np
+from pathlib import Path
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import DiferencialCentrado
+from src.gui.simulacion import MotorSimulacion
+
+
+def crear_robot():
+    """Crea un robot diferencial centrado de prueba."""
+    return DiferencialCentrado(
+        masa=10.0,
+        coef_friccion=0.5,
+        largo=0.5,
+        ancho=0.3,
+        radio_rueda=0.08,
+        distancia_ruedas=0.4,
+        distancia_rueda_loca=0.2
+    )
+
+
+class TestPerfilesMovimiento:
+    """Tests para la generación de perfiles de movimiento."""
+    
+    def test_perfil_rampa(self):
+        """Verifica el perfil Rampa-Constante-Rampa."""
+        parametros = {
+            'modo_movimiento': 'A',
+            'velocidad_lineal_objetivo': 2.0,
+            'velocidad_angular_objetivo': 0.5,
+            'tiempo_aceleracion': 1.0,
+            'tiempo_constante': 2.0,
+            'tiempo_desaceleracion': 1.0
+        }
+        motor = MotorSimulacion(crear_robot(), parametros)
+        
+        velocidades, omegas = motor._generar_perfil_rampa()
+        
+        # 20 pasos de aceleración + 40 constantes + 20 de desaceleración
+        assert len(velocidades) == 80
+        assert len(omegas) == 80
+        
+        # Rampa de subida desde 0 con incrementos de v_obj / n_acel
+        assert velocidades[0] == 0.0
+        assert abs(velocidades[10] - 1.0) < 1e-12
+        
+        # Tramo constante
+        assert np.all(velocidades[20:60] == 2.0)
+        assert np.all(omegas[20:60] == 0.5)
+        
+        # Rampa de bajada
+        assert velocidades[60] == 2.0
+        assert abs(velocidades[-1] - 2.0 / 20) < 1e-12
+    
+    def test_perfil_fijo(self):
+        """Verifica el perfil de velocidades fijas."""
+        parametros = {
+            'modo_movimiento': 'B',
+            'velocidad_lineal_fija': 1.5,
+            'velocidad_angular_fija': -0.2,
+            'duracion': 3.0
+        }
+        motor = MotorSimulacion(crear_robot(), parametros)
+        
+        velocidades, omegas = motor._generar_perfil_fijo()
+        
+        assert len(velocidades) == 60
+        assert np.all(velocidades == 1.5)
+        assert np.all(omegas == -0.2)
+    
+    def test_perfil_memoizado(self):
+        """Verifica que parámetros idénticos reutilicen el mismo perfil."""
+        parametros = {'velocidad_lineal_fija': 0.7, 'duracion': 2.0}
+        motor_1 = MotorSimulacion(crear_robot(), parametros)
+        motor_2 = MotorSimulacion(crear_robot(), dict(parametros))
+        
+        velocidades_1, _ = motor_1._generar_perfil_fijo()
+        velocidades_2, _ = motor_2._generar_perfil_fijo()
+        
+        assert velocidades_1 is velocidades_2
+        
+        # Los arrays compartidos no deben poder modificarse
+        with pytest.raises(ValueError):
+            velocidades_1[0] = 0.0
+
+
+class TestPerfilTerreno:
+    """Tests para el perfil de terreno plano -> inclinado -> plano."""
+    
+    def setup_method(self):
+        """Configuración previa a cada test."""
+        self.motor = MotorSimulacion(crear_robot(), {})
+    
+    def test_terreno_plano(self):
+        """Verifica que el terreno plano no tenga inclinación."""
+        pitchs, rolls = self.motor._generar_perfil_terreno(1, 0.2, 0.1, 100)
+        
+        assert len(pitchs) == 100
+        assert np.all(pitchs == 0.0)
+        assert np.all(rolls == 0.0)
+    
+    def test_inclinacion_simple(self):
+        """Verifica que la inclinación simple solo aplique pitch en la región central."""
+        pitchs, rolls = self.motor._generar_perfil_terreno(2, 0.2, 0.1, 100)
+        
+        assert np.all(pitchs[:20] == 0.0)
+        assert np.all(pitchs[20:80] == 0.2)
+        assert np.all(pitchs[80:] == 0.0)
+        assert np.all(rolls == 0.0)
+    
+    def test_inclinacion_compuesta(self):
+        """Verifica que la inclinación compuesta aplique pitch y roll."""
+        pitchs, rolls = self.motor._generar_perfil_terreno(3, 0.2, 0.1, 100)
+        
+        assert np.all(pitchs[20:80] == 0.2)
+        assert np.all(rolls[20:80] == 0.1)
+        assert np.all(rolls[:20] == 0.0)
+        assert np.all(rolls[80:] == 0.0)
+
+
+class RaizFalsa:
+    """Sustituto mínimo de la ventana raíz que encola las llamadas after_idle."""
+    
+    def __init__(self):
+        self.pendientes = []
+    
+    def after_idle(self, funcion):
+        self.pendientes.append(funcion)
+    
+    def procesar(self):
+        pendientes, self.pendientes = self.pendientes, []
+        for funcion in pendientes:
+            funcion()
+
+
+class TestActualizacion:
+    """Tests para el envío de actualizaciones al hilo de la GUI."""
+    
+    def test_actualizaciones_agrupadas(self):
+        """Verifica que solo exista una actualización pendiente a la vez."""
+        llamadas = []
+        raiz = RaizFalsa()
+        motor = MotorSimulacion(crear_robot(), {},
+                                callback_actualizacion=lambda: llamadas.append(1),
+                                root=raiz)
+        
+        for _ in range(5):
+            motor._solicitar_actualizacion()
+        
+        assert len(raiz.pendientes) == 1
+        assert llamadas == []
+        
+        raiz.procesar()
+        assert llamadas == [1]
+        
+        # Tras ejecutarse, una nueva solicitud vuelve a encolarse
+        motor._solicitar_actualizacion()
+        assert len(raiz.pendientes) == 1
+
+
+# Función para ejecutar tests
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(exit_code)
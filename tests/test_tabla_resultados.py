@@ -0,0 +1,92 @@
+"""
+Tests unitarios para los cálculos de la tabla de resultados.
+
+Este módulo contiene tests para verificar:
+- Cálculo vectorizado de la moda por columna
+- Integración de la energía con la regla del trapecio
+- Precisión de la matriz de estadísticas al formato mostrado
+"""
+
+import sys
+import pytest
+import numpy as np
+from pathlib import Path
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui.tabla_resultados import TablaResultados
+
+
+class TestModa:
+    """Tests para el cálculo de la moda."""
+    
+    def test_columna_constante(self):
+        """Verifica que una columna constante tenga como moda su valor."""
+        matriz = np.full((50, 1), 2.5)
+        
+        modas = TablaResultados._calcular_modas(matriz)
+        
+        assert modas[0] == 2.5
+    
+    def test_meseta(self):
+        """Verifica que la moda de un perfil rampa-meseta sea la meseta."""
+        perfil = np.concatenate([np.linspace(0.0, 2.0, 20, endpoint=False),
+                                 np.full(40, 2.0),
+                                 np.linspace(2.0, 0.0, 20, endpoint=False)])
+        matriz = np.column_stack([perfil, -perfil])
+        
+        modas = TablaResultados._calcular_modas(matriz)
+        
+        assert abs(modas[0] - 2.0) < 1e-12
+        assert abs(modas[1] + 2.0) < 1e-12
+
+
+class TestEnergia:
+    """Tests para la integración de la potencia."""
+    
+    def test_paso_uniforme(self):
+        """Verifica la integración con paso de tiempo constante."""
+        tiempo = np.arange(1, 101) * 0.05
+        potencia = 3.0 * np.sin(tiempo)
+        
+        energia = TablaResultados._integrar_trapecio(potencia, tiempo)
+        esperado = np.sum(0.5 * (np.abs(potencia[1:]) + np.abs(potencia[:-1])) * np.diff(tiempo))
+        
+        assert abs(energia - esperado) < 1e-9
+    
+    def test_paso_no_uniforme(self):
+        """Verifica la integración con paso de tiempo variable."""
+        tiempo = np.array([0.0, 0.1, 0.3, 0.6])
+        potencia = np.array([1.0, -2.0, 2.0, 4.0])
+        
+        energia = TablaResultados._integrar_trapecio(potencia, tiempo)
+        
+        # 0.1*1.5 + 0.2*2.0 + 0.3*3.0
+        assert abs(energia - 1.45) < 1e-12
+
+
+
+class TestMatrizEstadisticas:
+    """Tests para la matriz reutilizable de estadísticas."""
+    
+    def test_precision_formato(self):
+        """Verifica que los valores conserven los 6 decimales que muestra la tabla."""
+        tabla = TablaResultados.__new__(TablaResultados)
+        tabla._matriz_base = None
+        tabla._matriz_pasos = 0
+        tabla._buffer_matriz = np.empty((0, 0))
+        
+        tiempo = np.arange(1, 101) * 0.05
+        columnas = [np.full(100, 49.05), np.linspace(0.0, 117.72, 100)]
+        
+        matriz = tabla._actualizar_matriz(tiempo, columnas)
+        
+        assert TablaResultados.FORMATO_ESTADISTICA % matriz[:, 0].min() == "49.050000"
+        assert TablaResultados.FORMATO_ESTADISTICA % matriz[:, 1].max() == "117.720000"
+
+
+# Función para ejecutar tests
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(exit_code)
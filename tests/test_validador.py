@@ -0,0 +1,157 @@
+"""
+Tests unitarios para la validación de parámetros.
+
+Este módulo contiene tests para verificar:
+- Aceptación de parámetros válidos para cada tipo de robot
+- Orden de las reglas y mensajes de error con los valores formateados
+- Reglas condicionadas al modo de movimiento y al tipo de terreno
+- Caché de los resultados de validación
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui import validador
+from src.gui.validador import ValidadorParametros
+
+
+def crear_parametros(**cambios):
+    """Crea un diccionario de parámetros válidos para cualquier tipo de robot."""
+    parametros = {
+        'masa': 10.0,
+        'coef_friccion': 0.5,
+        'largo': 0.5,
+        'ancho': 0.3,
+        'radio_rueda': 0.08,
+        'distancia_ruedas': 0.4,
+        'distancia_rueda_loca': 0.2,
+        'distancia_ancho': 0.3,
+        'distancia_largo': 0.4,
+        'A': 0.05,
+        'B': 0.02,
+        'C': 0.1,
+        'modo_movimiento': 'A',
+        'tiempo_aceleracion': 2.0,
+        'tiempo_constante': 5.0,
+        'tiempo_desaceleracion': 2.0,
+        'duracion': 5.0,
+        'tipo_terreno': 1,
+        'angulo_pitch': 10.0,
+        'angulo_roll': 5.0,
+    }
+    parametros.update(cambios)
+    return parametros
+
+
+class TestValidador:
+    """Tests para las reglas de validación."""
+    
+    @pytest.mark.parametrize('tipo', [
+        'diferencial_centrado', 'diferencial_descentrado',
+        'cuatro_ruedas_centrado', 'cuatro_ruedas_descentrado'])
+    def test_parametros_validos(self, tipo):
+        """Verifica que los parámetros de referencia sean válidos."""
+        assert ValidadorParametros.validar(tipo, crear_parametros()) == (True, None)
+    
+    def test_primera_regla_fallida(self):
+        """Verifica que se informe solo del primer error encontrado."""
+        parametros = crear_parametros(masa=0, largo=-1)
+        
+        es_valido, mensaje = ValidadorParametros.validar('diferencial_centrado', parametros)
+        
+        assert not es_valido
+        assert mensaje.startswith("ERROR: La masa")
+    
+    def test_parametro_ausente(self):
+        """Verifica que un parámetro obligatorio ausente se rechace."""
+        parametros = crear_parametros()
+        del parametros['radio_rueda']
+        
+        es_valido, mensaje = ValidadorParametros.validar('cuatro_ruedas_centrado', parametros)
+        
+        assert not es_valido
+        assert "radio de rueda" in mensaje
+    
+    def test_mensaje_con_valores(self):
+        """Verifica que el mensaje incluya los valores y los derivados formateados."""
+        parametros = crear_parametros(radio_rueda=0.25)
+        
+        es_valido, mensaje = ValidadorParametros.validar('diferencial_centrado', parametros)
+        
+        assert not es_valido
+        assert "(0.250 m)" in mensaje
+        assert "(0.200 m)" in mensaje
+    
+    def test_centro_masa_solo_descentrado(self):
+        """Verifica que el centro de masa solo se valide en robots descentrados."""
+        parametros = crear_parametros(A=1.0)
+        
+        assert ValidadorParametros.validar('cuatro_ruedas_centrado', parametros)[0]
+        
+        es_valido, mensaje = ValidadorParametros.validar('cuatro_ruedas_descentrado', parametros)
+        assert not es_valido
+        assert "Reduzca |A| a menos de 0.250 m" in mensaje
+    
+    def test_reglas_por_modo(self):
+        """Verifica que los tiempos y la duración se validen según el modo."""
+        parametros = crear_parametros(tiempo_aceleracion=-1.0, duracion=0)
+        
+        assert not ValidadorParametros.validar('diferencial_centrado', parametros)[0]
+        
+        parametros['modo_movimiento'] = 'B'
+        es_valido, mensaje = ValidadorParametros.validar('diferencial_centrado', parametros)
+        assert not es_valido
+        assert "duración" in mensaje
+    
+    def test_reglas_por_terreno(self):
+        """Verifica que el ángulo roll solo se valide en inclinación compuesta."""
+        parametros = crear_parametros(tipo_terreno=2, angulo_roll=120.0)
+        
+        assert ValidadorParametros.validar('diferencial_centrado', parametros)[0]
+        
+        parametros['tipo_terreno'] = 3
+        es_valido, mensaje = ValidadorParametros.validar('diferencial_centrado', parametros)
+        assert not es_valido
+        assert "roll (120.0°)" in mensaje
+
+
+
+class TestCacheValidacion:
+    """Tests para la memoización de la validación."""
+    
+    def setup_method(self):
+        """Configuración previa a cada test."""
+        validador._validar_hashable.cache_clear()
+    
+    def test_parametros_repetidos(self):
+        """Verifica que validar de nuevo los mismos parámetros use la caché."""
+        resultado_1 = ValidadorParametros.validar('diferencial_centrado', crear_parametros(masa=0))
+        resultado_2 = ValidadorParametros.validar('diferencial_centrado', crear_parametros(masa=0))
+        
+        assert resultado_1 is resultado_2
+        assert validador._validar_hashable.cache_info().hits == 1
+    
+    def test_parametros_modificados(self):
+        """Verifica que un cambio de parámetro o de tipo de robot no use la caché."""
+        ValidadorParametros.validar('diferencial_centrado', crear_parametros())
+        ValidadorParametros.validar('diferencial_centrado', crear_parametros(masa=12.0))
+        ValidadorParametros.validar('cuatro_ruedas_centrado', crear_parametros())
+        
+        assert validador._validar_hashable.cache_info().hits == 0
+    
+    def test_valores_no_hashables(self):
+        """Verifica que los valores no hashables se validen sin caché."""
+        parametros = crear_parametros(extra=[1, 2, 3])
+        
+        assert ValidadorParametros.validar('diferencial_centrado', parametros) == (True, None)
+        assert validador._validar_hashable.cache_info().currsize == 0
+
+
+# Función para ejecutar tests
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(exit_code)
@@ -0,0 +1,164 @@
+"""
+Tests unitarios para las utilidades de las gráficas 2D.
+
+Este módulo contiene tests para verificar:
+- Ajuste de los límites de los ejes con holgura para el blitting
+- Diezmado de las series a la resolución de la pantalla
+- Limpieza de las figuras para reutilizarlas entre simulaciones
+"""
+
+import sys
+import pytest
+import numpy as np
+from pathlib import Path
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.visualization import plot_2d
+
+
+class CanvasSinVentana(FigureCanvasAgg):
+    """Sustituto de FigureCanvasTkAgg que dibuja sin crear ninguna ventana."""
+    
+    def __init__(self, figure, master=None):
+        super().__init__(figure)
+    
+    def blit(self, bbox=None):
+        pass
+    
+    def get_tk_widget(self):
+        return None
+
+
+class TestLimites:
+    """Tests para el ajuste de los límites de los ejes."""
+    
+    def setup_method(self):
+        """Configuración previa a cada test."""
+        self.ax = Figure().add_subplot(111)
+        self.ax.set_xlim(0.0, 10.0)
+        self.ax.set_ylim(-1.0, 1.0)
+    
+    def test_datos_dentro(self):
+        """Verifica que no se cambien los límites si los datos caben en ellos."""
+        t = np.linspace(0.0, 8.0, 50)
+        
+        assert not plot_2d._ajustar_limites(self.ax, t, 0.9 * np.sin(t))
+        assert self.ax.get_xlim() == (0.0, 10.0)
+    
+    def test_datos_fuera(self):
+        """Verifica que los límites se amplíen con holgura si los datos salen."""
+        t = np.linspace(0.0, 12.0, 50)
+        
+        assert plot_2d._ajustar_limites(self.ax, t, np.sin(t))
+        
+        x0, x1 = self.ax.get_xlim()
+        assert x0 < 0.0
+        assert x1 > 12.0 * (1 + plot_2d.HOLGURA_LIMITES)
+        
+        # Con la holgura, un poco más de datos ya no cambia los límites
+        t = np.linspace(0.0, 13.0, 50)
+        assert not plot_2d._ajustar_limites(self.ax, t, np.sin(t))
+    
+    def test_datos_constantes(self):
+        """Verifica que una serie constante no provoque ajustes en cada llamada."""
+        t = np.linspace(0.0, 8.0, 50)
+        y = np.full(50, 49.05)
+        
+        assert plot_2d._ajustar_limites(self.ax, t, y)
+        assert not plot_2d._ajustar_limites(self.ax, t, y)
+        
+        y0, y1 = self.ax.get_ylim()
+        assert y0 < 49.05 < y1
+    
+    def test_sin_datos(self):
+        """Verifica que un historial vacío no cambie los límites."""
+        assert not plot_2d._ajustar_limites(self.ax, np.empty(0), np.empty(0))
+
+
+
+class TestDiezmado:
+    """Tests para el diezmado de series temporales."""
+    
+    def test_serie_corta(self):
+        """Verifica que una serie con pocos puntos no se modifique."""
+        t = np.arange(100) * 0.05
+        y = np.sin(t)
+        
+        t_d, y_d = plot_2d._diezmar(t, y, 400)
+        
+        assert t_d is t
+        assert y_d is y
+    
+    def test_numero_puntos(self):
+        """Verifica que la serie diezmada no supere el número de puntos pedido."""
+        t = np.arange(100000) * 0.05
+        y = np.sin(t)
+        
+        t_d, y_d = plot_2d._diezmar(t, y, 2000)
+        
+        assert len(t_d) <= 2000 + 2
+        assert len(t_d) == len(y_d)
+        assert np.all(np.diff(t_d) > 0)
+    
+    def test_conserva_extremos(self):
+        """Verifica que se conserven picos aislados, el primer y el último punto."""
+        t = np.arange(10007) * 0.05
+        y = np.zeros(len(t))
+        y[1234] = 5.0
+        y[8765] = -3.0
+        
+        t_d, y_d = plot_2d._diezmar(t, y, 200)
+        
+        assert y_d.max() == 5.0
+        assert y_d.min() == -3.0
+        assert t_d[0] == t[0]
+        assert t_d[-1] == t[-1]
+
+
+
+class TestLimpiarFiguras:
+    """Tests para la reutilización de las figuras entre simulaciones."""
+    
+    def setup_method(self):
+        """Configuración previa a cada test."""
+        self.t = np.linspace(0.0, 30.0, 300)
+        self.historial = {
+            'tiempo': self.t,
+            'x': 5.0 * np.cos(0.2 * self.t),
+            'y': 5.0 * np.sin(0.2 * self.t),
+            'theta': 0.2 * self.t + np.pi / 2,
+            'v': np.full(300, 1.0),
+            'omega': np.full(300, 0.2),
+        }
+    
+    def test_restaura_figuras(self, monkeypatch):
+        """Verifica que limpiar vacíe las líneas, quite los vectores y restaure los límites."""
+        monkeypatch.setattr(plot_2d, 'FigureCanvasTkAgg', CanvasSinVentana)
+        viz = plot_2d.Visualizador2D()
+        viz.crear_figura_trayectoria(None)
+        viz.crear_figura_velocidad_robot(None)
+        
+        limites_iniciales = [(ax.get_xlim(), ax.get_ylim())
+                             for datos in viz.figuras.values() for ax in datos['fig'].axes]
+        
+        viz.actualizar_trayectoria(self.historial)
+        viz.actualizar_velocidad_robot(self.historial)
+        assert len(viz.figuras['trayectoria']['flechas']) > 0
+        
+        viz.limpiar_todas()
+        
+        limites = [(ax.get_xlim(), ax.get_ylim())
+                   for datos in viz.figuras.values() for ax in datos['fig'].axes]
+        assert limites == limites_iniciales
+        assert viz.figuras['trayectoria']['flechas'] == []
+        assert len(viz.figuras['velocidad_robot']['linea_v'].get_xdata()) == 0
+
+
+# Función para ejecutar tests
+if __name__ == "__main__":
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(exit_code)
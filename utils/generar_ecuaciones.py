@@ -0,0 +1,85 @@
+"""
+Generador de las imágenes precalculadas de las ecuaciones.
+
+Renderiza con mathtext todas las ecuaciones del visualizador y las guarda
+como PNG en src/gui/assets/ecuaciones/, de modo que la aplicación las cargue
+directamente sin renderizarlas en cada ejecución.
+
+Debe ejecutarse de nuevo cada vez que se modifique una ecuación:
+
+    python -m utils.generar_ecuaciones
+"""
+
+import os
+import sys
+import types
+from pathlib import Path
+
+# Añadir el directorio raíz al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gui import ecuaciones
+
+
+class _WidgetInerte:
+    """Sustituto de los widgets de ttk que no crea ninguna ventana."""
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def pack(self, *args, **kwargs):
+        pass
+
+
+def recopilar_ecuaciones():
+    """
+    Recopila, sin crear la interfaz, las ecuaciones LaTeX de todas las pestañas.
+    
+    Returns:
+        Lista de ecuaciones LaTeX sin repetir, en orden de aparición
+    """
+    ecuaciones_latex = []
+    
+    def _registrar(parent, titulo, ecuacion_latex, *args):
+        ecuaciones_latex.append(ecuacion_latex)
+    
+    grabador = types.SimpleNamespace(_crear_seccion_ecuacion=_registrar)
+    
+    ttk_original = ecuaciones.ttk
+    ecuaciones.ttk = types.SimpleNamespace(Frame=_WidgetInerte, Label=_WidgetInerte)
+    try:
+        for nombre in dir(ecuaciones.VisualizadorEcuaciones):
+            if nombre.startswith('_agregar_ecuaciones_'):
+                getattr(ecuaciones.VisualizadorEcuaciones, nombre)(grabador, None)
+    finally:
+        ecuaciones.ttk = ttk_original
+    
+    return list(dict.fromkeys(ecuaciones_latex))
+
+
+def generar_ecuaciones(directorio=None):
+    """
+    Renderiza todas las ecuaciones y elimina las imágenes que ya no se usan.
+    
+    Args:
+        directorio: Directorio de destino (por defecto, el de la aplicación)
+    """
+    directorio = directorio or ecuaciones.DIRECTORIO_ECUACIONES_PRECALCULADAS
+    os.makedirs(directorio, exist_ok=True)
+    
+    nombres = set()
+    for ecuacion_latex in recopilar_ecuaciones():
+        nombre = ecuaciones._nombre_archivo_ecuacion(ecuacion_latex)
+        nombres.add(nombre)
+        with open(os.path.join(directorio, nombre), 'wb') as archivo:
+            archivo.write(ecuaciones._rasterizar_latex(ecuacion_latex))
+    
+    for nombre in os.listdir(directorio):
+        if nombre.endswith('.png') and nombre not in nombres:
+            os.remove(os.path.join(directorio, nombre))
+    
+    print(f"{len(nombres)} ecuaciones generadas en {directorio}")
+
+
+if __name__ == "__main__":
+    generar_ecuaciones()